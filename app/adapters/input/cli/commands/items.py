@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
-import json
+import sys
 
 import typer
 
 from template.app.facade import AppFacade
+from template.infrastructure.serialization import dumps, iter_json_array, iter_ndjson
 
 
 app = typer.Typer(help="Manage items.")
+PERCENTILE_OPTION = typer.Option(
+    None,
+    "--percentile",
+    "-p",
+    help="Percentile to report; repeat for several. Defaults to 50, 90 and 99.",
+)
 
 
 def _facade_from_ctx(ctx: typer.Context) -> AppFacade:
@@ -19,12 +25,7 @@ def _facade_from_ctx(ctx: typer.Context) -> AppFacade:
 
 
 def _to_json(payload: object) -> str:
-    if isinstance(payload, list):
-        return json.dumps(
-            [asdict(item) if is_dataclass(item) else item for item in payload],
-            ensure_ascii=True,
-        )
-    return json.dumps(asdict(payload) if is_dataclass(payload) else payload, ensure_ascii=True)
+    return dumps(payload).decode()
 
 
 @app.command("create")
@@ -55,9 +56,34 @@ def list_items(
         hidden=True,
         help="Print the injected application state type.",
     ),
+    ndjson: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Print one JSON object per line instead of a JSON array.",
+    ),
 ) -> None:
     """List all items."""
     if debug_state:
         print(type(ctx.obj).__name__)
         return
-    print(_to_json(_facade_from_ctx(ctx).list_items()))
+    items = _facade_from_ctx(ctx).iter_items()
+    chunks = iter_ndjson(items) if ndjson else iter_json_array(items)
+    for chunk in chunks:
+        sys.stdout.write(chunk.decode())
+    if not ndjson:
+        sys.stdout.write("\n")
+
+
+@app.command("stats")
+def item_stats(
+    ctx: typer.Context,
+    percentiles: list[float] = PERCENTILE_OPTION,
+    bins: int = typer.Option(10, "--bins", help="Number of histogram bins."),
+    group_prefix: int = typer.Option(
+        None,
+        "--group-prefix",
+        help="Also report per group of items sharing this many leading name characters.",
+    ),
+) -> None:
+    """Summarize item values."""
+    print(_to_json(_facade_from_ctx(ctx).item_stats(percentiles or None, bins, group_prefix)))
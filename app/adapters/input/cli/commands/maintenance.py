@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+from template.app.facade import AppFacade
+from template.infrastructure.storage import convert_items_file
+
+app = typer.Typer(help="Storage maintenance commands.")
+
+
+@app.command("compact")
+def compact(ctx: typer.Context) -> None:
+    """Rewrite append-based storage so it keeps only the latest record per item."""
+    facade = ctx.obj
+    if not isinstance(facade, AppFacade):
+        raise typer.BadParameter("CLI application state is not initialized.")
+    report = facade.compact_storage()
+    if report is None:
+        print("The configured repository does not need compaction.")
+        return
+    print(json.dumps({**asdict(report), "saved_bytes": report.saved_bytes}, ensure_ascii=True))
+
+
+@app.command("convert")
+def convert(
+    source: Path,
+    target: Path,
+    source_format: str = typer.Option("json", "--from", help="json, ndjson or binary."),
+    target_format: str = typer.Option("binary", "--to", help="json, ndjson or binary."),
+    compression: str = typer.Option(
+        "none", "--compression", help="Block compression for binary targets: none, zlib or lzma."
+    ),
+) -> None:
+    """Copy every item from one items file into a new file of another format."""
+    try:
+        count = convert_items_file(source, target, source_format, target_format, compression)
+    except (ValueError, OSError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    print(json.dumps({"items": count, "bytes": target.stat().st_size}, ensure_ascii=True))
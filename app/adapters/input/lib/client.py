@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+
 from template.core.application.dtos.dto import ItemResponseDTO
 from template.infrastructure.config.settings import Settings
 from template.infrastructure.startup import bootstrap
@@ -12,9 +14,15 @@ class LibraryAdapter:
     def create_item(self, name: str, value: float) -> ItemResponseDTO:
         return self._facade.create_item(name, value)
 
+    def create_items(self, items: Iterable[tuple[str, float]]) -> list[ItemResponseDTO]:
+        return self._facade.create_items(items)
+
     def get_item(self, item_id: str) -> ItemResponseDTO:
         return self._facade.get_item(item_id)
 
+    def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]:
+        return self._facade.get_items(item_ids)
+
     def list_items(self) -> list[ItemResponseDTO]:
         return self._facade.list_items()
 
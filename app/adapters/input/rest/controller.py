@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import inspect
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import TypeVar
 
 try:
-    from fastapi import APIRouter, HTTPException
+    from fastapi import APIRouter, HTTPException, Request, Response
+    from fastapi.responses import StreamingResponse
 except ImportError:  # pragma: no cover - optional dependency
     class HTTPException(Exception):
         def __init__(self, status_code: int, detail: str) -> None:
@@ -18,30 +21,189 @@ except ImportError:  # pragma: no cover - optional dependency
         def add_api_route(self, path: str, endpoint: object, methods: list[str]) -> None:
             self.routes.append((path, ",".join(methods), endpoint))
 
+    class Response:
+        def __init__(
+            self,
+            content: bytes = b"",
+            status_code: int = 200,
+            headers: dict[str, str] | None = None,
+            media_type: str | None = None,
+        ) -> None:
+            self.body = content
+            self.status_code = status_code
+            self.headers = dict(headers or {})
+            self.media_type = media_type
+
+    class StreamingResponse:
+        def __init__(self, content: Iterator[bytes], media_type: str) -> None:
+            self.body_iterator = content
+            self.media_type = media_type
+
+
+from template.app.adapters.input.rest.ingest import BatchIngest
+from template.app.facade import AppFacade, AsyncAppFacade
+from template.core.domain.exceptions.exception import (
+    InvalidCursorError,
+    InvalidQueryError,
+    ItemNotFoundError,
+    ItemValidationError,
+)
+from template.infrastructure.executor import BoundedExecutor
+from template.infrastructure.serialization import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    aiter_ndjson,
+    dumps,
+    iter_ndjson,
+)
+
+T = TypeVar("T")
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+LIST_PARAMETERS_ERROR = (
+    "Query parameter 'limit' must be an integer and 'min_value'/'max_value' must be numbers."
+)
+PERCENTILES_ERROR = "Query parameter 'percentiles' must be a comma-separated list of numbers."
+DEFAULT_EXECUTOR_WORKERS = 8
 
-from template.app.facade import AppFacade
-from template.core.domain.exceptions.exception import ItemNotFoundError, ItemValidationError
+
+def parse_percentiles(value: str | None) -> list[float] | None:
+    if value is None:
+        return None
+    return [float(percentile) for percentile in value.split(",") if percentile]
+
+
+def json_response(payload: object, headers: dict[str, str] | None = None) -> Response:
+    """Pre-encoded JSON body, so FastAPI skips ``jsonable_encoder`` and its own dump."""
+    return Response(content=dumps(payload), headers=headers, media_type=JSON_MEDIA_TYPE)
 
 
 class RestController:
-    def __init__(self, facade: AppFacade, router: APIRouter | None = None) -> None:
+    """FastAPI item routes as ``async def`` endpoints.
+
+    A facade whose methods are coroutine functions is awaited directly. A sync facade
+    runs on ``executor`` rather than on Starlette's shared threadpool, so slow
+    repository calls queue up there, with a bound, and ``GET /executor:stats`` shows how
+    deep that queue is.
+    """
+
+    def __init__(
+        self,
+        facade: AppFacade | AsyncAppFacade,
+        router: APIRouter | None = None,
+        executor: BoundedExecutor | None = None,
+    ) -> None:
         self.facade = facade
         self.router = router or APIRouter()
+        self.executor = executor or BoundedExecutor(
+            DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="template-web"
+        )
         self.router.add_api_route("/items", self.list_items, methods=["GET"])
+        self.router.add_api_route("/items:stats", self.item_stats, methods=["GET"])
         self.router.add_api_route("/items/{item_id}", self.get_item, methods=["GET"])
         self.router.add_api_route("/items", self.create_item, methods=["POST"])
+        self.router.add_api_route("/items:batch", self.create_items, methods=["POST"])
+        self.router.add_api_route("/executor:stats", self.executor_stats, methods=["GET"])
 
-    def list_items(self) -> list[dict[str, object]]:
-        return [asdict(item) for item in self.facade.list_items()]
+    async def _call(self, fn: Callable[..., T], *args: object) -> T:
+        if inspect.iscoroutinefunction(fn):
+            return await fn(*args)
+        return await self.executor.run(fn, *args)
 
-    def get_item(self, item_id: str) -> dict[str, object]:
+    async def _stream(self, chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+        while (chunk := await self.executor.run(next, chunks, None)) is not None:
+            yield chunk
+
+    async def list_items(
+        self,
+        ids: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        format: str | None = None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+        min_value: float | None = None,
+        max_value: float | None = None,
+        sort: str | None = None,
+    ) -> object:
+        if format == "ndjson":
+            if inspect.isasyncgenfunction(self.facade.iter_items):
+                chunks = aiter_ndjson(self.facade.iter_items())
+            else:
+                chunks = self._stream(iter_ndjson(await self._call(self.facade.iter_items)))
+            return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
+        if ids is not None:
+            try:
+                items = await self._call(
+                    self.facade.get_items, [item_id for item_id in ids.split(",") if item_id]
+                )
+            except ItemNotFoundError as exc:
+                raise HTTPException(status_code=404, detail=str(exc)) from exc
+            return json_response(items)
+        try:
+            page = await self._call(
+                self.facade.query_items,
+                name,
+                name_prefix,
+                min_value,
+                max_value,
+                sort,
+                limit,
+                cursor,
+            )
+        except (InvalidCursorError, InvalidQueryError) as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        headers = None
+        if page.next_cursor is not None:
+            headers = {NEXT_CURSOR_HEADER: page.next_cursor}
+        return json_response(page.items, headers)
+
+    async def item_stats(
+        self,
+        percentiles: str | None = None,
+        bins: int | None = None,
+        group_prefix: int | None = None,
+    ) -> Response:
+        try:
+            parsed = parse_percentiles(percentiles)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=PERCENTILES_ERROR) from exc
         try:
-            return asdict(self.facade.get_item(item_id))
+            return json_response(
+                await self._call(self.facade.item_stats, parsed, bins, group_prefix)
+            )
+        except InvalidQueryError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def get_item(self, item_id: str) -> Response:
+        try:
+            return json_response(await self._call(self.facade.get_item, item_id))
         except ItemNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
 
-    def create_item(self, payload: dict[str, object]) -> dict[str, object]:
+    async def create_item(self, payload: dict[str, object]) -> Response:
         try:
-            return asdict(self.facade.create_item(str(payload["name"]), float(payload["value"])))
+            return json_response(
+                await self._call(
+                    self.facade.create_item, str(payload["name"]), float(payload["value"])
+                )
+            )
+        except KeyError as exc:
+            raise HTTPException(status_code=400, detail=f"Missing field: {exc.args[0]}") from exc
+        except (TypeError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail="Field 'value' must be a number.") from exc
         except ItemValidationError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def create_items(self, request: Request) -> Response:
+        """Ingest a JSON array or NDJSON body chunk by chunk while it is still arriving."""
+        ingest = BatchIngest()
+        async for data in request.stream():
+            for chunk in ingest.feed(data):
+                ingest.record(chunk, await self._call(self.facade.ingest_items, chunk.items))
+        for chunk in ingest.close():
+            ingest.record(chunk, await self._call(self.facade.ingest_items, chunk.items))
+        status, body, media_type = ingest.response()
+        return Response(content=body, status_code=status, media_type=media_type)
+
+    async def executor_stats(self) -> Response:
+        return json_response(self.executor.stats())
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, urlsplit
+
+from template.app.adapters.input.rest.controller import (
+    LIST_PARAMETERS_ERROR,
+    NEXT_CURSOR_HEADER,
+    PERCENTILES_ERROR,
+    parse_percentiles,
+)
+from template.app.adapters.input.rest.ingest import BatchIngest, IngestChunk, ingest_body
+from template.app.facade import AppFacade
+from template.core.domain.exceptions.exception import (
+    InvalidCursorError,
+    InvalidQueryError,
+    ItemNotFoundError,
+    ItemValidationError,
+)
+from template.infrastructure.serialization import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    dumps,
+    iter_ndjson,
+)
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    status: int
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    media_type: str = JSON_MEDIA_TYPE
+    # Set instead of ``body`` for responses written as they are produced.
+    stream: Iterator[bytes] | None = None
+
+
+class HttpController:
+    """The item routes over raw HTTP requests, for servers without a web framework.
+
+    ``handle`` is synchronous and calls the facade directly, so a server runs it on a
+    worker thread; streamed bodies are produced lazily by the returned iterator. A server
+    that reads bodies incrementally sends requests for which ``streams_body`` is true
+    through ``BatchIngest`` instead, calling ``ingest_chunk`` per chunk and answering
+    with ``ingest_response``.
+    """
+
+    def __init__(self, facade: AppFacade) -> None:
+        self.facade = facade
+
+    def handle(self, method: str, target: str, body: bytes = b"") -> HttpResponse:
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if method == "GET":
+            if url.path == "/items":
+                return self._list_items(query)
+            if url.path == "/items:stats":
+                return self._item_stats(query)
+            if url.path.startswith("/items/"):
+                return self._get_item(url.path.rsplit("/", 1)[-1])
+        elif method == "POST":
+            if url.path == "/items":
+                return self._create_item(body)
+            if url.path == "/items:batch":
+                return self._create_items(body)
+        elif url.path.startswith("/items"):
+            return _error(405, "Method not allowed")
+        return _error(404, "Not found")
+
+    def streams_body(self, method: str, target: str) -> bool:
+        return method == "POST" and urlsplit(target).path == "/items:batch"
+
+    def ingest_chunk(self, ingest: BatchIngest, chunk: IngestChunk) -> None:
+        ingest.record(chunk, self.facade.ingest_items(chunk.items))
+
+    def ingest_response(self, ingest: BatchIngest) -> HttpResponse:
+        status, payload, media_type = ingest.response()
+        return HttpResponse(status, payload, media_type=media_type)
+
+    def _list_items(self, query: dict[str, list[str]]) -> HttpResponse:
+        def first(name: str) -> str | None:
+            return query.get(name, [None])[0]
+
+        if first("format") == "ndjson":
+            return HttpResponse(
+                200, media_type=NDJSON_MEDIA_TYPE, stream=iter_ndjson(self.facade.iter_items())
+            )
+        ids = first("ids")
+        if ids is not None:
+            try:
+                items = self.facade.get_items([item_id for item_id in ids.split(",") if item_id])
+            except ItemNotFoundError as exc:
+                return _error(404, str(exc))
+            return _json(200, items)
+        try:
+            page = self.facade.query_items(
+                first("name"),
+                first("name_prefix"),
+                float(query["min_value"][0]) if "min_value" in query else None,
+                float(query["max_value"][0]) if "max_value" in query else None,
+                first("sort"),
+                int(query["limit"][0]) if "limit" in query else None,
+                first("cursor"),
+            )
+        except ValueError:
+            return _error(400, LIST_PARAMETERS_ERROR)
+        except (InvalidCursorError, InvalidQueryError) as exc:
+            return _error(400, str(exc))
+        headers = {} if page.next_cursor is None else {NEXT_CURSOR_HEADER: page.next_cursor}
+        return _json(200, page.items, headers)
+
+    def _item_stats(self, query: dict[str, list[str]]) -> HttpResponse:
+        try:
+            percentiles = parse_percentiles(query.get("percentiles", [None])[0])
+        except ValueError:
+            return _error(400, PERCENTILES_ERROR)
+        try:
+            stats = self.facade.item_stats(
+                percentiles,
+                int(query["bins"][0]) if "bins" in query else None,
+                int(query["group_prefix"][0]) if "group_prefix" in query else None,
+            )
+        except ValueError:
+            return _error(400, "Query parameters 'bins' and 'group_prefix' must be integers.")
+        except InvalidQueryError as exc:
+            return _error(400, str(exc))
+        return _json(200, stats)
+
+    def _get_item(self, item_id: str) -> HttpResponse:
+        try:
+            return _json(200, self.facade.get_item(item_id))
+        except ItemNotFoundError as exc:
+            return _error(404, str(exc))
+
+    def _create_item(self, body: bytes) -> HttpResponse:
+        try:
+            payload = json.loads(body or b"{}")
+            item = self.facade.create_item(str(payload["name"]), float(payload["value"]))
+        except KeyError as exc:
+            return _error(400, f"Missing field: {exc.args[0]}")
+        except (TypeError, ValueError):
+            return _error(400, "Field 'value' must be a number.")
+        except ItemValidationError as exc:
+            return _error(400, str(exc))
+        return _json(201, item)
+
+    def _create_items(self, body: bytes) -> HttpResponse:
+        return self.ingest_response(ingest_body(self.facade, body))
+
+
+def _json(status: int, payload: object, headers: dict[str, str] | None = None) -> HttpResponse:
+    return HttpResponse(status, dumps(payload), headers or {})
+
+
+def _error(status: int, detail: str) -> HttpResponse:
+    return _json(status, {"detail": detail})
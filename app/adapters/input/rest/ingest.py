@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from template.app.facade import AppFacade
+from template.core.application.dtos.dto import ItemBatchResultDTO
+from template.infrastructure.serialization import (
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    JsonRowParser,
+    MalformedRow,
+    dumps,
+    iter_ndjson,
+)
+
+INGEST_CHUNK_ROWS = 1000
+BODY_SLICE_BYTES = 64 * 1024
+
+
+@dataclass(slots=True)
+class IngestChunk:
+    rows: list[int] = field(default_factory=list)
+    items: list[tuple[str, float]] = field(default_factory=list)
+
+
+class BatchIngest:
+    """Turn a ``POST /items:batch`` body into ingest chunks and collect a result per row.
+
+    The body is parsed as it arrives and its rows are handed out ``chunk_rows`` at a
+    time, one ``facade.ingest_items`` call per chunk, so a bulk load is validated column
+    by column and saved with one repository write per chunk. Rows that are not objects
+    with a string ``name`` and a ``value`` are rejected here and never reach the facade.
+    ``response`` answers in the framing of the request: a created row is the item plus
+    its ``row`` number, a rejected one is ``{"row": ..., "detail": ...}``. The status is
+    201 when every row was created and 207 otherwise.
+    """
+
+    def __init__(self, chunk_rows: int = INGEST_CHUNK_ROWS) -> None:
+        self._parser = JsonRowParser()
+        self._chunk_rows = chunk_rows
+        self._chunk = IngestChunk()
+        self._results: list[dict[str, object] | None] = []
+        self.rejected = 0
+
+    def feed(self, data: bytes) -> list[IngestChunk]:
+        return self._collect(self._parser.feed(data), final=False)
+
+    def close(self) -> list[IngestChunk]:
+        return self._collect(self._parser.close(), final=True)
+
+    def record(self, chunk: IngestChunk, result: ItemBatchResultDTO) -> None:
+        created = iter(result.items)
+        for index, row in enumerate(chunk.rows):
+            detail = result.errors.get(index)
+            if detail is not None:
+                self._reject(row, detail)
+                continue
+            item = next(created)
+            self._results[row] = {"row": row, "id": item.id, "name": item.name, "value": item.value}
+
+    def response(self) -> tuple[int, bytes, str]:
+        status = 207 if self.rejected else 201
+        if self._parser.framing == "ndjson":
+            return status, b"".join(iter_ndjson(self._results)), NDJSON_MEDIA_TYPE
+        return status, dumps(self._results), JSON_MEDIA_TYPE
+
+    def _collect(self, rows: list[object], final: bool) -> list[IngestChunk]:
+        chunks: list[IngestChunk] = []
+        for row in rows:
+            number = len(self._results)
+            self._results.append(None)
+            if isinstance(row, MalformedRow):
+                self._reject(number, row.detail)
+            elif not isinstance(row, dict):
+                self._reject(number, "Row must be a JSON object.")
+            elif "name" not in row or "value" not in row:
+                self._reject(number, f"Missing field: {'name' if 'name' not in row else 'value'}")
+            elif not isinstance(row["name"], str):
+                self._reject(number, "Field 'name' must be a string.")
+            else:
+                self._chunk.rows.append(number)
+                self._chunk.items.append((row["name"], row["value"]))
+                if len(self._chunk.rows) >= self._chunk_rows:
+                    chunks.append(self._chunk)
+                    self._chunk = IngestChunk()
+        if final and self._chunk.rows:
+            chunks.append(self._chunk)
+            self._chunk = IngestChunk()
+        return chunks
+
+    def _reject(self, row: int, detail: str) -> None:
+        self._results[row] = {"row": row, "detail": detail}
+        self.rejected += 1
+
+
+def ingest_body(facade: AppFacade, body: bytes, chunk_rows: int = INGEST_CHUNK_ROWS) -> BatchIngest:
+    """Run ``BatchIngest`` over a body that was read in full, a slice at a time."""
+    ingest = BatchIngest(chunk_rows)
+    for offset in range(0, len(body), BODY_SLICE_BYTES):
+        for chunk in ingest.feed(body[offset : offset + BODY_SLICE_BYTES]):
+            ingest.record(chunk, facade.ingest_items(chunk.items))
+    for chunk in ingest.close():
+        ingest.record(chunk, facade.ingest_items(chunk.items))
+    return ingest
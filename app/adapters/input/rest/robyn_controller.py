@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
-from typing import Any
+from typing import Any, ClassVar
 
 try:
     from robyn import Request, Response, SubRouter
@@ -22,7 +20,9 @@ except ImportError:  # pragma: no cover - optional dependency
             return decorator
 
     class Request:  # type: ignore[no-redef]
-        path_params: dict[str, str] = {}
+        path_params: ClassVar[dict[str, str]] = {}
+        query_params: ClassVar[dict[str, str]] = {}
+        body: str = ""
 
         def json(self) -> dict[str, object]:
             return {}
@@ -32,8 +32,21 @@ except ImportError:  # pragma: no cover - optional dependency
             pass
 
 
+from template.app.adapters.input.rest.controller import (
+    LIST_PARAMETERS_ERROR,
+    NEXT_CURSOR_HEADER,
+    PERCENTILES_ERROR,
+    parse_percentiles,
+)
+from template.app.adapters.input.rest.ingest import ingest_body
 from template.app.facade import AppFacade
-from template.core.domain.exceptions.exception import ItemNotFoundError, ItemValidationError
+from template.core.domain.exceptions.exception import (
+    InvalidCursorError,
+    InvalidQueryError,
+    ItemNotFoundError,
+    ItemValidationError,
+)
+from template.infrastructure.serialization import JSON_MEDIA_TYPE, dumps
 
 
 class RobynController:
@@ -42,8 +55,25 @@ class RobynController:
         self.router = router or SubRouter(__file__, prefix="")
 
         @self.router.get("/items")
-        def list_items_route(request: Request) -> list[dict[str, Any]]:
-            return self._list_items()
+        def list_items_route(request: Request) -> object:
+            return self._list_items(
+                request.query_params.get("ids", None),
+                request.query_params.get("limit", None),
+                request.query_params.get("cursor", None),
+                request.query_params.get("name", None),
+                request.query_params.get("name_prefix", None),
+                request.query_params.get("min_value", None),
+                request.query_params.get("max_value", None),
+                request.query_params.get("sort", None),
+            )
+
+        @self.router.get("/items:stats")
+        def item_stats_route(request: Request) -> object:
+            return self._item_stats(
+                request.query_params.get("percentiles", None),
+                request.query_params.get("bins", None),
+                request.query_params.get("group_prefix", None),
+            )
 
         @self.router.get("/items/:item_id")
         def get_item_route(request: Request) -> object:
@@ -53,43 +83,103 @@ class RobynController:
         def create_item_route(request: Request) -> object:
             return self._create_item(request)
 
-    def _list_items(self) -> list[dict[str, Any]]:
-        return [asdict(item) for item in self.facade.list_items()]
+        @self.router.post("/items:batch")
+        def create_items_route(request: Request) -> object:
+            return self._create_items(request)
+
+    def _list_items(
+        self,
+        ids: str | None = None,
+        limit: str | None = None,
+        cursor: str | None = None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+        min_value: str | None = None,
+        max_value: str | None = None,
+        sort: str | None = None,
+    ) -> object:
+        if ids is not None:
+            try:
+                items = self.facade.get_items([item_id for item_id in ids.split(",") if item_id])
+            except ItemNotFoundError as exc:
+                return _error(404, str(exc))
+            return _json(200, items)
+        try:
+            page = self.facade.query_items(
+                name,
+                name_prefix,
+                float(min_value) if min_value else None,
+                float(max_value) if max_value else None,
+                sort,
+                int(limit) if limit else None,
+                cursor,
+            )
+        except ValueError:
+            return _error(400, LIST_PARAMETERS_ERROR)
+        except (InvalidCursorError, InvalidQueryError) as exc:
+            return _error(400, str(exc))
+        headers: dict[str, str] = {}
+        if page.next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return _json(200, page.items, headers)
+
+    def _item_stats(
+        self,
+        percentiles: str | None = None,
+        bins: str | None = None,
+        group_prefix: str | None = None,
+    ) -> object:
+        try:
+            parsed = parse_percentiles(percentiles)
+        except ValueError:
+            return _error(400, PERCENTILES_ERROR)
+        try:
+            stats = self.facade.item_stats(
+                parsed,
+                int(bins) if bins else None,
+                int(group_prefix) if group_prefix else None,
+            )
+        except ValueError:
+            return _error(400, "Query parameters 'bins' and 'group_prefix' must be integers.")
+        except InvalidQueryError as exc:
+            return _error(400, str(exc))
+        return _json(200, stats)
 
     def _get_item(self, item_id: str) -> object:
         try:
-            return asdict(self.facade.get_item(item_id))
+            return _json(200, self.facade.get_item(item_id))
         except ItemNotFoundError as exc:
-            return Response(
-                status_code=404,
-                headers={"Content-Type": "application/json"},
-                description=json.dumps({"detail": str(exc)}),
-            )
+            return _error(404, str(exc))
 
     def _create_item(self, request: Request) -> object:
         try:
             payload = request.json()
             item = self.facade.create_item(str(payload["name"]), float(payload["value"]))  # type: ignore[arg-type]
-            return Response(
-                status_code=201,
-                headers={"Content-Type": "application/json"},
-                description=json.dumps(asdict(item)),
-            )
+            return _json(201, item)
         except KeyError as exc:
-            return Response(
-                status_code=400,
-                headers={"Content-Type": "application/json"},
-                description=json.dumps({"detail": f"Missing field: {exc.args[0]}"}),
-            )
+            return _error(400, f"Missing field: {exc.args[0]}")
         except ValueError:
-            return Response(
-                status_code=400,
-                headers={"Content-Type": "application/json"},
-                description=json.dumps({"detail": "Field 'value' must be a number."}),
-            )
+            return _error(400, "Field 'value' must be a number.")
         except ItemValidationError as exc:
-            return Response(
-                status_code=400,
-                headers={"Content-Type": "application/json"},
-                description=json.dumps({"detail": str(exc)}),
-            )
+            return _error(400, str(exc))
+
+    def _create_items(self, request: Request) -> object:
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode()
+        status, payload, media_type = ingest_body(self.facade, body).response()
+        return Response(
+            status_code=status, headers={"Content-Type": media_type}, description=payload
+        )
+
+
+def _json(status_code: int, payload: object, headers: dict[str, str] | None = None) -> object:
+    return Response(
+        status_code=status_code,
+        headers={"Content-Type": JSON_MEDIA_TYPE, **(headers or {})},
+        description=dumps(payload),
+    )
+
+
+def _error(status_code: int, detail: str) -> object:
+    return _json(status_code, {"detail": detail})
@@ -0,0 +1 @@
+"""Write-behind repository decorators."""
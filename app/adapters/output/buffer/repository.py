@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import time
+from collections.abc import Callable, Iterator, Sequence
+from threading import Condition, Lock, Thread
+
+from template.core.application.dtos.dto import ItemQuery
+from template.core.application.ports.output.repository_port import ItemRepositoryPort
+from template.core.domain.entities.model import Item
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WriteBehindItemRepository:
+    """Acknowledge saves into memory and persist them to ``backend`` as group commits.
+
+    Buffered items are written with one ``save_many`` call once ``max_items`` are pending,
+    ``max_delay_seconds`` after the oldest pending save, on ``flush()`` and on ``close()``
+    (registered with ``atexit``). ``max_delay_seconds`` is the durability window: a crash
+    loses at most the saves acknowledged within it. Point reads are answered from the
+    buffer; listing, paging, queries and forwarded backend capabilities flush first so
+    they observe every acknowledged save.
+    """
+
+    def __init__(
+        self,
+        backend: ItemRepositoryPort,
+        max_items: int = 1000,
+        max_delay_seconds: float | None = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._max_items = max_items
+        self._clock = clock
+        self._lock = Lock()
+        self._pending_changed = Condition(self._lock)
+        self._flush_lock = Lock()
+        self._pending: dict[str, Item] = {}
+        self._flushing: dict[str, Item] = {}
+        self._first_pending_at = 0.0
+        self._closed = False
+        self._flusher: Thread | None = None
+        if max_delay_seconds is not None:
+            self._flusher = Thread(
+                target=self._run, args=(max_delay_seconds,), name="write-behind-flush", daemon=True
+            )
+            self._flusher.start()
+        atexit.register(self.close)
+
+    def __getattr__(self, name: str) -> object:
+        # Optional backend capabilities (aggregate, ...) read storage directly, so they
+        # only run once everything acknowledged so far has been written.
+        if name == "_backend":
+            raise AttributeError(name)
+        attribute = getattr(self._backend, name)
+        if not callable(attribute):
+            return attribute
+
+        def flushed(*args: object, **kwargs: object) -> object:
+            self.flush()
+            return attribute(*args, **kwargs)
+
+        return flushed
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._flushing)
+
+    def save(self, item: Item) -> Item:
+        self._buffer([item])
+        return item
+
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        self._buffer(items)
+        return list(items)
+
+    def get(self, item_id: str) -> Item | None:
+        with self._lock:
+            item = self._buffered(item_id)
+        return item if item is not None else self._backend.get(item_id)
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        found: dict[str, Item] = {}
+        with self._lock:
+            for item_id in item_ids:
+                item = self._buffered(item_id)
+                if item is not None:
+                    found[item_id] = item
+        # A flush clears ``_flushing`` only after the backend write, so ids missed above
+        # are already visible to the backend.
+        missing = [item_id for item_id in dict.fromkeys(item_ids) if item_id not in found]
+        if missing:
+            found.update((item.id, item) for item in self._backend.get_many(missing))
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    def list(self) -> list[Item]:
+        self.flush()
+        return self._backend.list()
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        self.flush()
+        return self._backend.list_page(limit, cursor)
+
+    def iter_items(self) -> Iterator[Item]:
+        self.flush()
+        return self._backend.iter_items()
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        self.flush()
+        return self._backend.query(query)
+
+    def flush(self) -> None:
+        """Write every pending item to the backend with one ``save_many`` call."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch = self._flushing = self._pending
+                self._pending = {}
+            try:
+                self._backend.save_many(list(batch.values()))
+            except BaseException:
+                # Put the batch back in front of newer saves so the next flush retries it.
+                with self._lock:
+                    batch.update(self._pending)
+                    self._pending, self._flushing = batch, {}
+                    self._first_pending_at = self._clock()
+                raise
+            with self._lock:
+                self._flushing = {}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending_changed.notify_all()
+        atexit.unregister(self.close)
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        close = getattr(self._backend, "close", None)
+        if close is not None:
+            close()
+
+    def _buffer(self, items: Sequence[Item]) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot save to a closed write-behind repository.")
+            if not self._pending:
+                self._first_pending_at = self._clock()
+                self._pending_changed.notify()
+            self._pending.update((item.id, item) for item in items)
+            full = len(self._pending) >= self._max_items
+        if full:
+            self.flush()
+
+    def _buffered(self, item_id: str) -> Item | None:
+        item = self._pending.get(item_id)
+        return item if item is not None else self._flushing.get(item_id)
+
+    def _run(self, max_delay_seconds: float) -> None:
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if not self._pending:
+                        self._pending_changed.wait()
+                        continue
+                    remaining = self._first_pending_at + max_delay_seconds - self._clock()
+                    if remaining <= 0:
+                        break
+                    self._pending_changed.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                LOGGER.exception("Write-behind flush failed; retrying after the next delay.")
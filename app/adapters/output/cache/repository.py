@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from threading import Lock
+
+from template.core.application.dtos.dto import ItemQuery
+from template.core.application.ports.output.repository_port import ItemRepositoryPort
+from template.core.domain.entities.model import Item
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingItemRepository:
+    """Read-through LRU cache in front of any item repository.
+
+    ``get`` and ``get_many`` are served from at most ``max_entries`` cached ids, including
+    ids the backend reported missing. Entries expire after ``ttl_seconds`` when it is set.
+    Saves go to the backend first and then drop the cached ids, and a read that raced
+    with any save is not cached, so the cache never serves a value older than the last
+    save it saw. Listing, paging and queries always go to the backend.
+    """
+
+    def __init__(
+        self,
+        backend: ItemRepositoryPort,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[Item | None, float | None]] = OrderedDict()
+        self._generation = 0
+        self._stats = CacheStats()
+
+    def __getattr__(self, name: str) -> object:
+        # Optional backend capabilities (aggregate, close, ...) pass straight through.
+        if name == "_backend":
+            raise AttributeError(name)
+        return getattr(self._backend, name)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries),
+            )
+
+    def save(self, item: Item) -> Item:
+        saved = self._backend.save(item)
+        self._invalidate([item.id])
+        return saved
+
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        saved = self._backend.save_many(items)
+        self._invalidate([item.id for item in items])
+        return saved
+
+    def get(self, item_id: str) -> Item | None:
+        found, item, generation = self._lookup(item_id)
+        if found:
+            return item
+        item = self._backend.get(item_id)
+        self._fill({item_id: item}, generation)
+        return item
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        cached: dict[str, Item | None] = {}
+        missing: list[str] = []
+        first_generation: int | None = None
+        for item_id in dict.fromkeys(item_ids):
+            found, item, generation = self._lookup(item_id)
+            if first_generation is None:
+                first_generation = generation
+            if found:
+                cached[item_id] = item
+            else:
+                missing.append(item_id)
+        if missing:
+            fetched: dict[str, Item | None] = dict.fromkeys(missing)
+            fetched.update((item.id, item) for item in self._backend.get_many(missing))
+            self._fill(fetched, first_generation)  # type: ignore[arg-type]
+            cached.update(fetched)
+        return [item for item in (cached[item_id] for item_id in item_ids) if item is not None]
+
+    def list(self) -> list[Item]:
+        return self._backend.list()
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        return self._backend.list_page(limit, cursor)
+
+    def iter_items(self) -> Iterator[Item]:
+        return self._backend.iter_items()
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        return self._backend.query(query)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _lookup(self, item_id: str) -> tuple[bool, Item | None, int]:
+        with self._lock:
+            entry = self._entries.get(item_id)
+            if entry is not None:
+                item, expires_at = entry
+                if expires_at is None or self._clock() < expires_at:
+                    self._entries.move_to_end(item_id)
+                    self._stats.hits += 1
+                    return True, item, self._generation
+                del self._entries[item_id]
+            self._stats.misses += 1
+            return False, None, self._generation
+
+    def _fill(self, items: dict[str, Item | None], generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            expires_at = None if self._ttl_seconds is None else self._clock() + self._ttl_seconds
+            for item_id, item in items.items():
+                self._entries[item_id] = (item, expires_at)
+                self._entries.move_to_end(item_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def _invalidate(self, item_ids: Sequence[str]) -> None:
+        with self._lock:
+            self._generation += 1
+            for item_id in item_ids:
+                self._entries.pop(item_id, None)
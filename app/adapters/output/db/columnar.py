@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+from threading import RLock
+from uuid import UUID
+
+from template.core.application.dtos.dto import ItemQuery, ItemStatsDTO, ItemStatsQuery
+from template.core.application.services.aggregation import summarize_columns
+from template.core.application.services.query import select, sort_key
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+from template.core.domain.services.ids import canonical_uuid_bytes
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+_ID_WIDTH = 16
+_EMPTY_SLOT = -1
+_ITER_BATCH = 1024
+_NO_BINARY_ID = bytes(_ID_WIDTH)
+
+
+class ColumnarItemRepository:
+    """In-memory repository that stores items as columns instead of objects.
+
+    Row ``r`` is spread over three flat buffers: 16 id bytes in ``_ids``, a float64 in
+    ``_values`` and an index into the interned name table in ``_name_refs``. Canonical
+    UUID ids are found through an open-addressing hash table of row numbers, and
+    ``Item`` objects are only built when a row is read.
+
+    Measured with ``benchmarks/bench_columnar_memory.py --method rss`` at 10M items
+    cycling through 1,000 names, this costs about 44 bytes per item (16 id + 8 value +
+    4 name ref + ~10 hash slot, plus buffer over-allocation), against about 350 bytes per
+    item for ``InMemoryItemRepository``. Names are assumed to repeat: every distinct name
+    adds its string and a lookup entry, about 130 bytes, so 10M items with unique names
+    cost about 174 bytes per item.
+    Ids that are not canonical UUID strings fall back to a regular dict.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._ids = bytearray()
+        self._values = array("d")
+        self._name_refs = array("I")
+        self._names: list[str] = []
+        self._name_lookup: dict[str, int] = {}
+        self._slots = array("i", [_EMPTY_SLOT]) * 16
+        self._text_ids: dict[str, int] = {}
+        self._row_text_ids: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def save(self, item: Item) -> Item:
+        with self._lock:
+            self._store(item)
+        return item
+
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        with self._lock:
+            for item in items:
+                self._store(item)
+        return list(items)
+
+    def get(self, item_id: str) -> Item | None:
+        with self._lock:
+            row = self._row_of(item_id)
+            return None if row < 0 else self._item_at(row)
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        with self._lock:
+            rows = [self._row_of(item_id) for item_id in item_ids]
+            return [self._item_at(row) for row in rows if row >= 0]
+
+    def list(self) -> list[Item]:
+        return list(self.iter_items())
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        with self._lock:
+            start = 0
+            if cursor is not None:
+                row = self._row_of(cursor)
+                if row < 0:
+                    raise InvalidCursorError(cursor)
+                start = row + 1
+            stop = min(start + limit, len(self._values))
+            return [self._item_at(row) for row in range(start, stop)]
+
+    def iter_items(self) -> Iterator[Item]:
+        # Rows are append-only, so a stream walks row numbers in slices.
+        start = 0
+        while True:
+            with self._lock:
+                stop = min(start + _ITER_BATCH, len(self._values))
+                batch = [self._item_at(row) for row in range(start, stop)]
+            if not batch:
+                return
+            start = stop
+            yield from batch
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        with self._lock:
+            after = -1
+            if query.cursor is not None:
+                after = self._row_of(query.cursor)
+                if after < 0:
+                    raise InvalidCursorError(query.cursor)
+            if np is None or not self._values:
+                rows = ((row, self._item_at(row)) for row in range(len(self._values)))
+                after_key = None if after < 0 else sort_key(query, self._item_at(after), after)
+                return select(query, rows, after_key)
+            return [self._item_at(row) for row in self._select_rows(query, after)]
+
+    def _select_rows(self, query: ItemQuery, after: int) -> list[int]:
+        # Filters are vectorized masks over the columns; name predicates are evaluated
+        # once per interned name rather than once per row.
+        values = np.frombuffer(self._values, dtype=np.float64)
+        name_refs = np.frombuffer(self._name_refs, dtype=np.uint32)
+        mask = np.ones(len(values), dtype=bool)
+        if query.name is not None or query.name_prefix is not None:
+            allowed = np.zeros(len(self._names), dtype=bool)
+            for name_ref, name in enumerate(self._names):
+                allowed[name_ref] = (query.name is None or name == query.name) and (
+                    query.name_prefix is None or name.startswith(query.name_prefix)
+                )
+            mask &= allowed[name_refs]
+        if query.min_value is not None:
+            mask &= values >= query.min_value
+        if query.max_value is not None:
+            mask &= values <= query.max_value
+
+        keys = None
+        if query.sort == "value":
+            keys = values
+        elif query.sort == "name":
+            name_ranks = np.empty(len(self._names), dtype=np.intp)
+            name_ranks[sorted(range(len(self._names)), key=self._names.__getitem__)] = np.arange(
+                len(self._names)
+            )
+            keys = name_ranks[name_refs]
+        if after >= 0:
+            rows = np.arange(len(values))
+            if keys is None:
+                mask &= rows < after if query.descending else rows > after
+            elif query.descending:
+                mask &= (keys < keys[after]) | ((keys == keys[after]) & (rows < after))
+            else:
+                mask &= (keys > keys[after]) | ((keys == keys[after]) & (rows > after))
+
+        rows = np.flatnonzero(mask)
+        if keys is not None:
+            rows = rows[np.lexsort((rows, keys[rows]))]
+        if query.descending:
+            rows = rows[::-1]
+        return rows[: query.limit].tolist()
+
+    def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        # Copy the columns so appends are not blocked by buffer exports while NumPy reads.
+        with self._lock:
+            values = self._values[:]
+            name_refs = self._name_refs[:]
+            names = list(self._names)
+        return summarize_columns(values, name_refs, names, query)
+
+    def _store(self, item: Item) -> None:
+        name_ref = self._name_lookup.get(item.name)
+        if name_ref is None:
+            name_ref = len(self._names)
+            self._names.append(item.name)
+            self._name_lookup[item.name] = name_ref
+        row = self._row_of(item.id)
+        if row >= 0:
+            self._values[row] = float(item.value)
+            self._name_refs[row] = name_ref
+            return
+
+        row = len(self._values)
+        binary_id = canonical_uuid_bytes(item.id)
+        self._values.append(float(item.value))
+        self._name_refs.append(name_ref)
+        if binary_id is None:
+            self._ids += _NO_BINARY_ID
+            self._text_ids[item.id] = row
+            self._row_text_ids[row] = item.id
+            return
+        self._ids += binary_id
+        if (len(self._values) - len(self._text_ids)) * 2 > len(self._slots):
+            self._grow()
+        else:
+            self._slots[self._probe(binary_id)[0]] = row
+
+    def _row_of(self, item_id: str) -> int:
+        binary_id = canonical_uuid_bytes(item_id)
+        if binary_id is None:
+            return self._text_ids.get(item_id, -1)
+        return self._probe(binary_id)[1]
+
+    def _probe(self, binary_id: bytes) -> tuple[int, int]:
+        slots, ids = self._slots, self._ids
+        mask = len(slots) - 1
+        slot = hash(binary_id) & mask
+        while True:
+            row = slots[slot]
+            if row == _EMPTY_SLOT:
+                return slot, -1
+            start = row * _ID_WIDTH
+            if ids[start : start + _ID_WIDTH] == binary_id:
+                return slot, row
+            slot = (slot + 1) & mask
+
+    def _grow(self) -> None:
+        self._slots = array("i", [_EMPTY_SLOT]) * (len(self._slots) * 2)
+        mask = len(self._slots) - 1
+        ids = self._ids
+        for row in range(len(self._values)):
+            if row in self._row_text_ids:
+                continue
+            slot = hash(bytes(ids[row * _ID_WIDTH : (row + 1) * _ID_WIDTH])) & mask
+            while self._slots[slot] != _EMPTY_SLOT:
+                slot = (slot + 1) & mask
+            self._slots[slot] = row
+
+    def _item_at(self, row: int) -> Item:
+        item_id = self._row_text_ids.get(row)
+        if item_id is None:
+            item_id = str(UUID(bytes=bytes(self._ids[row * _ID_WIDTH : (row + 1) * _ID_WIDTH])))
+        return Item(
+            name=self._names[self._name_refs[row]],
+            value=self._values[row],
+            id=item_id,
+        )
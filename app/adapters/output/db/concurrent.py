@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from threading import Lock
+
+from template.core.application.dtos.dto import ItemQuery
+from template.core.application.services.query import SortKey, select, sort_key
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+
+_ITER_BATCH = 1024
+
+
+class _Stripe:
+    __slots__ = ("items", "lock", "version")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.items: dict[str, Item] = {}
+        self.version = 0
+
+
+class StripedItemRepository:
+    """Thread-safe in-memory repository with lock striping and read snapshots.
+
+    Ids are spread over ``stripes`` dicts, each with its own lock, so saves of different
+    ids rarely wait for each other; only the first save of an id briefly takes the lock
+    that appends it to the insertion order. Point reads take no lock at all.
+
+    ``list`` and ``query`` read an immutable snapshot of the rows in insertion order.
+    Writers never copy anything; they bump their stripe's version, and the next scan
+    that finds the versions changed builds a fresh snapshot while writers keep going.
+    """
+
+    def __init__(self, stripes: int = 16) -> None:
+        if stripes < 1:
+            raise ValueError("A striped repository needs at least one stripe.")
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._order: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._order_lock = Lock()
+        self._snapshot: tuple[tuple[int, ...], list[Item]] | None = None
+
+    def save(self, item: Item) -> Item:
+        self._store(item)
+        return item
+
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        for item in items:
+            self._store(item)
+        return list(items)
+
+    def get(self, item_id: str) -> Item | None:
+        return self._stripe(item_id).items.get(item_id)
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        found = (self.get(item_id) for item_id in item_ids)
+        return [item for item in found if item is not None]
+
+    def list(self) -> list[Item]:
+        return list(self._rows())
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        start = 0
+        if cursor is not None:
+            position = self._positions.get(cursor)
+            if position is None:
+                raise InvalidCursorError(cursor)
+            start = position + 1
+        return [self._item(item_id) for item_id in self._order[start : start + limit]]
+
+    def iter_items(self) -> Iterator[Item]:
+        # The order list is append-only, so slices of it stay valid while saves continue.
+        position = 0
+        while position < len(self._order):
+            batch = self._order[position : position + _ITER_BATCH]
+            position += len(batch)
+            for item_id in batch:
+                yield self._item(item_id)
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        rows = self._rows()
+        after: SortKey | None = None
+        if query.cursor is not None:
+            position = self._positions.get(query.cursor)
+            if position is None:
+                raise InvalidCursorError(query.cursor)
+            if position >= len(rows):
+                # The cursor's first save is still finishing; read past the snapshot.
+                rows = self._rows(cached=False)
+            after = sort_key(query, rows[position], position)
+        return select(query, enumerate(rows), after)
+
+    def _store(self, item: Item) -> None:
+        stripe = self._stripe(item.id)
+        with stripe.lock:
+            new = item.id not in stripe.items
+            # The item is stored before its id enters the order list, so every id a
+            # reader finds in the order list resolves.
+            stripe.items[item.id] = item
+            if new:
+                with self._order_lock:
+                    self._positions[item.id] = len(self._order)
+                    self._order.append(item.id)
+            stripe.version += 1
+
+    def _rows(self, cached: bool = True) -> list[Item]:
+        snapshot = self._snapshot
+        versions = self._versions()
+        if cached and snapshot is not None and snapshot[0] == versions:
+            return snapshot[1]
+        # Versions are read before the rows: a save that lands during the copy bumps
+        # its stripe afterwards, so this snapshot is never mistaken for a current one.
+        rows = [self._item(item_id) for item_id in self._order[:]]
+        self._snapshot = (versions, rows)
+        return rows
+
+    def _versions(self) -> tuple[int, ...]:
+        return tuple(stripe.version for stripe in self._stripes)
+
+    def _item(self, item_id: str) -> Item:
+        return self._stripe(item_id).items[item_id]
+
+    def _stripe(self, item_id: str) -> _Stripe:
+        return self._stripes[hash(item_id) % len(self._stripes)]
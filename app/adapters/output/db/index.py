@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_CHUNK_SIZE = 512
+
+
+class SortedIndex:
+    """Sorted set of unique keys kept in bounded sorted chunks.
+
+    A single sorted list pays an O(n) memmove per insert; splitting it into chunks of
+    at most ``2 * _CHUNK_SIZE`` keys keeps inserts and removals cheap at millions of
+    keys while range scans still start with two binary searches.
+    """
+
+    def __init__(self, keys: Iterable[Any] = ()) -> None:
+        ordered = sorted(keys)
+        self._chunks: list[list[Any]] = [
+            ordered[start : start + _CHUNK_SIZE] for start in range(0, len(ordered), _CHUNK_SIZE)
+        ]
+        self._maxes: list[Any] = [chunk[-1] for chunk in self._chunks]
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def add(self, key: Any) -> None:
+        if not self._chunks:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            return
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            index -= 1
+            chunk = self._chunks[index]
+            chunk.append(key)
+            self._maxes[index] = key
+        else:
+            chunk = self._chunks[index]
+            insort(chunk, key)
+        if len(chunk) > 2 * _CHUNK_SIZE:
+            self._chunks[index : index + 1] = [chunk[:_CHUNK_SIZE], chunk[_CHUNK_SIZE:]]
+            self._maxes[index : index + 1] = [chunk[_CHUNK_SIZE - 1], chunk[-1]]
+
+    def remove(self, key: Any) -> None:
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            raise KeyError(key)
+        chunk = self._chunks[index]
+        position = bisect_left(chunk, key)
+        if chunk[position] != key:
+            raise KeyError(key)
+        del chunk[position]
+        if not chunk:
+            del self._chunks[index]
+            del self._maxes[index]
+        elif position == len(chunk):
+            self._maxes[index] = chunk[-1]
+
+    def irange(
+        self, low: Any | None = None, high: Any | None = None, reverse: bool = False
+    ) -> Iterator[Any]:
+        """Yield keys in ``[low, high]`` (either bound may be open) in sort order."""
+        if reverse:
+            yield from self._descending(low, high)
+            return
+        first = 0 if low is None else bisect_left(self._maxes, low)
+        for index in range(first, len(self._chunks)):
+            chunk = self._chunks[index]
+            start = bisect_left(chunk, low) if low is not None and index == first else 0
+            for position in range(start, len(chunk)):
+                key = chunk[position]
+                if high is not None and key > high:
+                    return
+                yield key
+
+    def _descending(self, low: Any | None, high: Any | None) -> Iterator[Any]:
+        if not self._chunks:
+            return
+        last = len(self._chunks) - 1
+        if high is not None:
+            last = min(bisect_left(self._maxes, high), last)
+        for index in range(last, -1, -1):
+            chunk = self._chunks[index]
+            stop = bisect_right(chunk, high) if high is not None and index == last else len(chunk)
+            for position in range(stop - 1, -1, -1):
+                key = chunk[position]
+                if low is not None and key < low:
+                    return
+                yield key
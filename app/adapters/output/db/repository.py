@@ -1,18 +1,218 @@
 from __future__ import annotations
 
+import asyncio
+import math
+from collections.abc import AsyncIterator, Iterator, Sequence
+from threading import RLock
+
+from template.app.adapters.output.db.index import SortedIndex
+from template.core.application.dtos.dto import ItemQuery
+from template.core.application.services.query import (
+    SortKey,
+    matches,
+    prefix_upper_bound,
+    select,
+    sort_key,
+)
 from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+
+_ITER_BATCH = 1024
+_BEFORE_ALL = float("-inf")
+_AFTER_ALL = float("inf")
 
 
 class InMemoryItemRepository:
+    """Dict-backed item repository with sorted name and value indexes.
+
+    The indexes hold ``(name, position)`` and ``(value, position)`` keys, so name, prefix
+    and value-range queries walk only the matching rows. They are bulk-built by the first
+    query and maintained on every save after that, so write-only use pays nothing.
+
+    Saves and index walks hold one lock, which free-threaded builds need to keep the
+    indexes consistent; point reads, pages and streams stay lock-free because an item
+    is stored before its id is appended to the order list.
+    """
+
     def __init__(self) -> None:
+        self._lock = RLock()
         self._items: dict[str, Item] = {}
+        self._order: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._by_name: SortedIndex | None = None
+        self._by_value: SortedIndex | None = None
 
     def save(self, item: Item) -> Item:
-        self._items[item.id] = item
+        with self._lock:
+            self._store(item)
         return item
 
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        with self._lock:
+            for item in items:
+                self._store(item)
+        return list(items)
+
     def get(self, item_id: str) -> Item | None:
         return self._items.get(item_id)
 
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        return [self._items[item_id] for item_id in item_ids if item_id in self._items]
+
     def list(self) -> list[Item]:
         return list(self._items.values())
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        start = 0
+        if cursor is not None:
+            if cursor not in self._positions:
+                raise InvalidCursorError(cursor)
+            start = self._positions[cursor] + 1
+        return [self._items[item_id] for item_id in self._order[start : start + limit]]
+
+    def iter_items(self) -> Iterator[Item]:
+        # Walks the append-only order list in slices, so saves made while a stream is
+        # being consumed never invalidate it and only one slice is held at a time.
+        position = 0
+        while position < len(self._order):
+            batch = self._order[position : position + _ITER_BATCH]
+            position += len(batch)
+            for item_id in batch:
+                yield self._items[item_id]
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        with self._lock:
+            return self._query(query)
+
+    def _query(self, query: ItemQuery) -> list[Item]:
+        after: SortKey | None = None
+        if query.cursor is not None:
+            if query.cursor not in self._items:
+                raise InvalidCursorError(query.cursor)
+            after = sort_key(query, self._items[query.cursor], self._positions[query.cursor])
+
+        field, low, high = self._plan(query)
+        if field != query.sort:
+            # The index narrows the rows but not their order, so sort the matches.
+            positions = (key[-1] for key in self._index(field).irange(low, high))
+            rows = ((position, self._item_at(position)) for position in positions)
+            return select(query, rows, after)
+
+        # The index is already in sort order: continue from the cursor and stop at the limit.
+        if after is not None:
+            # Keys are unique (field, position) pairs, so half a position excludes the cursor.
+            if query.descending:
+                bound = (*after[:-1], after[-1] - 0.5)
+                high = bound if high is None else min(high, bound)
+            else:
+                bound = (*after[:-1], after[-1] + 0.5)
+                low = bound if low is None else max(low, bound)
+        results: list[Item] = []
+        for key in self._index(field).irange(low, high, reverse=query.descending):
+            item = self._item_at(key[-1])
+            if matches(query, item):
+                results.append(item)
+                if len(results) == query.limit:
+                    break
+        return results
+
+    def _plan(self, query: ItemQuery) -> tuple[str | None, SortKey | None, SortKey | None]:
+        """Pick the index to scan and its key range."""
+        by_name = query.name is not None or query.name_prefix is not None
+        by_value = query.min_value is not None or query.max_value is not None
+        if by_value and (not by_name or query.sort == "value"):
+            return (
+                "value",
+                None if query.min_value is None else (float(query.min_value), _BEFORE_ALL),
+                None if query.max_value is None else (float(query.max_value), _AFTER_ALL),
+            )
+        if query.name is not None:
+            return "name", (query.name, _BEFORE_ALL), (query.name, _AFTER_ALL)
+        if query.name_prefix is not None:
+            upper = prefix_upper_bound(query.name_prefix)
+            return (
+                "name",
+                (query.name_prefix, _BEFORE_ALL),
+                None if upper is None else (upper, _BEFORE_ALL),
+            )
+        return query.sort, None, None
+
+    def _index(self, field: str | None) -> SortedIndex | _InsertionOrder:
+        if field is None:
+            return _InsertionOrder(len(self._order))
+        if self._by_name is None or self._by_value is None:
+            items = [(self._positions[item.id], item) for item in self._items.values()]
+            self._by_name = SortedIndex((item.name, position) for position, item in items)
+            self._by_value = SortedIndex((float(item.value), position) for position, item in items)
+        return self._by_name if field == "name" else self._by_value
+
+    def _item_at(self, position: int) -> Item:
+        return self._items[self._order[position]]
+
+    def _store(self, item: Item) -> None:
+        # Callers hold ``_lock``.
+        previous = self._items.get(item.id)
+        self._items[item.id] = item
+        position = self._positions.get(item.id)
+        if position is None:
+            position = self._positions[item.id] = len(self._order)
+            self._order.append(item.id)
+        elif previous is not None and self._by_name is not None and self._by_value is not None:
+            self._by_name.remove((previous.name, position))
+            self._by_value.remove((float(previous.value), position))
+        if self._by_name is not None and self._by_value is not None:
+            self._by_name.add((item.name, position))
+            self._by_value.add((float(item.value), position))
+
+
+class AsyncInMemoryItemRepository:
+    """``InMemoryItemRepository`` behind the async repository port.
+
+    Dict and index operations never wait on I/O, so they run inline on the event loop
+    instead of paying for a thread hop; streams yield to other tasks between batches.
+    """
+
+    def __init__(self, repository: InMemoryItemRepository | None = None) -> None:
+        self._repository = repository or InMemoryItemRepository()
+
+    async def save(self, item: Item) -> Item:
+        return self._repository.save(item)
+
+    async def save_many(self, items: Sequence[Item]) -> list[Item]:
+        return self._repository.save_many(items)
+
+    async def get(self, item_id: str) -> Item | None:
+        return self._repository.get(item_id)
+
+    async def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        return self._repository.get_many(item_ids)
+
+    async def list(self) -> list[Item]:
+        return self._repository.list()
+
+    async def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        return self._repository.list_page(limit, cursor)
+
+    async def iter_items(self) -> AsyncIterator[Item]:
+        for count, item in enumerate(self._repository.iter_items(), 1):
+            yield item
+            if count % _ITER_BATCH == 0:
+                await asyncio.sleep(0)
+
+    async def query(self, query: ItemQuery) -> list[Item]:
+        return self._repository.query(query)
+
+
+class _InsertionOrder:
+    """``SortedIndex``-shaped view of positions ``0..size-1`` keyed as ``(position,)``."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+
+    def irange(
+        self, low: SortKey | None = None, high: SortKey | None = None, reverse: bool = False
+    ) -> Iterator[SortKey]:
+        start = 0 if low is None else max(0, math.ceil(low[0]))  # type: ignore[arg-type]
+        stop = self._size if high is None else min(self._size, math.floor(high[0]) + 1)  # type: ignore[arg-type]
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        return ((position,) for position in positions)
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import weakref
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from pathlib import Path
+from threading import Lock, local
+
+try:
+    import aiosqlite
+except ImportError:  # pragma: no cover - optional dependency
+    aiosqlite = None
+
+from template.core.application.dtos.dto import ItemQuery, ItemStatsDTO, ItemStatsQuery
+from template.core.application.services.aggregation import ValueAccumulator, summarize
+from template.core.application.services.query import prefix_upper_bound
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+from template.infrastructure.db.db import PRAGMAS, SCHEMA, connect, init_db
+
+_UPSERT = (
+    "INSERT INTO items (id, name, value) VALUES (?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET name = excluded.name, value = excluded.value"
+)
+_SELECT_ONE = "SELECT id, name, value FROM items WHERE id = ?"
+_SELECT_MANY = "SELECT id, name, value FROM items WHERE id IN ({})"
+_SELECT_ALL = "SELECT id, name, value FROM items ORDER BY rowid"
+_SELECT_ROWID = "SELECT rowid FROM items WHERE id = ?"
+_SELECT_PAGE = "SELECT id, name, value FROM items WHERE rowid > ? ORDER BY rowid LIMIT ?"
+_SELECT_CURSOR = "SELECT name, value, rowid FROM items WHERE id = ?"
+_SELECT_QUERY = "SELECT id, name, value FROM items{where} ORDER BY {order}{limit}"
+# Sort fields map to fixed column names; nothing from the query is spliced into SQL.
+_SORT_COLUMNS = {None: "rowid", "name": "name", "value": "value"}
+_SELECT_VALUES = "SELECT value FROM items"
+_SELECT_GROUPED_VALUES = "SELECT substr(name, 1, ?), value FROM items"
+_FETCH_BATCH = 4096
+# Keeps each IN (...) list well under SQLite's bound-parameter limit.
+_SELECT_MANY_CHUNK = 500
+MEMORY_PATH = ":memory:"
+
+
+class _ThreadConnection:
+    # Held in a thread-local, so it is dropped, and its connection closed, with its thread.
+    __slots__ = ("__weakref__", "connection")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+
+
+def _release(
+    connection: sqlite3.Connection, connections: set[sqlite3.Connection], lock: Lock
+) -> None:
+    with lock:
+        connections.discard(connection)
+    connection.close()
+
+
+class SqliteItemRepository:
+    """Item repository on the stdlib ``sqlite3`` module.
+
+    Each thread gets its own WAL-mode connection, so the repository can be shared by
+    ``ThreadingHTTPServer`` handlers, and the connection is closed when its thread
+    exits. An in-memory database exists once per connection, so ``":memory:"`` uses a
+    single connection shared by every thread. Statements are fixed SQL strings and are
+    served from each connection's prepared-statement cache after their first use.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._local = local()
+        self._connections: set[sqlite3.Connection] = set()
+        self._connections_lock = Lock()
+        self._shared: sqlite3.Connection | None = None
+        if str(path) == MEMORY_PATH:
+            self._shared = connect(MEMORY_PATH)
+            with self._shared:
+                self._shared.executescript(SCHEMA)
+            self._connections.add(self._shared)
+        else:
+            init_db(self._path)
+
+    def save(self, item: Item) -> Item:
+        connection = self._connection()
+        with connection:
+            connection.execute(_UPSERT, (item.id, item.name, float(item.value)))
+        return item
+
+    def save_many(self, items: Iterable[Item]) -> list[Item]:
+        saved = list(items)
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                _UPSERT, [(item.id, item.name, float(item.value)) for item in saved]
+            )
+        return saved
+
+    def get(self, item_id: str) -> Item | None:
+        row = self._connection().execute(_SELECT_ONE, (item_id,)).fetchone()
+        return None if row is None else _to_item(row)
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        connection = self._connection()
+        found: dict[str, Item] = {}
+        unique_ids = list(dict.fromkeys(item_ids))
+        for start in range(0, len(unique_ids), _SELECT_MANY_CHUNK):
+            chunk = unique_ids[start : start + _SELECT_MANY_CHUNK]
+            sql = _SELECT_MANY.format(", ".join("?" * len(chunk)))
+            found.update((row[0], _to_item(row)) for row in connection.execute(sql, chunk))
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    def list(self) -> list[Item]:
+        return [_to_item(row) for row in self._connection().execute(_SELECT_ALL)]
+
+    def iter_items(self) -> Iterator[Item]:
+        for row in self._connection().execute(_SELECT_ALL):
+            yield _to_item(row)
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        connection = self._connection()
+        after = 0
+        if cursor is not None:
+            row = connection.execute(_SELECT_ROWID, (cursor,)).fetchone()
+            if row is None:
+                raise InvalidCursorError(cursor)
+            after = row[0]
+        return [_to_item(row) for row in connection.execute(_SELECT_PAGE, (after, limit))]
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        connection = self._connection()
+        cursor_row = None
+        if query.cursor is not None:
+            cursor_row = connection.execute(_SELECT_CURSOR, (query.cursor,)).fetchone()
+            if cursor_row is None:
+                raise InvalidCursorError(query.cursor)
+        sql, params = _query_sql(query, cursor_row)
+        return [_to_item(row) for row in connection.execute(sql, params)]
+
+    def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        # SQLite has no percentile aggregate and its window functions re-sort the table per
+        # query, so only the needed columns leave SQLite and are summarized in one pass.
+        connection = self._connection()
+        if query.group_prefix is None:
+            cursor = connection.execute(_SELECT_VALUES)
+            cursor.row_factory = _first_column
+            values = array("d")
+            while batch := cursor.fetchmany(_FETCH_BATCH):
+                values.extend(batch)
+            return summarize(values, query)
+        accumulator = ValueAccumulator(query.group_prefix)
+        for key, value in connection.execute(_SELECT_GROUPED_VALUES, (query.group_prefix,)):
+            accumulator.add(key, value)
+        return accumulator.result(query)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+        self._local = local()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._shared is not None:
+            return self._shared
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            connection = connect(self._path)
+            holder = _ThreadConnection(connection)
+            self._local.holder = holder
+            with self._connections_lock:
+                self._connections.add(connection)
+            weakref.finalize(
+                holder, _release, connection, self._connections, self._connections_lock
+            )
+        return holder.connection
+
+
+class AsyncSqliteItemRepository:
+    """Item repository on ``aiosqlite`` for the async stack.
+
+    One connection, opened on first use, runs every statement on aiosqlite's own
+    thread, so the event loop never waits on SQLite. Writes hold a lock so each one
+    commits as its own transaction, as with the sync repository. aiosqlite's thread
+    keeps the interpreter alive until ``close`` is awaited.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        if aiosqlite is None:
+            raise RuntimeError("AsyncSqliteItemRepository requires aiosqlite.")
+        self._path = Path(path)
+        self._db: aiosqlite.Connection | None = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        init_db(self._path)
+
+    async def save(self, item: Item) -> Item:
+        db = await self._connection()
+        async with self._write_lock:
+            await db.execute(_UPSERT, (item.id, item.name, float(item.value)))
+            await db.commit()
+        return item
+
+    async def save_many(self, items: Iterable[Item]) -> list[Item]:
+        saved = list(items)
+        db = await self._connection()
+        async with self._write_lock:
+            await db.executemany(
+                _UPSERT, [(item.id, item.name, float(item.value)) for item in saved]
+            )
+            await db.commit()
+        return saved
+
+    async def get(self, item_id: str) -> Item | None:
+        db = await self._connection()
+        async with db.execute(_SELECT_ONE, (item_id,)) as cursor:
+            row = await cursor.fetchone()
+        return None if row is None else _to_item(row)
+
+    async def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        db = await self._connection()
+        found: dict[str, Item] = {}
+        unique_ids = list(dict.fromkeys(item_ids))
+        for start in range(0, len(unique_ids), _SELECT_MANY_CHUNK):
+            chunk = unique_ids[start : start + _SELECT_MANY_CHUNK]
+            sql = _SELECT_MANY.format(", ".join("?" * len(chunk)))
+            rows = await db.execute_fetchall(sql, chunk)
+            found.update((row[0], _to_item(row)) for row in rows)
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    async def list(self) -> list[Item]:
+        db = await self._connection()
+        return [_to_item(row) for row in await db.execute_fetchall(_SELECT_ALL)]
+
+    async def iter_items(self) -> AsyncIterator[Item]:
+        db = await self._connection()
+        async with db.execute(_SELECT_ALL) as cursor:
+            while batch := await cursor.fetchmany(_FETCH_BATCH):
+                for row in batch:
+                    yield _to_item(row)
+
+    async def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        db = await self._connection()
+        after = 0
+        if cursor is not None:
+            async with db.execute(_SELECT_ROWID, (cursor,)) as rows:
+                row = await rows.fetchone()
+            if row is None:
+                raise InvalidCursorError(cursor)
+            after = row[0]
+        return [_to_item(row) for row in await db.execute_fetchall(_SELECT_PAGE, (after, limit))]
+
+    async def query(self, query: ItemQuery) -> list[Item]:
+        db = await self._connection()
+        cursor_row = None
+        if query.cursor is not None:
+            async with db.execute(_SELECT_CURSOR, (query.cursor,)) as rows:
+                cursor_row = await rows.fetchone()
+            if cursor_row is None:
+                raise InvalidCursorError(query.cursor)
+        sql, params = _query_sql(query, cursor_row)
+        return [_to_item(row) for row in await db.execute_fetchall(sql, params)]
+
+    async def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        db = await self._connection()
+        if query.group_prefix is None:
+            values = array("d")
+            async with db.execute(_SELECT_VALUES) as cursor:
+                while batch := await cursor.fetchmany(_FETCH_BATCH):
+                    values.extend(row[0] for row in batch)
+            return summarize(values, query)
+        accumulator = ValueAccumulator(query.group_prefix)
+        async with db.execute(_SELECT_GROUPED_VALUES, (query.group_prefix,)) as cursor:
+            while batch := await cursor.fetchmany(_FETCH_BATCH):
+                for key, value in batch:
+                    accumulator.add(key, value)
+        return accumulator.result(query)
+
+    async def close(self) -> None:
+        async with self._connect_lock:
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._db is not None:
+            return self._db
+        async with self._connect_lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self._path, timeout=5.0, cached_statements=256)
+                for pragma in PRAGMAS:
+                    await db.execute(pragma)
+                self._db = db
+        return self._db
+
+
+def _query_sql(
+    query: ItemQuery, cursor_row: tuple[str, float, int] | None
+) -> tuple[str, list[object]]:
+    # Filters and the keyset condition use the items_name / items_value indexes; rowid
+    # breaks ties so the order matches the other adapters.
+    conditions: list[str] = []
+    params: list[object] = []
+    if query.name is not None:
+        conditions.append("name = ?")
+        params.append(query.name)
+    if query.name_prefix is not None:
+        conditions.append("name >= ?")
+        params.append(query.name_prefix)
+        upper = prefix_upper_bound(query.name_prefix)
+        if upper is not None:
+            conditions.append("name < ?")
+            params.append(upper)
+    if query.min_value is not None:
+        conditions.append("value >= ?")
+        params.append(float(query.min_value))
+    if query.max_value is not None:
+        conditions.append("value <= ?")
+        params.append(float(query.max_value))
+
+    sort_column = _SORT_COLUMNS[query.sort]
+    columns = ("rowid",) if query.sort is None else (sort_column, "rowid")
+    if cursor_row is not None:
+        name, value, rowid = cursor_row
+        comparison = "<" if query.descending else ">"
+        if query.sort is None:
+            conditions.append(f"rowid {comparison} ?")
+            params.append(rowid)
+        else:
+            conditions.append(f"({sort_column}, rowid) {comparison} (?, ?)")
+            params.extend((name if query.sort == "name" else value, rowid))
+
+    direction = " DESC" if query.descending else ""
+    limit = ""
+    if query.limit is not None:
+        limit = " LIMIT ?"
+        params.append(query.limit)
+    sql = _SELECT_QUERY.format(
+        where=" WHERE " + " AND ".join(conditions) if conditions else "",
+        order=", ".join(column + direction for column in columns),
+        limit=limit,
+    )
+    return sql, params
+
+
+def _to_item(row: tuple[str, str, float]) -> Item:
+    return Item(id=row[0], name=row[1], value=row[2])
+
+
+def _first_column(cursor: sqlite3.Cursor, row: tuple[float]) -> float:
+    return row[0]
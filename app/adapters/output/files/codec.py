@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from itertools import accumulate, pairwise
+
+from template.core.domain.entities.model import Item
+from template.core.domain.services.ids import canonical_uuid_bytes
+
+try:
+    import zlib
+except ImportError:  # pragma: no cover - optional dependency
+    zlib = None
+
+try:
+    import lzma
+except ImportError:  # pragma: no cover - optional dependency
+    lzma = None
+
+
+COMPRESSIONS = ("none", "zlib", "lzma")
+
+_MAGIC = b"ITB1"
+_HEADER = struct.Struct("<4sB")
+_BLOCK = struct.Struct("<II")
+_COUNT = struct.Struct("<I")
+# An id length of ``_PACKED_UUID`` marks an id stored as 16 UUID bytes.
+_PACKED_UUID = 0xFFFF
+# Byte ranges of the dash-separated groups of a UUID string.
+_UUID_GROUPS = ((0, 4), (4, 6), (6, 8), (8, 10), (10, 16))
+_BLOCK_ITEMS = 4096
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def encode_items(items: Iterable[Item], compression: str = "none") -> bytes:
+    """Encode items as a binary items file.
+
+    The file is a 5-byte header (magic and compression) followed by blocks of up to
+    ``_BLOCK_ITEMS`` items, each prefixed with its raw and stored lengths and compressed
+    on its own. A block stores its records column by column: the item count, float64
+    values, name lengths, id lengths, the 16-byte ids of canonical UUID strings split
+    by UUID group, the remaining ids as UTF-8 and finally the UTF-8 names. Decoding
+    then works on whole columns instead of one record at a time.
+    """
+    code = _compression_code(compression)
+    codec = _codec(compression)
+    compress = None if codec is None else codec[0]
+    chunks = [_HEADER.pack(_MAGIC, code)]
+    block: list[Item] = []
+    for item in items:
+        block.append(item)
+        if len(block) == _BLOCK_ITEMS:
+            chunks.append(_encode_block(block, compress))
+            block = []
+    if block:
+        chunks.append(_encode_block(block, compress))
+    return b"".join(chunks)
+
+
+def decode_items(data: bytes) -> list[Item]:
+    """Decode a file written by ``encode_items``; values come back as floats."""
+    try:
+        return [item for block in _iter_blocks(data) for item in _decode_block(block)]
+    except (struct.error, IndexError) as exc:
+        raise ValueError("Corrupt block in binary items file.") from exc
+
+
+def is_binary_items(data: bytes) -> bool:
+    return data[: len(_MAGIC)] == _MAGIC
+
+
+def _compression_code(compression: str) -> int:
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression {compression!r}; expected one of {', '.join(COMPRESSIONS)}."
+        )
+    return COMPRESSIONS.index(compression)
+
+
+def _codec(compression: str) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]] | None:
+    if compression == "none":
+        return None
+    module = zlib if compression == "zlib" else lzma
+    if module is None:  # pragma: no cover - optional dependency
+        raise ValueError(f"{compression} compression requires the {compression} module.")
+    return module.compress, module.decompress
+
+
+def _encode_block(items: list[Item], compress: Callable[[bytes], bytes] | None) -> bytes:
+    names = [item.name.encode() for item in items]
+    id_lengths = array("H")
+    uuids: list[bytes] = []
+    text_ids: list[bytes] = []
+    for item in items:
+        binary_id = canonical_uuid_bytes(item.id)
+        if binary_id is not None:
+            uuids.append(binary_id)
+            id_lengths.append(_PACKED_UUID)
+            continue
+        encoded_id = item.id.encode()
+        if len(encoded_id) >= _PACKED_UUID:
+            raise ValueError("Item id is too long for the binary items format.")
+        text_ids.append(encoded_id)
+        id_lengths.append(len(encoded_id))
+    columns = [
+        array("d", [float(item.value) for item in items]),
+        array("I", map(len, names)),
+        id_lengths,
+    ]
+    if not _LITTLE_ENDIAN:  # pragma: no cover - big-endian hosts
+        for column in columns:
+            column.byteswap()
+    raw = b"".join(
+        [
+            _COUNT.pack(len(items)),
+            *(column.tobytes() for column in columns),
+            *(b"".join(uuid[start:stop] for uuid in uuids) for start, stop in _UUID_GROUPS),
+            *text_ids,
+            *names,
+        ]
+    )
+    stored = raw if compress is None else compress(raw)
+    return _BLOCK.pack(len(raw), len(stored)) + stored
+
+
+def _iter_blocks(data: bytes) -> Iterator[bytes]:
+    if len(data) < _HEADER.size or not is_binary_items(data):
+        raise ValueError("Not a binary items file.")
+    _, code = _HEADER.unpack_from(data)
+    if code >= len(COMPRESSIONS):
+        raise ValueError(f"Unknown compression code {code} in binary items file.")
+    codec = _codec(COMPRESSIONS[code])
+    decompress = None if codec is None else codec[1]
+    position = _HEADER.size
+    while position < len(data):
+        if position + _BLOCK.size > len(data):
+            raise ValueError("Truncated block header in binary items file.")
+        raw_length, stored_length = _BLOCK.unpack_from(data, position)
+        position += _BLOCK.size
+        stored = data[position : position + stored_length]
+        if len(stored) != stored_length:
+            raise ValueError("Truncated block in binary items file.")
+        position += stored_length
+        raw = stored if decompress is None else decompress(stored)
+        if len(raw) != raw_length:
+            raise ValueError("Corrupt block in binary items file.")
+        yield raw
+
+
+def _decode_block(raw: bytes) -> list[Item]:
+    (count,) = _COUNT.unpack_from(raw)
+    position = _COUNT.size
+    values = array("d")
+    name_lengths = array("I")
+    id_lengths = array("H")
+    for column in (values, name_lengths, id_lengths):
+        end = position + count * column.itemsize
+        column.frombytes(raw[position:end])
+        if not _LITTLE_ENDIAN:  # pragma: no cover - big-endian hosts
+            column.byteswap()
+        position = end
+    packed = id_lengths.count(_PACKED_UUID)
+    groups = []
+    for start, stop in _UUID_GROUPS:
+        width = stop - start
+        end = position + packed * width
+        groups.append(raw[position:end].hex(" ", width).split(" ") if packed else [])
+        position = end
+    uuids = list(map("-".join, zip(*groups)))
+    text_lengths = [length for length in id_lengths if length != _PACKED_UUID]
+    text_ids, position = _split_utf8(raw, position, text_lengths)
+    if packed == count:
+        ids = uuids
+    elif not packed:
+        ids = text_ids
+    else:
+        uuid_iter, text_iter = iter(uuids), iter(text_ids)
+        ids = [
+            next(uuid_iter) if length == _PACKED_UUID else next(text_iter) for length in id_lengths
+        ]
+    names, position = _split_utf8(raw, position, name_lengths)
+    if position != len(raw) or len(ids) != count:
+        raise ValueError("Corrupt block in binary items file.")
+    return list(map(Item, names, values.tolist(), ids))
+
+
+def _split_utf8(raw: bytes, position: int, lengths: Iterable[int]) -> tuple[list[str], int]:
+    bounds = list(accumulate(lengths, initial=position))
+    end = bounds[-1]
+    section = raw[position:end]
+    if len(section) != end - position:
+        raise ValueError("Truncated block in binary items file.")
+    if section.isascii():
+        # ASCII byte offsets are character offsets, so one decode serves the whole column.
+        text = section.decode("ascii")
+        offsets = [bound - position for bound in bounds]
+        return [text[start:stop] for start, stop in pairwise(offsets)], end
+    return [raw[start:stop].decode() for start, stop in pairwise(bounds)], end
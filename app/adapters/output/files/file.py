@@ -1,34 +1,166 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict
 from pathlib import Path
+from threading import Lock
 
+from template.app.adapters.output.files.codec import COMPRESSIONS, decode_items, encode_items
+from template.core.application.dtos.dto import ItemQuery
+from template.core.application.services.query import SortKey, select, sort_key
 from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - optional dependency
+    fcntl = None
+
+
+FILE_FORMATS = ("json", "binary")
 
 
 class FileItemRepository:
-    def __init__(self, path: str | Path) -> None:
+    """Item repository that rewrites one whole file per save.
+
+    ``file_format="json"`` stores a JSON array; ``"binary"`` stores the compact
+    length-prefixed records of ``codec.encode_items``, optionally block-compressed.
+
+    Saves hold an exclusive ``flock`` on ``<path>.lock`` across their read-modify-write,
+    so concurrent writers in any thread or process cannot drop each other's items, and
+    the file is replaced atomically so readers never see a partial write.
+    """
+
+    def __init__(
+        self, path: str | Path, file_format: str = "json", compression: str = "none"
+    ) -> None:
+        if file_format not in FILE_FORMATS:
+            raise ValueError(
+                f"Unsupported file format {file_format!r}; "
+                f"expected one of {', '.join(FILE_FORMATS)}."
+            )
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression {compression!r}; "
+                f"expected one of {', '.join(COMPRESSIONS)}."
+            )
         self._path = Path(path)
+        self._file_format = file_format
+        self._compression = compression
+        self._items: dict[str, Item] = {}
+        self._items_key: tuple[int, int, int] | None = None
+        self._paging: tuple[dict[str, Item], list[Item], dict[str, int]] | None = None
+        self._lock_path = self._path.with_name(f"{self._path.name}.lock")
+        self._thread_lock = Lock()
 
     def save(self, item: Item) -> Item:
-        items = {stored.id: stored for stored in self.list()}
-        items[item.id] = item
-        self._write(list(items.values()))
+        with self._locked():
+            items = dict(self._load())
+            items[item.id] = item
+            self._write(items)
         return item
 
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        with self._locked():
+            merged = dict(self._load())
+            merged.update((item.id, item) for item in items)
+            self._write(merged)
+        return list(items)
+
     def get(self, item_id: str) -> Item | None:
-        for item in self.list():
-            if item.id == item_id:
-                return item
-        return None
+        return self._load().get(item_id)
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        items = self._load()
+        return [items[item_id] for item_id in item_ids if item_id in items]
 
     def list(self) -> list[Item]:
-        if not self._path.exists():
-            return []
-        payload = json.loads(self._path.read_text(encoding="utf-8"))
-        return [Item(**item) for item in payload]
+        return list(self._load().values())
 
-    def _write(self, items: list[Item]) -> None:
+    def iter_items(self) -> Iterator[Item]:
+        # Cached maps are replaced on save, never mutated, so iterating one is safe.
+        yield from self._load().values()
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        rows, positions = self._paged()
+        start = 0
+        if cursor is not None:
+            if cursor not in positions:
+                raise InvalidCursorError(cursor)
+            start = positions[cursor] + 1
+        return rows[start : start + limit]
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        # A JSON array has no secondary index to use, so queries scan the cached rows.
+        rows, positions = self._paged()
+        after: SortKey | None = None
+        if query.cursor is not None:
+            if query.cursor not in positions:
+                raise InvalidCursorError(query.cursor)
+            position = positions[query.cursor]
+            after = sort_key(query, rows[position], position)
+        return select(query, enumerate(rows), after)
+
+    def _paged(self) -> tuple[list[Item], dict[str, int]]:
+        items = self._load()
+        paging = self._paging
+        if paging is None or paging[0] is not items:
+            positions = {item_id: position for position, item_id in enumerate(items)}
+            paging = self._paging = (items, list(items.values()), positions)
+        return paging[1], paging[2]
+
+    def _load(self) -> dict[str, Item]:
+        # The parsed item map is reused until the file's (mtime, size, inode) changes,
+        # so repeated reads skip json.loads while external edits are still picked up.
+        key = self._stat_key()
+        if key is None:
+            self._items, self._items_key = {}, None
+        elif key != self._items_key:
+            self._items = {item.id: item for item in self._read()}
+            self._items_key = key
+        return self._items
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # flock locks belong to the open file description, so a fresh descriptor per
+        # save also excludes other threads; the thread lock covers hosts without fcntl.
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = [item.__dict__ for item in items]
-        self._path.write_text(json.dumps(serialized, ensure_ascii=True), encoding="utf-8")
+        with self._thread_lock:
+            if fcntl is None:  # pragma: no cover - non-POSIX hosts
+                yield
+                return
+            with self._lock_path.open("a") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _write(self, items: dict[str, Item]) -> None:
+        # Callers hold ``_locked``, so one temporary name is enough. Replacing the file
+        # also gives it a new inode, which other processes' stat keys notice.
+        if self._file_format == "binary":
+            payload = encode_items(items.values(), self._compression)
+        else:
+            serialized = [asdict(item) for item in items.values()]
+            payload = json.dumps(serialized, ensure_ascii=True).encode("utf-8")
+        temporary = self._path.with_name(f"{self._path.name}.tmp")
+        temporary.write_bytes(payload)
+        os.replace(temporary, self._path)
+        self._items, self._items_key = items, self._stat_key()
+
+    def _read(self) -> list[Item]:
+        if self._file_format == "binary":
+            return decode_items(self._path.read_bytes())
+        payload = json.loads(self._path.read_text(encoding="utf-8"))
+        return [Item(**entry) for entry in payload]
+
+    def _stat_key(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from threading import Lock, Thread
+from typing import BinaryIO
+
+from template.core.application.dtos.dto import CompactionReportDTO, ItemQuery
+from template.core.application.services.query import SortKey, select, sort_key
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+
+_INDEX_MAGIC = b"IIX1"
+_INDEX_ENTRY = struct.Struct("<QIH")
+_ITER_BATCH = 1024
+# Background compaction never runs for logs smaller than this.
+_MIN_COMPACTION_BYTES = 1 << 20
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LogItemRepository:
+    """Append-only NDJSON item log.
+
+    Every save appends one record to the log and one ``id -> (offset, length)`` entry
+    to a sidecar ``.idx`` file. At open the sidecar is loaded and only the log tail it
+    does not cover is parsed, and point lookups decode a single record from a
+    memory-mapped view of the log.
+
+    ``compact()`` rewrites the log as a snapshot of the latest record per item followed
+    by whatever was appended meanwhile. With ``compaction_ratio`` set, it starts in a
+    background thread once the log is that many times larger than its live records.
+    """
+
+    def __init__(self, path: str | Path, compaction_ratio: float | None = None) -> None:
+        self._path = Path(path)
+        self._index_path = self._path.with_name(f"{self._path.name}.idx")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._compact_lock = Lock()
+        self._compaction_ratio = compaction_ratio
+        self._compacting = False
+        self.last_compaction: CompactionReportDTO | None = None
+        self._index: dict[str, tuple[int, int]] = {}
+        self._order: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._live_bytes = 0
+        self._map: mmap.mmap | None = None
+        self._size = self._open()
+        self._writer = self._path.open("ab")
+        self._index_writer = self._index_path.open("ab")
+
+    def save(self, item: Item) -> Item:
+        self.save_many([item])
+        return item
+
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        records = [_encode(item) for item in items]
+        with self._lock:
+            offset = self._size
+            locations: list[tuple[str, int, int]] = []
+            for item, record in zip(items, records):
+                locations.append((item.id, offset, len(record)))
+                offset += len(record)
+            self._writer.write(b"".join(records))
+            self._writer.flush()
+            self._index_writer.write(b"".join(_encode_index_entry(*entry) for entry in locations))
+            self._index_writer.flush()
+            for location in locations:
+                self._track(*location)
+            self._size = offset
+            start_compaction = self._compaction_due()
+        if start_compaction:
+            Thread(target=self._compact_in_background, name="log-compaction", daemon=True).start()
+        return list(items)
+
+    def get(self, item_id: str) -> Item | None:
+        items = self.get_many([item_id])
+        return items[0] if items else None
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        with self._lock:
+            records = [
+                self._read(*self._index[item_id]) for item_id in item_ids if item_id in self._index
+            ]
+        return [_decode(record) for record in records]
+
+    def list(self) -> list[Item]:
+        with self._lock:
+            records = [self._read(offset, length) for offset, length in self._index.values()]
+        return [_decode(record) for record in records]
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        with self._lock:
+            start = 0
+            if cursor is not None:
+                if cursor not in self._positions:
+                    raise InvalidCursorError(cursor)
+                start = self._positions[cursor] + 1
+            records = [
+                self._read(*self._index[item_id]) for item_id in self._order[start : start + limit]
+            ]
+        return [_decode(record) for record in records]
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        # The sidecar only indexes ids, so filters are evaluated over one streamed pass.
+        after: SortKey | None = None
+        if query.cursor is not None:
+            with self._lock:
+                if query.cursor not in self._positions:
+                    raise InvalidCursorError(query.cursor)
+                position = self._positions[query.cursor]
+                record = self._read(*self._index[query.cursor])
+            after = sort_key(query, _decode(record), position)
+        return select(query, enumerate(self.iter_items()), after)
+
+    def iter_items(self) -> Iterator[Item]:
+        position = 0
+        while True:
+            with self._lock:
+                batch = self._order[position : position + _ITER_BATCH]
+                records = [self._read(*self._index[item_id]) for item_id in batch]
+            if not records:
+                return
+            position += len(records)
+            for record in records:
+                yield _decode(record)
+
+    def compact(self) -> CompactionReportDTO:
+        """Rewrite the log and its sidecar so they hold only the latest record per item.
+
+        Live records are copied without holding the repository lock, so reads and
+        appends continue meanwhile; the lock is only taken to copy the records appended
+        during the copy and to swap the files in with ``os.replace``.
+        """
+        with self._compact_lock:
+            started = time.perf_counter()
+            with self._lock:
+                snapshot_size = self._size
+                live = [(item_id, *self._index[item_id]) for item_id in self._order]
+            compact_path = self._path.with_name(f"{self._path.name}.compact")
+            with compact_path.open("wb") as target:
+                relocated = self._copy_records(live, snapshot_size, target)
+                snapshot_end = target.tell()
+                with self._lock:
+                    bytes_before = self._size
+                    if self._size > snapshot_size:
+                        target.write(self._read(snapshot_size, self._size - snapshot_size))
+                    target.flush()
+                    os.fsync(target.fileno())
+                    bytes_after = target.tell()
+                    index = {
+                        item_id: relocated[item_id]
+                        if offset < snapshot_size
+                        else (offset - snapshot_size + snapshot_end, length)
+                        for item_id, (offset, length) in self._index.items()
+                    }
+                    self._swap(compact_path, index, bytes_after)
+            report = CompactionReportDTO(
+                items=len(index),
+                bytes_before=bytes_before,
+                bytes_after=bytes_after,
+                seconds=time.perf_counter() - started,
+            )
+        self.last_compaction = report
+        return report
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._writer.close()
+            self._index_writer.close()
+
+    def _track(self, item_id: str, offset: int, length: int) -> None:
+        previous = self._index.get(item_id)
+        if previous is None:
+            self._positions[item_id] = len(self._order)
+            self._order.append(item_id)
+        else:
+            self._live_bytes -= previous[1]
+        self._index[item_id] = (offset, length)
+        self._live_bytes += length
+
+    def _copy_records(
+        self, live: Sequence[tuple[str, int, int]], size: int, target: BinaryIO
+    ) -> dict[str, tuple[int, int]]:
+        relocated: dict[str, tuple[int, int]] = {}
+        if not size:
+            return relocated
+        # Appends only ever extend the log, so the first ``size`` bytes are stable.
+        with (
+            self._path.open("rb") as source,
+            mmap.mmap(source.fileno(), size, access=mmap.ACCESS_READ) as view,
+        ):
+            offset = 0
+            for item_id, start, length in live:
+                target.write(view[start : start + length])
+                relocated[item_id] = (offset, length)
+                offset += length
+        return relocated
+
+    def _compaction_due(self) -> bool:
+        ratio = self._compaction_ratio
+        if (
+            ratio is None
+            or self._compacting
+            or self._size < _MIN_COMPACTION_BYTES
+            or self._size < ratio * self._live_bytes
+        ):
+            return False
+        self._compacting = True
+        return True
+
+    def _compact_in_background(self) -> None:
+        try:
+            report = self.compact()
+        except Exception:
+            LOGGER.exception("Compacting %s failed.", self._path)
+        else:
+            LOGGER.info(
+                "Compacted %s: %d items, %d -> %d bytes in %.3fs.",
+                self._path,
+                report.items,
+                report.bytes_before,
+                report.bytes_after,
+                report.seconds,
+            )
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    def _swap(self, compact_path: Path, index: dict[str, tuple[int, int]], size: int) -> None:
+        # Callers hold ``_lock``. The log is replaced before its sidecar: a crash in
+        # between leaves a sidecar that fails the check in ``_load_index`` and is rebuilt.
+        index_compact_path = self._index_path.with_name(f"{self._index_path.name}.compact")
+        with index_compact_path.open("wb") as handle:
+            handle.write(_INDEX_MAGIC)
+            handle.write(
+                b"".join(_encode_index_entry(item_id, *index[item_id]) for item_id in self._order)
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._writer.close()
+        self._index_writer.close()
+        os.replace(compact_path, self._path)
+        os.replace(index_compact_path, self._index_path)
+        self._writer = self._path.open("ab")
+        self._index_writer = self._index_path.open("ab")
+        self._index = index
+        self._live_bytes = sum(length for _, length in index.values())
+        self._size = size
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._map is None or offset + length > len(self._map):
+            self._remap()
+        assert self._map is not None
+        return self._map[offset : offset + length]
+
+    def _remap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        with self._path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _open(self) -> int:
+        if not self._path.exists():
+            self._path.touch()
+        size = self._path.stat().st_size
+        covered = self._load_index(size)
+        offset = self._replay(covered)
+        if offset != size:
+            # Drop a torn trailing record left behind by an interrupted append.
+            os.truncate(self._path, offset)
+        return offset
+
+    def _load_index(self, size: int) -> int:
+        if not self._index_path.exists():
+            self._index_path.write_bytes(_INDEX_MAGIC)
+            return 0
+        data = self._index_path.read_bytes()
+        if not data.startswith(_INDEX_MAGIC):
+            return self._reset_index()
+        position = len(_INDEX_MAGIC)
+        covered = 0
+        last_id: str | None = None
+        while position + _INDEX_ENTRY.size <= len(data):
+            offset, length, id_length = _INDEX_ENTRY.unpack_from(data, position)
+            end = position + _INDEX_ENTRY.size + id_length
+            if end > len(data):
+                break
+            last_id = data[position + _INDEX_ENTRY.size : end].decode()
+            self._track(last_id, offset, length)
+            covered = max(covered, offset + length)
+            position = end
+        if position != len(data):
+            os.truncate(self._index_path, position)
+        if covered > size or (last_id is not None and not self._points_at(last_id)):
+            return self._reset_index()
+        return covered
+
+    def _points_at(self, item_id: str) -> bool:
+        offset, length = self._index[item_id]
+        with self._path.open("rb") as handle:
+            handle.seek(offset)
+            record = handle.read(length)
+        try:
+            return json.loads(record)["id"] == item_id
+        except (ValueError, KeyError):
+            return False
+
+    def _reset_index(self) -> int:
+        # The sidecar does not describe this log (replaced or truncated); rebuild it.
+        self._index.clear()
+        self._order.clear()
+        self._positions.clear()
+        self._live_bytes = 0
+        self._index_path.write_bytes(_INDEX_MAGIC)
+        return 0
+
+    def _replay(self, offset: int) -> int:
+        entries: list[bytes] = []
+        with self._path.open("rb") as handle:
+            handle.seek(offset)
+            for record in handle:
+                if not record.endswith(b"\n"):
+                    break
+                item_id = json.loads(record)["id"]
+                self._track(item_id, offset, len(record))
+                entries.append(_encode_index_entry(item_id, offset, len(record)))
+                offset += len(record)
+        if entries:
+            with self._index_path.open("ab") as handle:
+                handle.write(b"".join(entries))
+        return offset
+
+
+def read_log_items(path: str | Path) -> list[Item]:
+    """The latest record of every item in an NDJSON log, in first-save order.
+
+    Reads the log without opening it as a repository: no sidecar index is written and a
+    torn trailing record is skipped rather than truncated, so the file is left as it is.
+    """
+    items: dict[str, Item] = {}
+    with Path(path).open("rb") as handle:
+        for record in handle:
+            if not record.endswith(b"\n"):
+                break
+            item = _decode(record)
+            items[item.id] = item
+    return list(items.values())
+
+
+def _encode(item: Item) -> bytes:
+    payload = {"id": item.id, "name": item.name, "value": item.value}
+    return json.dumps(payload, ensure_ascii=True).encode() + b"\n"
+
+
+def _decode(record: bytes) -> Item:
+    return Item(**json.loads(record))
+
+
+def _encode_index_entry(item_id: str, offset: int, length: int) -> bytes:
+    encoded = item_id.encode()
+    return _INDEX_ENTRY.pack(offset, length, len(encoded)) + encoded
@@ -0,0 +1 @@
+"""Thread-offloading repository decorators."""
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from itertools import islice
+from typing import TypeVar
+
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    ItemQuery,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
+from template.core.application.ports.output.repository_port import (
+    ItemAggregationPort,
+    ItemCompactionPort,
+    ItemRepositoryPort,
+)
+from template.core.application.services.aggregation import ValueAccumulator
+from template.core.domain.entities.model import Item
+from template.infrastructure.executor import BoundedExecutor
+
+T = TypeVar("T")
+_ITER_BATCH = 1024
+
+
+class ThreadOffloadItemRepository:
+    """Async repository port over any sync repository, one worker thread per call.
+
+    File, sqlite, sharded and the other blocking backends keep their sync code and
+    locking; the event loop only awaits the result. Calls run on ``executor`` when one
+    is given, so their number is bounded and visible in its stats, and on the loop's
+    default executor otherwise. Streams cross to the worker once per batch of items,
+    and backends without native aggregates are summarized inside one worker call.
+    """
+
+    def __init__(
+        self, backend: ItemRepositoryPort, executor: BoundedExecutor | None = None
+    ) -> None:
+        self._backend = backend
+        self._executor = executor
+
+    async def save(self, item: Item) -> Item:
+        return await self._run(self._backend.save, item)
+
+    async def save_many(self, items: Sequence[Item]) -> list[Item]:
+        return await self._run(self._backend.save_many, items)
+
+    async def get(self, item_id: str) -> Item | None:
+        return await self._run(self._backend.get, item_id)
+
+    async def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        return await self._run(self._backend.get_many, item_ids)
+
+    async def list(self) -> list[Item]:
+        return await self._run(self._backend.list)
+
+    async def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        return await self._run(self._backend.list_page, limit, cursor)
+
+    async def iter_items(self) -> AsyncIterator[Item]:
+        items = await self._run(self._backend.iter_items)
+        while batch := await self._run(_take, items, _ITER_BATCH):
+            for item in batch:
+                yield item
+
+    async def query(self, query: ItemQuery) -> list[Item]:
+        return await self._run(self._backend.query, query)
+
+    async def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        if isinstance(self._backend, ItemAggregationPort):
+            return await self._run(self._backend.aggregate, query)
+        return await self._run(_summarize, self._backend, query)
+
+    async def compact(self) -> CompactionReportDTO | None:
+        if isinstance(self._backend, ItemCompactionPort):
+            return await self._run(self._backend.compact)
+        return None
+
+    async def close(self) -> None:
+        close = getattr(self._backend, "close", None)
+        if close is not None:
+            await self._run(close)
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args)
+        return await self._executor.run(fn, *args)
+
+
+def _take(items: Iterator[Item], count: int) -> list[Item]:
+    return list(islice(items, count))
+
+
+def _summarize(backend: ItemRepositoryPort, query: ItemStatsQuery) -> ItemStatsDTO:
+    accumulator = ValueAccumulator(query.group_prefix)
+    accumulator.add_items(backend.iter_items())
+    return accumulator.result(query)
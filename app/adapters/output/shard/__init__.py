@@ -0,0 +1 @@
+"""Sharding repository decorators."""
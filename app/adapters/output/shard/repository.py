@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import heapq
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import chain
+from typing import TypeVar
+
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    ItemQuery,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
+from template.core.application.ports.output.repository_port import (
+    ItemCompactionPort,
+    ItemRepositoryPort,
+)
+from template.core.application.services.aggregation import ValueAccumulator
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+
+T = TypeVar("T")
+# Which side of the cursor's sort value a shard's items fall on: (shard, sort value).
+Anchor = tuple[int, object]
+
+
+def shard_of(item_id: str, shards: int) -> int:
+    """Stable shard number for an id; unlike ``hash``, CRC-32 is the same in every process."""
+    return zlib.crc32(item_id.encode()) % shards
+
+
+class ShardedItemRepository:
+    """Partition items across several repositories by a hash of their id.
+
+    Point reads and writes go to one shard; ``save_many`` and ``get_many`` make one call
+    per involved shard, and listing, queries and aggregates fan out over a thread pool
+    and merge. Unsorted results run shard by shard, each in insertion order; sorted
+    queries break ties by shard and then by insertion order within the shard, and
+    descending results are exactly the ascending ones reversed. After a
+    cursor, the other shards skip to the cursor's sort value with a value bound, or by
+    walking their name order for name-sorted queries.
+    """
+
+    def __init__(self, shards: Sequence[ItemRepositoryPort]) -> None:
+        if not shards:
+            raise ValueError("A sharded repository needs at least one shard.")
+        self._shards = list(shards)
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._shards), thread_name_prefix="item-shard"
+        )
+
+    @property
+    def shards(self) -> list[ItemRepositoryPort]:
+        return list(self._shards)
+
+    def save(self, item: Item) -> Item:
+        return self._shard_for(item.id).save(item)
+
+    def save_many(self, items: Sequence[Item]) -> list[Item]:
+        groups = self._group(items, lambda item: item.id)
+        self._map(lambda index, shard: shard.save_many(groups[index]), groups)
+        return list(items)
+
+    def get(self, item_id: str) -> Item | None:
+        return self._shard_for(item_id).get(item_id)
+
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]:
+        groups = self._group(dict.fromkeys(item_ids), lambda item_id: item_id)
+        pages = self._map(lambda index, shard: shard.get_many(groups[index]), groups)
+        found = {item.id: item for item in chain.from_iterable(pages)}
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    def list(self) -> list[Item]:
+        return list(chain.from_iterable(self._map(lambda index, shard: shard.list())))
+
+    def iter_items(self) -> Iterator[Item]:
+        for shard in self._shards:
+            yield from shard.iter_items()
+
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]:
+        first = 0 if cursor is None else shard_of(cursor, len(self._shards))
+        page: list[Item] = []
+        for index in range(first, len(self._shards)):
+            shard_cursor = cursor if index == first else None
+            page.extend(self._shards[index].list_page(limit - len(page), shard_cursor))
+            if len(page) >= limit:
+                break
+        return page
+
+    def query(self, query: ItemQuery) -> list[Item]:
+        if query.sort is None:
+            return self._query_in_shard_order(query)
+        anchor = None
+        if query.cursor is not None:
+            index = shard_of(query.cursor, len(self._shards))
+            cursor_item = self._shards[index].get(query.cursor)
+            if cursor_item is None:
+                raise InvalidCursorError(query.cursor)
+            anchor = (index, _sort_value(query, cursor_item))
+        pages = self._map(lambda index, shard: _page_after(shard, index, query, anchor))
+        merged = heapq.merge(
+            *(
+                [((_sort_value(query, item), index), item) for item in page]
+                for index, page in enumerate(pages)
+            ),
+            key=lambda entry: entry[0],
+            reverse=query.descending,
+        )
+        items = [item for _, item in merged]
+        return items if query.limit is None else items[: query.limit]
+
+    def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        # Percentiles cannot be combined from per-shard summaries, so shards contribute
+        # their values and one summary is computed over all of them.
+        def collect(index: int, shard: ItemRepositoryPort) -> ValueAccumulator:
+            accumulator = ValueAccumulator(query.group_prefix)
+            accumulator.add_items(shard.iter_items())
+            return accumulator
+
+        accumulators = self._map(collect)
+        for accumulator in accumulators[1:]:
+            accumulators[0].merge(accumulator)
+        return accumulators[0].result(query)
+
+    def compact(self) -> CompactionReportDTO | None:
+        """Compact every shard that supports it; ``None`` when none does."""
+        indexes = [
+            index
+            for index, shard in enumerate(self._shards)
+            if isinstance(shard, ItemCompactionPort)
+        ]
+        if not indexes:
+            return None
+        reports = self._map(lambda index, shard: shard.compact(), indexes)  # type: ignore[attr-defined]
+        return CompactionReportDTO(
+            items=sum(report.items for report in reports),
+            bytes_before=sum(report.bytes_before for report in reports),
+            bytes_after=sum(report.bytes_after for report in reports),
+            seconds=max(report.seconds for report in reports),
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        for shard in self._shards:
+            close = getattr(shard, "close", None)
+            if close is not None:
+                close()
+
+    def _shard_for(self, item_id: str) -> ItemRepositoryPort:
+        return self._shards[shard_of(item_id, len(self._shards))]
+
+    def _group(self, values: Iterable[T], key: Callable[[T], str]) -> dict[int, list[T]]:
+        groups: dict[int, list[T]] = {}
+        for value in values:
+            groups.setdefault(shard_of(key(value), len(self._shards)), []).append(value)
+        return groups
+
+    def _map(
+        self,
+        call: Callable[[int, ItemRepositoryPort], T],
+        indexes: Iterable[int] | None = None,
+    ) -> list[T]:
+        """Run ``call`` for the given shards (all by default) and return results in order."""
+        selected = list(range(len(self._shards)) if indexes is None else indexes)
+        if len(selected) == 1:
+            return [call(selected[0], self._shards[selected[0]])]
+        futures = [self._executor.submit(call, index, self._shards[index]) for index in selected]
+        return [future.result() for future in futures]
+
+    def _query_in_shard_order(self, query: ItemQuery) -> list[Item]:
+        # Descending insertion order is the ascending order reversed, shards included.
+        count = len(self._shards)
+        if query.cursor is not None:
+            first = shard_of(query.cursor, count)
+        else:
+            first = count - 1 if query.descending else 0
+        indexes = range(first, -1, -1) if query.descending else range(first, count)
+        pages = self._map(
+            lambda index, shard: shard.query(
+                replace(query, cursor=query.cursor if index == first else None)
+            ),
+            indexes,
+        )
+        items = list(chain.from_iterable(pages))
+        return items if query.limit is None else items[: query.limit]
+
+
+def _sort_value(query: ItemQuery, item: Item) -> object:
+    return item.name if query.sort == "name" else float(item.value)
+
+
+def _page_after(
+    shard: ItemRepositoryPort, index: int, query: ItemQuery, anchor: Anchor | None
+) -> list[Item]:
+    """The shard's first ``query.limit`` matches that sort after ``anchor``."""
+    if anchor is None or anchor[0] == index:
+        return shard.query(query)
+    anchor_index, anchor_value = anchor
+    # Ties with the cursor's sort value come after it only in shards merged later.
+    ties_follow = (index > anchor_index) != query.descending
+    bounded = replace(query, cursor=None)
+    if query.sort == "value":
+        if query.descending:
+            bounded.max_value = _tighter(query.max_value, anchor_value, min)
+        else:
+            bounded.min_value = _tighter(query.min_value, anchor_value, max)
+        if (
+            bounded.min_value is not None
+            and bounded.max_value is not None
+            and bounded.min_value > bounded.max_value
+        ):
+            return []
+
+    def follows(item: Item) -> bool:
+        value = _sort_value(query, item)
+        if value == anchor_value:
+            return ties_follow
+        return value < anchor_value if query.descending else value > anchor_value  # type: ignore[operator]
+
+    # The shard returns matches in sort order, so the ones that follow the anchor form
+    # a suffix; with a value bound only the ties in front of it are fetched and dropped.
+    result: list[Item] = []
+    while True:
+        page = shard.query(bounded)
+        result.extend(item for item in page if follows(item))
+        if query.limit is None or len(page) < query.limit or len(result) >= query.limit:
+            return result if query.limit is None else result[: query.limit]
+        bounded = replace(bounded, cursor=page[-1].id)
+
+
+def _tighter(bound: float | None, value: object, pick: Callable[[float, float], float]) -> float:
+    return float(value) if bound is None else pick(bound, float(value))  # type: ignore[arg-type]
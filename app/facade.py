@@ -1,10 +1,59 @@
 from __future__ import annotations
 
-from template.core.application.dtos.dto import ApplicationDTO, CreateItemDTO, ItemResponseDTO
-from template.core.application.ports.input.input_port import ItemInputPort
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
+from typing import Self
+
+from template.core.application.dtos.dto import (
+    ApplicationDTO,
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemBatchResultDTO,
+    ItemPageDTO,
+    ItemQuery,
+    ItemResponseDTO,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
+from template.core.application.ports.input.input_port import AsyncItemInputPort, ItemInputPort
 from template.core.application.use_cases import use_case
 
 
+def item_query(
+    name: str | None = None,
+    name_prefix: str | None = None,
+    min_value: float | None = None,
+    max_value: float | None = None,
+    sort: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> ItemQuery:
+    # A leading "-" on the sort field ("-value") sorts in descending order.
+    descending = sort is not None and sort.startswith("-")
+    return ItemQuery(
+        name=name,
+        name_prefix=name_prefix,
+        min_value=min_value,
+        max_value=max_value,
+        sort=sort[1:] if descending else sort,  # type: ignore[index]
+        descending=descending,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+def stats_query(
+    percentiles: Sequence[float] | None = None,
+    bins: int | None = None,
+    group_prefix: int | None = None,
+) -> ItemStatsQuery:
+    query = ItemStatsQuery(group_prefix=group_prefix)
+    if percentiles is not None:
+        query.percentiles = tuple(percentiles)
+    if bins is not None:
+        query.bins = bins
+    return query
+
+
 class AppFacade:
     def __init__(self, service: ItemInputPort) -> None:
         self._service = service
@@ -15,14 +64,148 @@ class AppFacade:
     def create_item(self, name: str, value: float) -> ItemResponseDTO:
         return self._service.create_item(CreateItemDTO(name=name, value=value))
 
+    def create_items(self, items: Iterable[tuple[str, float]]) -> list[ItemResponseDTO]:
+        return self._service.create_items(
+            [CreateItemDTO(name=name, value=value) for name, value in items]
+        )
+
+    def ingest_items(self, items: Iterable[tuple[str, float]]) -> ItemBatchResultDTO:
+        """Create the valid rows of ``items`` and report the others, keyed by row.
+
+        Values are checked by the domain service, so they may be anything a request
+        decoded to; the ones that are not numbers come back as errors.
+        """
+        return self._service.ingest_items(
+            [CreateItemDTO(name=name, value=value) for name, value in items]
+        )
+
     def get_item(self, item_id: str) -> ItemResponseDTO:
         return self._service.get_item(item_id)
 
+    def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]:
+        return self._service.get_items(item_ids)
+
     def list_items(self) -> list[ItemResponseDTO]:
         return self._service.list_items()
 
+    def iter_items(self) -> Iterator[ItemResponseDTO]:
+        return self._service.iter_items()
+
+    def list_items_page(self, limit: int | None = None, cursor: str | None = None) -> ItemPageDTO:
+        return self._service.list_items_page(limit, cursor)
+
+    def query_items(
+        self,
+        name: str | None = None,
+        name_prefix: str | None = None,
+        min_value: float | None = None,
+        max_value: float | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ItemPageDTO:
+        return self._service.query_items(
+            item_query(name, name_prefix, min_value, max_value, sort, limit, cursor)
+        )
+
+    def item_stats(
+        self,
+        percentiles: Sequence[float] | None = None,
+        bins: int | None = None,
+        group_prefix: int | None = None,
+    ) -> ItemStatsDTO:
+        return self._service.item_stats(stats_query(percentiles, bins, group_prefix))
+
+    def compact_storage(self) -> CompactionReportDTO | None:
+        return self._service.compact_storage()
+
     def produce(self, *, source_id: str) -> list[dict[str, object]]:
         return use_case.list_items(source_id=source_id)
 
     def consume(self, *, item: dict[str, object]) -> dict[str, object]:
         return use_case.process_item(item)
+
+
+class AsyncAppFacade:
+    """``AppFacade`` for async callers: every repository call is awaited.
+
+    ``close`` (or leaving ``async with``) releases what the repository holds open,
+    such as the aiosqlite connection thread.
+    """
+
+    def __init__(
+        self,
+        service: AsyncItemInputPort,
+        on_close: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        self._service = service
+        self._on_close = on_close
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._on_close is not None:
+            await self._on_close()
+
+    async def __call__(self, dto: ApplicationDTO) -> ItemResponseDTO:
+        return await self._service.create_item(dto)
+
+    async def create_item(self, name: str, value: float) -> ItemResponseDTO:
+        return await self._service.create_item(CreateItemDTO(name=name, value=value))
+
+    async def create_items(self, items: Iterable[tuple[str, float]]) -> list[ItemResponseDTO]:
+        return await self._service.create_items(
+            [CreateItemDTO(name=name, value=value) for name, value in items]
+        )
+
+    async def ingest_items(self, items: Iterable[tuple[str, float]]) -> ItemBatchResultDTO:
+        return await self._service.ingest_items(
+            [CreateItemDTO(name=name, value=value) for name, value in items]
+        )
+
+    async def get_item(self, item_id: str) -> ItemResponseDTO:
+        return await self._service.get_item(item_id)
+
+    async def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]:
+        return await self._service.get_items(item_ids)
+
+    async def list_items(self) -> list[ItemResponseDTO]:
+        return await self._service.list_items()
+
+    async def iter_items(self) -> AsyncIterator[ItemResponseDTO]:
+        async for item in self._service.iter_items():
+            yield item
+
+    async def list_items_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> ItemPageDTO:
+        return await self._service.list_items_page(limit, cursor)
+
+    async def query_items(
+        self,
+        name: str | None = None,
+        name_prefix: str | None = None,
+        min_value: float | None = None,
+        max_value: float | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> ItemPageDTO:
+        return await self._service.query_items(
+            item_query(name, name_prefix, min_value, max_value, sort, limit, cursor)
+        )
+
+    async def item_stats(
+        self,
+        percentiles: Sequence[float] | None = None,
+        bins: int | None = None,
+        group_prefix: int | None = None,
+    ) -> ItemStatsDTO:
+        return await self._service.item_stats(stats_query(percentiles, bins, group_prefix))
+
+    async def compact_storage(self) -> CompactionReportDTO | None:
+        return await self._service.compact_storage()
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from threading import Lock
+
 from template.app.facade import AppFacade
 from template.infrastructure.startup import bootstrap
 
 _facade: AppFacade | None = None
+_facade_lock = Lock()
 
 
 def get_facade() -> AppFacade:
     global _facade
+    # Double-checked so concurrent first requests, which run in parallel on a
+    # free-threaded build, bootstrap one facade and later calls take no lock.
     if _facade is None:
-        _facade = bootstrap()
+        with _facade_lock:
+            if _facade is None:
+                _facade = bootstrap()
     return _facade
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import socket
+from functools import partial
+
 try:
     from robyn import Robyn
 except ImportError:  # pragma: no cover - optional dependency
@@ -8,6 +11,8 @@ except ImportError:  # pragma: no cover - optional dependency
 from template.app.robyn.api.routes import create_router
 from template.app.robyn.dependencies import get_facade
 from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.prefork import PreforkSupervisor
 
 
 def create_app() -> object:
@@ -19,12 +24,33 @@ def create_app() -> object:
     return app
 
 
+def _serve(settings: Settings, sock: socket.socket | None = None) -> None:
+    # Robyn binds its own SO_REUSEPORT socket in every worker; ``sock`` is always None.
+    _ = sock
+    create_app().start(host=settings.web_host, port=settings.web_port)
+
+
 def run(argv: list[str] | None = None) -> int:
     _ = argv
     settings = Settings()
+    if settings.web_workers > 1:
+        try:
+            ContainerFactory(settings).check_process_safe()
+        except ValueError as exc:
+            print(f"Cannot start {settings.web_workers} web workers: {exc}")
+            return 1
     try:
-        app = create_app()
-        app.start(host=settings.web_host, port=settings.web_port)
+        if settings.web_workers > 1:
+            return PreforkSupervisor(
+                partial(_serve, settings),
+                settings.web_workers,
+                settings.web_host,
+                settings.web_port,
+                settings.web_drain_seconds,
+                reuse_port=True,
+                share_socket=False,
+            ).run()
+        _serve(settings)
     except PermissionError:
         print("Web server startup blocked by the current sandbox.")
     return 0
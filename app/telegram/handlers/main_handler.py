@@ -22,7 +22,7 @@ from template.app.adapters.input.telegram.adapter import TelegramInputAdapter
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from aiogram.types import Message
 
-    from template.app.facade import AppFacade
+    from template.app.facade import AsyncAppFacade
 
 
 router = Router()
@@ -30,14 +30,14 @@ adapter = TelegramInputAdapter()
 
 
 @router.message(CommandStart())
-async def start_handler(message: "Message", facade: "AppFacade") -> None:
-    item = facade(adapter.to_dto(message))
+async def start_handler(message: "Message", facade: "AsyncAppFacade") -> None:
+    item = await facade(adapter.to_dto(message))
     await message.answer(_format_response(item))
 
 
 @router.message()
-async def message_handler(message: "Message", facade: "AppFacade") -> None:
-    item = facade(adapter.to_dto(message))
+async def message_handler(message: "Message", facade: "AsyncAppFacade") -> None:
+    item = await facade(adapter.to_dto(message))
     await message.answer(_format_response(item))
 
 
@@ -11,7 +11,7 @@ except ImportError:  # pragma: no cover - optional dependency
 from template.app.telegram.handlers.main_handler import router
 from template.app.telegram.middlewares import InjectFacadeMiddleware
 from template.infrastructure.config.settings import Settings
-from template.infrastructure.startup import bootstrap
+from template.infrastructure.startup import bootstrap_async
 
 
 async def _run_polling() -> int:
@@ -25,9 +25,10 @@ async def _run_polling() -> int:
     dispatcher = Dispatcher()
 
     async def on_startup() -> None:
-        dispatcher.workflow_data["facade"] = bootstrap(settings)
+        dispatcher.workflow_data["facade"] = bootstrap_async(settings)
 
     async def on_shutdown() -> None:
+        await dispatcher.workflow_data["facade"].close()
         await bot.session.close()
 
     dispatcher.include_router(router)
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
 from template.app.adapters.input.rest.controller import RestController
-from template.app.facade import AppFacade
-from template.app.web.dependencies import get_facade
+from template.app.facade import AppFacade, AsyncAppFacade
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.executor import BoundedExecutor
+from template.infrastructure.startup import bootstrap_async
 
 
-def create_router(facade: AppFacade | None = None) -> object:
-    return RestController(facade or get_facade()).router
+def create_executor(settings: Settings) -> BoundedExecutor:
+    return BoundedExecutor(
+        settings.web_executor_workers,
+        settings.web_executor_queue_size,
+        thread_name_prefix="template-web",
+    )
+
+
+def create_router(
+    facade: AppFacade | AsyncAppFacade | None = None,
+    settings: Settings | None = None,
+    executor: BoundedExecutor | None = None,
+) -> object:
+    settings = settings or Settings()
+    executor = executor or create_executor(settings)
+    facade = facade or bootstrap_async(settings, executor)
+    return RestController(facade, executor=executor).router
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-import json
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socket
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
 
 try:
     from fastapi import FastAPI
@@ -14,73 +15,101 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     uvicorn = None
 
-from template.app.web.api.routes import create_router
+from template.app.adapters.input.rest.http_controller import HttpController
+from template.app.web.api.routes import create_executor, create_router
 from template.app.web.dependencies import get_facade
+from template.app.web.server import STDLIB_SERVERS, serve_asyncio, serve_threaded
 from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.prefork import PreforkSupervisor
+from template.infrastructure.startup import bootstrap_async
 
 
-def _build_fastapi_app() -> object:
-    app = FastAPI(title="Template API")
-    app.include_router(create_router())
-    return app
-
-
-def _serve_with_stdlib(host: str, port: int) -> int:
-    facade = get_facade()
-
-    class Handler(BaseHTTPRequestHandler):
-        def do_GET(self) -> None:  # noqa: N802
-            if self.path == "/items":
-                self._send(200, [asdict(item) for item in facade.list_items()])
-                return
-            if self.path.startswith("/items/"):
-                item_id = self.path.rsplit("/", 1)[-1]
-                try:
-                    self._send(200, asdict(facade.get_item(item_id)))
-                except Exception as exc:
-                    self._send(404, {"detail": str(exc)})
-                return
-            self._send(404, {"detail": "Not found"})
+def _build_fastapi_app(settings: Settings) -> object:
+    # Sync facade calls and blocking repositories share one bounded executor.
+    executor = create_executor(settings)
+    facade = bootstrap_async(settings, executor)
 
-        def do_POST(self) -> None:  # noqa: N802
-            if self.path != "/items":
-                self._send(404, {"detail": "Not found"})
-                return
-            length = int(self.headers.get("Content-Length", "0"))
-            payload = json.loads(self.rfile.read(length) or b"{}")
-            item = facade.create_item(str(payload["name"]), float(payload["value"]))
-            self._send(201, asdict(item))
+    @asynccontextmanager
+    async def lifespan(app: object) -> AsyncIterator[None]:
+        _ = app
+        try:
+            yield
+        finally:
+            await facade.close()
+            executor.shutdown(wait=False)
 
-        def log_message(self, format: str, *args: object) -> None:
-            _ = format, args
+    app = FastAPI(title="Template API", lifespan=lifespan)
+    app.include_router(create_router(facade, settings, executor))
+    return app
 
-        def _send(self, status: int, payload: object) -> None:
-            body = json.dumps(payload, ensure_ascii=True).encode()
-            self.send_response(status)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
 
-    server = ThreadingHTTPServer((host, port), Handler)
-    print(f"Serving on http://{host}:{port}")
+def _serve_with_stdlib(settings: Settings, sock: socket.socket | None = None) -> int:
+    if settings.web_stdlib_server not in STDLIB_SERVERS:
+        raise ValueError(
+            f"Unsupported stdlib server {settings.web_stdlib_server!r}; "
+            f"expected one of {', '.join(STDLIB_SERVERS)}."
+        )
+    controller = HttpController(get_facade())
+    if sock is None:
+        print(f"Serving on http://{settings.web_host}:{settings.web_port}")
     try:
-        server.serve_forever()
+        if settings.web_stdlib_server == "threaded":
+            serve_threaded(controller, settings.web_host, settings.web_port, sock)
+        else:
+            serve_asyncio(
+                controller,
+                settings.web_host,
+                settings.web_port,
+                settings.web_executor_workers,
+                settings.web_executor_queue_size,
+                settings.web_keepalive_seconds,
+                settings.web_drain_seconds,
+                sock,
+            )
     except KeyboardInterrupt:
         pass
-    finally:
-        server.server_close()
+    return 0
+
+
+def _serve(settings: Settings, sock: socket.socket | None = None) -> int:
+    if FastAPI is None or uvicorn is None:
+        return _serve_with_stdlib(settings, sock)
+    config = uvicorn.Config(
+        _build_fastapi_app(settings),
+        host=settings.web_host,
+        port=settings.web_port,
+        timeout_graceful_shutdown=int(settings.web_drain_seconds),
+    )
+    uvicorn.Server(config).run(sockets=None if sock is None else [sock])
     return 0
 
 
 def run(argv: list[str] | None = None) -> int:
     _ = argv
     settings = Settings()
+    if settings.web_workers > 1:
+        # Each worker builds its own facade after the fork.
+        try:
+            ContainerFactory(settings).check_process_safe()
+        except ValueError as exc:
+            print(f"Cannot start {settings.web_workers} web workers: {exc}")
+            return 1
     try:
-        if FastAPI is not None and uvicorn is not None:
-            uvicorn.run(_build_fastapi_app(), host=settings.web_host, port=settings.web_port)
-            return 0
-        return _serve_with_stdlib(settings.web_host, settings.web_port)
+        if settings.web_workers > 1:
+            supervisor = PreforkSupervisor(
+                partial(_serve, settings),
+                settings.web_workers,
+                settings.web_host,
+                settings.web_port,
+                settings.web_drain_seconds,
+            )
+            print(
+                f"Serving on http://{settings.web_host}:{settings.web_port} "
+                f"with {settings.web_workers} workers"
+            )
+            return supervisor.run()
+        return _serve(settings)
     except PermissionError:
         print("Web server startup blocked by the current sandbox.")
         return 0
@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import signal
+import socket
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable
+from dataclasses import dataclass
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from template.app.adapters.input.rest.http_controller import HttpController, HttpResponse
+from template.app.adapters.input.rest.ingest import BODY_SLICE_BYTES, BatchIngest
+from template.infrastructure.executor import BoundedExecutor
+from template.infrastructure.logging.logger import get_logger
+from template.infrastructure.serialization import dumps
+
+STDLIB_SERVERS = ("asyncio", "threaded")
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+logger = get_logger(__name__)
+
+
+class HttpProtocolError(Exception):
+    def __init__(self, status: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+@dataclass(slots=True)
+class _Request:
+    method: str
+    target: str
+    version: str
+    headers: dict[str, str]
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.1":
+            return "close" not in connection
+        return "keep-alive" in connection
+
+
+def _parse_head(head: bytes) -> _Request:
+    lines = head.lstrip(b"\r\n").decode("latin-1").split("\r\n")
+    parts = lines[0].split(" ")
+    if len(parts) != 3:
+        raise HttpProtocolError(400, "Malformed request line.")
+    method, target, version = parts
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        raise HttpProtocolError(505, f"Unsupported protocol version {version!r}.")
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, separator, value = line.partition(":")
+        if not separator:
+            raise HttpProtocolError(400, "Malformed header line.")
+        headers[name.strip().lower()] = value.strip()
+    return _Request(method, target, version, headers)
+
+
+_date_cache: tuple[int, str] = (0, "")
+
+
+def _http_date() -> str:
+    global _date_cache
+    now = int(time.time())
+    if _date_cache[0] != now:
+        _date_cache = (now, formatdate(now, usegmt=True))
+    return _date_cache[1]
+
+
+class AsyncHttpServer:
+    """HTTP/1.1 server on asyncio streams that serves an ``HttpController``.
+
+    Connections stay open between requests until they idle for ``keepalive_seconds``,
+    the client sends ``Connection: close`` or an HTTP/1.0 client did not ask for
+    keep-alive. Pipelined requests wait in the connection's read buffer and are answered
+    in order. The controller runs on ``executor``, so slow repository calls never block
+    the event loop and the executor's bound caps the requests in flight across all
+    connections. ``POST /items:batch`` bodies are fed to ``BatchIngest`` piece by piece
+    as they arrive, so a batch is saved chunk by chunk without buffering the body; other
+    bodies are read whole. Either way a body may wait on the client for at most
+    ``body_timeout_seconds`` in total, or the client gets a 408 and the connection is
+    closed. ``drain`` stops accepting, closes idle connections and gives requests in
+    flight ``drain_seconds`` to finish; ``serve_forever`` drains on SIGTERM.
+    """
+
+    def __init__(
+        self,
+        controller: HttpController,
+        executor: BoundedExecutor,
+        keepalive_seconds: float = 5.0,
+        max_body_bytes: int = MAX_BODY_BYTES,
+        drain_seconds: float = 30.0,
+        body_timeout_seconds: float = 30.0,
+    ) -> None:
+        self.controller = controller
+        self.executor = executor
+        self.keepalive_seconds = keepalive_seconds
+        self.max_body_bytes = max_body_bytes
+        self.drain_seconds = drain_seconds
+        self.body_timeout_seconds = body_timeout_seconds
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+        self._idle: set[asyncio.StreamWriter] = set()
+        self._draining = False
+
+    async def start(
+        self, host: str | None, port: int | None, sock: socket.socket | None = None
+    ) -> asyncio.Server:
+        """Listen on ``host:port``, or on ``sock`` when a listening socket is handed over."""
+        if sock is not None:
+            host = port = None
+        self._server = await asyncio.start_server(
+            self._serve_connection, host, port, sock=sock, limit=MAX_HEADER_BYTES
+        )
+        return self._server
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            raise RuntimeError("The server has not been started.")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(
+        self, host: str | None, port: int | None, sock: socket.socket | None = None
+    ) -> None:
+        await self.start(host, port, sock)
+        stopped = asyncio.Event()
+        # Signal handlers can only be installed from the main thread on Unix.
+        with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+        try:
+            await stopped.wait()
+        finally:
+            await self.drain()
+
+    async def drain(self) -> None:
+        self._draining = True
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._idle):
+            writer.close()
+        if self._connections:
+            _, pending = await asyncio.wait(self._connections, timeout=self.drain_seconds)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            while not self._draining and await self._serve_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _serve_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Answer one request; returns whether the connection stays open for another."""
+        self._idle.add(writer)
+        try:
+            async with asyncio.timeout(self.keepalive_seconds):
+                head = await reader.readuntil(b"\r\n\r\n")
+        except (TimeoutError, asyncio.IncompleteReadError):
+            return False
+        except asyncio.LimitOverrunError:
+            await self._write(writer, "HTTP/1.1", _error(431, "Request headers are too large."))
+            return False
+        finally:
+            self._idle.discard(writer)
+        try:
+            request = _parse_head(head)
+            if self.controller.streams_body(request.method, request.target):
+                return await self._serve_ingest(reader, writer, request)
+            body = b"".join([piece async for piece in self._body(reader, writer, request)])
+        except HttpProtocolError as exc:
+            await self._write(writer, "HTTP/1.1", _error(exc.status, exc.detail))
+            return False
+        except TimeoutError:
+            await self._write(writer, "HTTP/1.1", _error(408, "Request body timed out."))
+            return False
+        try:
+            response = await self.executor.run(
+                self.controller.handle, request.method, request.target, body
+            )
+        except Exception:
+            logger.exception("Unhandled error serving %s %s", request.method, request.target)
+            await self._write(writer, request.version, _error(500, "Internal server error"))
+            return False
+        keep_alive = request.keep_alive and not self._draining
+        return await self._write(writer, request.version, response, keep_alive)
+
+    async def _serve_ingest(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: _Request
+    ) -> bool:
+        ingest = BatchIngest()
+        try:
+            async for data in self._body(reader, writer, request):
+                for chunk in ingest.feed(data):
+                    await self.executor.run(self.controller.ingest_chunk, ingest, chunk)
+            for chunk in ingest.close():
+                await self.executor.run(self.controller.ingest_chunk, ingest, chunk)
+        except (HttpProtocolError, TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception:
+            logger.exception("Unhandled error serving %s %s", request.method, request.target)
+            await self._write(writer, request.version, _error(500, "Internal server error"))
+            return False
+        keep_alive = request.keep_alive and not self._draining
+        response = self.controller.ingest_response(ingest)
+        return await self._write(writer, request.version, response, keep_alive)
+
+    async def _body(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: _Request
+    ) -> AsyncIterator[bytes]:
+        budget = _ReadBudget(self.body_timeout_seconds)
+        if "chunked" in request.headers.get("transfer-encoding", "").lower():
+            self._continue(writer, request)
+            async for chunk in self._chunks(reader, budget):
+                yield chunk
+            return
+        try:
+            length = int(request.headers.get("content-length", "0"))
+        except ValueError as exc:
+            raise HttpProtocolError(400, "Invalid Content-Length header.") from exc
+        if length < 0:
+            raise HttpProtocolError(400, "Invalid Content-Length header.")
+        if length > self.max_body_bytes:
+            raise HttpProtocolError(413, "Request body is too large.")
+        if length:
+            self._continue(writer, request)
+        while length:
+            data = await budget.wait(reader.read(min(length, BODY_SLICE_BYTES)))
+            if not data:
+                raise asyncio.IncompleteReadError(b"", length)
+            length -= len(data)
+            yield data
+
+    async def _chunks(
+        self, reader: asyncio.StreamReader, budget: _ReadBudget
+    ) -> AsyncIterator[bytes]:
+        total = 0
+        while True:
+            line = await budget.wait(reader.readuntil(b"\r\n"))
+            try:
+                size = int(line.split(b";", 1)[0], 16)
+            except ValueError as exc:
+                raise HttpProtocolError(400, "Malformed chunk size.") from exc
+            if size == 0:
+                break
+            total += size
+            if total > self.max_body_bytes:
+                raise HttpProtocolError(413, "Request body is too large.")
+            data = await budget.wait(reader.readexactly(size + 2))
+            if data[-2:] != b"\r\n":
+                raise HttpProtocolError(400, "Malformed chunk.")
+            yield data[:-2]
+        # Trailer fields are read and ignored.
+        while await budget.wait(reader.readuntil(b"\r\n")) != b"\r\n":
+            pass
+
+    @staticmethod
+    def _continue(writer: asyncio.StreamWriter, request: _Request) -> None:
+        if request.headers.get("expect", "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        version: str,
+        response: HttpResponse,
+        keep_alive: bool = False,
+    ) -> bool:
+        status = HTTPStatus(response.status)
+        # HTTP/1.0 clients cannot read chunked bodies; their streams end at close instead.
+        chunked = response.stream is not None and version == "HTTP/1.1"
+        if response.stream is not None and not chunked:
+            keep_alive = False
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Date: {_http_date()}",
+            f"Content-Type: {response.media_type}",
+            "Connection: keep-alive" if keep_alive else "Connection: close",
+        ]
+        if response.stream is None:
+            lines.append(f"Content-Length: {len(response.body)}")
+        elif chunked:
+            lines.append("Transfer-Encoding: chunked")
+        lines.extend(f"{name}: {value}" for name, value in response.headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + response.body)
+        if response.stream is not None:
+            try:
+                while (chunk := await self.executor.run(next, response.stream, None)) is not None:
+                    writer.write(b"%x\r\n%b\r\n" % (len(chunk), chunk) if chunked else chunk)
+                    await writer.drain()
+            except ConnectionError:
+                raise
+            except Exception:
+                # The status line is already out; closing without the last chunk is the
+                # only way left to tell the client the body is incomplete.
+                logger.exception("Unhandled error streaming a %s response", status.value)
+                return False
+            if chunked:
+                writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return keep_alive
+
+
+@dataclass(slots=True)
+class _ReadBudget:
+    """Time a request body may spend waiting on the client, shared by all of its reads."""
+
+    seconds: float
+
+    async def wait(self, read: Awaitable[bytes]) -> bytes:
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(self.seconds):
+                return await read
+        finally:
+            self.seconds -= time.monotonic() - started
+
+
+def _error(status: int, detail: str) -> HttpResponse:
+    return HttpResponse(status, dumps({"detail": detail}))
+
+
+def serve_asyncio(
+    controller: HttpController,
+    host: str,
+    port: int,
+    workers: int,
+    queue_size: int | None = None,
+    keepalive_seconds: float = 5.0,
+    drain_seconds: float = 30.0,
+    sock: socket.socket | None = None,
+) -> None:
+    executor = BoundedExecutor(workers, queue_size, thread_name_prefix="template-web")
+    server = AsyncHttpServer(controller, executor, keepalive_seconds, drain_seconds=drain_seconds)
+    try:
+        asyncio.run(server.serve_forever(host, port, sock))
+    finally:
+        executor.shutdown(wait=False)
+
+
+def make_threaded_handler(controller: HttpController) -> type[BaseHTTPRequestHandler]:
+    """``BaseHTTPRequestHandler`` for ``ThreadingHTTPServer``: HTTP/1.0, a thread per request.
+
+    Request bodies are read whole before ``controller.handle`` runs, batch ingest included.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            self._dispatch()
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._dispatch()
+
+        def _dispatch(self) -> None:
+            length = int(self.headers.get("Content-Length", "0"))
+            body = self.rfile.read(length) if length else b""
+            response = controller.handle(self.command, self.path, body)
+            self.send_response(response.status)
+            self.send_header("Content-Type", response.media_type)
+            if response.stream is None:
+                self.send_header("Content-Length", str(len(response.body)))
+            else:
+                # HTTP/1.0 has no chunked encoding: the body runs until the connection closes.
+                self.close_connection = True
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            if response.stream is None:
+                self.wfile.write(response.body)
+                return
+            for chunk in response.stream:
+                self.wfile.write(chunk)
+
+        def log_message(self, format: str, *args: object) -> None:
+            _ = format, args
+
+    return Handler
+
+
+class _DrainingHTTPServer(ThreadingHTTPServer):
+    # Non-daemon request threads make ``server_close`` wait for requests in flight.
+    daemon_threads = False
+
+
+def serve_threaded(
+    controller: HttpController, host: str, port: int, sock: socket.socket | None = None
+) -> None:
+    handler = make_threaded_handler(controller)
+    server = _DrainingHTTPServer((host, port), handler, bind_and_activate=sock is None)
+    if sock is not None:
+        server.socket.close()
+        server.socket = sock
+        server.server_address = sock.getsockname()
+    if threading.current_thread() is threading.main_thread():
+        # ``shutdown`` blocks until ``serve_forever`` returns, so it cannot run in the
+        # handler itself, which interrupts ``serve_forever`` on this thread.
+        signal.signal(
+            signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start()
+        )
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
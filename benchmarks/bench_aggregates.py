@@ -0,0 +1,59 @@
+"""Compare computing item statistics client side against the aggregate use case.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_aggregates --items 1000000
+
+"client" lists every item through the facade and summarizes with ``statistics``, which is
+what callers did before ``item_stats`` existed. "native" goes through ``item_stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+from template.benchmarks._harness import print_table, timer
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.startup import bootstrap
+
+BACKENDS = ("memory", "columnar", "sqlite")
+PERCENTILES = (50.0, 90.0, 99.0)
+
+
+def run_backend(name: str, items: int, root: Path) -> list[object]:
+    facade = bootstrap(Settings(repository_type=name, sqlite_path=str(root / f"{name}.sqlite3")))
+    batch = 10_000
+    for start in range(0, items, batch):
+        facade.create_items(
+            (f"group-{index % 16}", float(index % 9973))
+            for index in range(start, min(start + batch, items))
+        )
+
+    with timer() as client:
+        values = [item.value for item in facade.list_items()]
+        _ = sum(values), min(values), max(values)
+        statistics.quantiles(values, n=100)
+    with timer() as native:
+        facade.item_stats(PERCENTILES, bins=20)
+    with timer() as grouped:
+        facade.item_stats(PERCENTILES, bins=20, group_prefix=8)
+    return [name, items, client() * 1000, native() * 1000, grouped() * 1000, client() / native()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [run_backend(name, args.items, Path(tmp)) for name in args.backends]
+    print_table(["backend", "items", "client ms", "native ms", "grouped ms", "speedup"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""Compare sync FastAPI endpoints with async endpoints on a dedicated executor.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_async_endpoints --clients 16 128 --delay-ms 20
+
+Needs FastAPI and httpx; requests go through ``httpx.ASGITransport`` in-process. The
+facade is wrapped in a stub that sleeps ``--delay-ms`` in every ``get_item`` call, like
+a slow repository would block on I/O. ``--clients`` concurrent clients fetch items
+by id, while a probe fetches a plain ``def`` route that never touches the facade, like
+a health check or a sync dependency would. With sync endpoints every slow call holds
+one of Starlette's 40 shared threads, so the probe queues behind them; with async
+endpoints the slow calls queue on the ``BoundedExecutor`` instead, whose peak depth
+is reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+try:
+    import httpx
+    from fastapi import APIRouter, FastAPI
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+    FastAPI = None
+
+from template.app.adapters.input.rest.controller import RestController, json_response
+from template.app.facade import AppFacade
+from template.benchmarks._harness import percentile, print_table
+from template.core.application.dtos.dto import ItemResponseDTO
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+
+SEED_ITEMS = 1000
+PROBE_INTERVAL_SECONDS = 0.01
+
+
+class SlowFacade:
+    def __init__(self, facade: AppFacade, delay: float) -> None:
+        self.facade = facade
+        self.delay = delay
+
+    def get_item(self, item_id: str) -> ItemResponseDTO:
+        time.sleep(self.delay)
+        return self.facade.get_item(item_id)
+
+
+def build_app(facade: SlowFacade, executor: BoundedExecutor | None) -> object:
+    app = FastAPI()
+    if executor is None:
+        router = APIRouter()
+
+        def get_item(item_id: str) -> object:
+            return json_response(facade.get_item(item_id))
+
+        router.add_api_route("/items/{item_id}", get_item, methods=["GET"])
+    else:
+        router = RestController(facade, executor=executor).router  # type: ignore[arg-type]
+    app.include_router(router)
+
+    def probe() -> object:
+        return json_response({"ok": True})
+
+    app.add_api_route("/probe", probe, methods=["GET"])
+    return app
+
+
+async def load(
+    app: object, ids: list[str], clients: int, requests: int
+) -> tuple[list[float], list[float], float]:
+    latencies: list[float] = []
+    probes: list[float] = []
+    done = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def fetch(offset: int, count: int) -> None:
+            for index in range(offset, offset + count):
+                started = time.perf_counter()
+                response = await client.get(f"/items/{ids[index % len(ids)]}")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        async def probe() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                (await client.get("/probe")).raise_for_status()
+                probes.append(time.perf_counter() - started)
+                await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+
+        prober = asyncio.create_task(probe())
+        per_client = requests // clients
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch(n * per_client, per_client) for n in range(clients)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+    return latencies, probes, elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[16, 128])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--queue-size", type=int, default=64)
+    args = parser.parse_args(argv)
+    if FastAPI is None or httpx is None:
+        print("This benchmark needs FastAPI and httpx.")
+        return 1
+
+    facade = ContainerFactory(Settings(repository_type="memory")).create_facade()
+    ids = [
+        item.id for item in facade.create_items((f"item-{i}", float(i)) for i in range(SEED_ITEMS))
+    ]
+    slow = SlowFacade(facade, args.delay_ms / 1000)
+    setups: list[tuple[str, int | None]] = [("sync def", None)]
+    setups += [("async def", workers) for workers in args.workers]
+    rows: list[list[object]] = []
+    for endpoints, workers in setups:
+        for clients in args.clients:
+            executor = None
+            if workers is not None:
+                executor = BoundedExecutor(workers, args.queue_size)
+            try:
+                latencies, probes, elapsed = asyncio.run(
+                    load(build_app(slow, executor), ids, clients, args.requests)
+                )
+                peak = "-" if executor is None else executor.stats().peak_queued
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            rows.append(
+                [
+                    endpoints,
+                    "anyio (40)" if workers is None else f"executor ({workers})",
+                    clients,
+                    len(latencies) / elapsed,
+                    percentile(latencies, 50) * 1000,
+                    percentile(latencies, 99) * 1000,
+                    percentile(probes, 99) * 1000,
+                    peak,
+                ]
+            )
+    print_table(
+        [
+            "endpoints",
+            "threads",
+            "clients",
+            "requests/s",
+            "p50 ms",
+            "p99 ms",
+            "probe p99 ms",
+            "peak queued",
+        ],
+        rows,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
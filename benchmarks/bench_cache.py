@@ -0,0 +1,102 @@
+"""Measure point reads with and without the caching repository on a skewed workload.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_cache --items 100000 --reads 50000
+
+Reads follow a Zipf-like distribution over the stored ids, so a small hot set receives
+most requests. Every backend is measured bare and behind ``CachingItemRepository``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from template.app.adapters.output.cache.repository import CachingItemRepository
+from template.benchmarks._harness import percentile, print_table
+from template.core.application.dtos.dto import CreateItemDTO
+from template.core.application.use_cases.use_case import CreateItemsUseCase
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+BACKENDS = ("sqlite", "ndjson")
+
+
+def build_settings(name: str, root: Path) -> Settings:
+    if name == "ndjson":
+        return Settings(
+            repository_type="file",
+            items_file_format="ndjson",
+            items_file_path=str(root / "items.ndjson"),
+        )
+    return Settings(repository_type=name, sqlite_path=str(root / f"{name}.sqlite3"))
+
+
+def zipf_ids(ids: list[str], reads: int, exponent: float, seed: int) -> list[str]:
+    weights = [1.0 / rank**exponent for rank in range(1, len(ids) + 1)]
+    return random.Random(seed).choices(ids, weights=weights, k=reads)
+
+
+def run_backend(name: str, args: argparse.Namespace, root: Path) -> list[list[object]]:
+    backend = ContainerFactory(build_settings(name, root)).create_repository()
+    create_many = CreateItemsUseCase(backend)
+    batch = 10_000
+    for start in range(0, args.items, batch):
+        create_many.execute(
+            [
+                CreateItemDTO(name=f"item-{index}", value=float(index))
+                for index in range(start, min(start + batch, args.items))
+            ]
+        )
+    ids = [item.id for item in backend.iter_items()]
+    workload = zipf_ids(ids, args.reads, args.exponent, seed=7)
+
+    rows = []
+    for label, repository in (
+        ("bare", backend),
+        ("cached", CachingItemRepository(backend, max_entries=args.cache_size)),
+    ):
+        samples = []
+        started = time.perf_counter()
+        for item_id in workload:
+            read_start = time.perf_counter()
+            repository.get(item_id)
+            samples.append(time.perf_counter() - read_start)
+        elapsed = time.perf_counter() - started
+        hit_rate = repository.stats.hit_rate * 100 if label == "cached" else 0.0
+        rows.append(
+            [
+                name,
+                label,
+                len(workload) / elapsed,
+                percentile(samples, 50) * 1_000_000,
+                percentile(samples, 99) * 1_000_000,
+                hit_rate,
+            ]
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=50_000)
+    parser.add_argument("--cache-size", type=int, default=1024)
+    parser.add_argument("--exponent", type=float, default=1.1)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    rows: list[list[object]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.backends:
+            rows.extend(run_backend(name, args, Path(tmp)))
+    print_table(["backend", "mode", "reads/s", "p50 us", "p99 us", "hit %"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
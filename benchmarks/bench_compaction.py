@@ -0,0 +1,68 @@
+"""Measure log compaction and how it changes the time to reopen the NDJSON item log.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_compaction --items 100000 --versions 5
+
+Every item is saved ``versions`` times, so the log holds that many records per live
+item. "open" loads the sidecar index and replays the tail; "replay" drops the sidecar
+first and parses the whole log, as after a lost or stale index.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from template.app.adapters.output.files.log import LogItemRepository
+from template.benchmarks._harness import print_table, timer
+from template.core.domain.entities.model import Item
+
+
+def reopen(path: Path, drop_index: bool) -> float:
+    if drop_index:
+        path.with_name(f"{path.name}.idx").unlink()
+    with timer() as elapsed:
+        repository = LogItemRepository(path)
+    repository.close()
+    return elapsed() * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--versions", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "items.ndjson"
+        repository = LogItemRepository(path)
+        ids = [f"item-{index}" for index in range(args.items)]
+        for version in range(args.versions):
+            repository.save_many(
+                [Item(name=item_id, value=float(version), id=item_id) for item_id in ids]
+            )
+        repository.close()
+        rows: list[list[object]] = [
+            ["before", path.stat().st_size, reopen(path, False), reopen(path, True), 0.0]
+        ]
+
+        repository = LogItemRepository(path)
+        report = repository.compact()
+        repository.close()
+        rows.append(
+            [
+                "after",
+                report.bytes_after,
+                reopen(path, False),
+                reopen(path, True),
+                report.seconds * 1000,
+            ]
+        )
+    print_table(["log", "bytes", "open ms", "replay ms", "compact ms"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+"""Measure repository throughput as the number of worker threads grows.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_concurrency --items 50000 --threads 1 2 4 8
+
+Each thread runs the same mix of point reads, saves and occasional full scans. The
+striped repository is measured with one stripe (a single global lock) and with the
+default stripe count, next to sqlite with one connection per thread. On a GIL build the
+gain from more threads is bounded by the share of work done outside the interpreter;
+free-threaded builds let the striped locks run in parallel.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from template.app.adapters.output.db.concurrent import StripedItemRepository
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.benchmarks._harness import print_table, timer
+from template.core.domain.entities.model import Item
+
+BACKENDS: dict[str, Callable[[Path], object]] = {
+    "striped-1": lambda root: StripedItemRepository(stripes=1),
+    "striped-16": lambda root: StripedItemRepository(stripes=16),
+    "sqlite": lambda root: SqliteItemRepository(root / "items.sqlite3"),
+}
+
+
+def worker(
+    repository: object, ids: list[str], operations: int, args: argparse.Namespace, seed: int
+) -> None:
+    rng = random.Random(seed)
+    for index in range(operations):
+        roll = rng.random()
+        if roll < args.scan_ratio:
+            repository.list()  # type: ignore[attr-defined]
+        elif roll < args.scan_ratio + args.write_ratio:
+            item_id = rng.choice(ids)
+            repository.save(Item(name="bench", value=float(index), id=item_id))  # type: ignore[attr-defined]
+        else:
+            repository.get(rng.choice(ids))  # type: ignore[attr-defined]
+
+
+def run(name: str, threads: int, args: argparse.Namespace, root: Path) -> float:
+    repository = BACKENDS[name](root / f"{name}-{threads}")
+    items = [Item(name="bench", value=float(index)) for index in range(args.items)]
+    repository.save_many(items)  # type: ignore[attr-defined]
+    ids = [item.id for item in items]
+    operations = args.operations // threads
+    pool = [
+        threading.Thread(target=worker, args=(repository, ids, operations, args, seed))
+        for seed in range(threads)
+    ]
+    with timer() as elapsed:
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    close = getattr(repository, "close", None)
+    if close is not None:
+        close()
+    return operations * threads / elapsed()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--scan-ratio", type=float, default=0.0005)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    rows: list[list[object]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.backends:
+            baseline = None
+            for threads in args.threads:
+                throughput = run(name, threads, args, Path(tmp))
+                baseline = baseline or throughput
+                rows.append([name, threads, throughput, throughput / baseline])
+    print_table(["backend", "threads", "ops/s", "speedup"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""Compare bytes per item and encode/decode speed of the whole-file item formats.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_file_formats --items 200000
+
+Each format writes the same items once through ``FileItemRepository.save_many`` and is
+then read back by a fresh repository, which is what every process start pays.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from template.app.adapters.output.files.file import FileItemRepository
+from template.benchmarks._harness import print_table, timer
+from template.core.domain.entities.model import Item
+
+FORMATS = (
+    ("json", "none"),
+    ("binary", "none"),
+    ("binary", "zlib"),
+    ("binary", "lzma"),
+)
+
+
+def run_format(items: list[Item], file_format: str, compression: str, path: Path) -> list[object]:
+    with timer() as encode:
+        FileItemRepository(path, file_format, compression).save_many(items)
+    with timer() as decode:
+        decoded = FileItemRepository(path, file_format).list()
+    assert len(decoded) == len(items)
+    size = path.stat().st_size
+    label = file_format if compression == "none" else f"{file_format}+{compression}"
+    return [
+        label,
+        size / len(items),
+        encode() * 1000,
+        decode() * 1000,
+        len(items) / decode(),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    items = [
+        Item(name=f"group-{index % 64}/item-{index}", value=index * 0.5)
+        for index in range(args.items)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [
+            run_format(items, file_format, compression, Path(tmp) / f"items-{index}")
+            for index, (file_format, compression) in enumerate(FORMATS)
+        ]
+    print_table(["format", "bytes/item", "encode ms", "decode ms", "decoded items/s"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
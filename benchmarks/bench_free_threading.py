@@ -0,0 +1,138 @@
+"""Compare thread scaling of the application service on GIL and free-threaded CPython.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_free_threading --python python3.14 python3.14t
+
+Each interpreter runs this module in a subprocess. There, 1..N threads share one
+facade built by ``ContainerFactory`` and run the same mix of ``create_item``,
+``get_item`` and ``list_items_page`` calls; the table reports throughput and speedup
+over one thread for every interpreter and repository. Interpreters that cannot be
+started are reported and skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from template.benchmarks._harness import print_table, timer
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+REPOSITORIES = ("memory", "striped")
+
+
+def run_mix(repository_type: str, threads: int, args: argparse.Namespace) -> float:
+    facade = ContainerFactory(Settings(repository_type=repository_type)).create_facade()
+    ids = [item.id for item in facade.create_items((f"seed-{i}", float(i)) for i in range(1000))]
+    operations = args.operations // threads
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        for index in range(operations):
+            roll = rng.random()
+            if roll < args.create_ratio:
+                facade.create_item(f"item-{seed}-{index}", float(index))
+            elif roll < args.create_ratio + args.list_ratio:
+                facade.list_items_page(limit=50, cursor=rng.choice(ids))
+            else:
+                facade.get_item(rng.choice(ids))
+
+    pool = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    with timer() as elapsed:
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    return operations * threads / elapsed()
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    for repository_type in args.repositories:
+        for threads in args.threads:
+            result = {
+                "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+                "gil": gil,
+                "repository": repository_type,
+                "threads": threads,
+                "ops": run_mix(repository_type, threads, args),
+            }
+            print(json.dumps(result), flush=True)
+
+
+def run_interpreter(python: str, argv: list[str]) -> list[dict[str, object]]:
+    # The package root is the parent of the ``template`` package directory.
+    package_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    command = [python, "-m", "template.benchmarks.bench_free_threading", "--worker", *argv]
+    try:
+        completed = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        print(f"skipping {python}: {exc}", file=sys.stderr)
+        return []
+    return [json.loads(line) for line in completed.stdout.splitlines() if line.startswith("{")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--python", nargs="+", default=[sys.executable])
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--create-ratio", type=float, default=0.1)
+    parser.add_argument("--list-ratio", type=float, default=0.05)
+    parser.add_argument(
+        "--repositories", nargs="+", default=list(REPOSITORIES), choices=list(REPOSITORIES)
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.worker:
+        run_worker(args)
+        return 0
+
+    worker_argv = [
+        "--operations",
+        str(args.operations),
+        "--threads",
+        *map(str, args.threads),
+        "--create-ratio",
+        str(args.create_ratio),
+        "--list-ratio",
+        str(args.list_ratio),
+        "--repositories",
+        *args.repositories,
+    ]
+    rows: list[list[object]] = []
+    for python in args.python:
+        results = run_interpreter(python, worker_argv)
+        baselines: dict[str, float] = {}
+        for result in results:
+            ops = float(result["ops"])  # type: ignore[arg-type]
+            baseline = baselines.setdefault(str(result["repository"]), ops)
+            rows.append(
+                [
+                    python,
+                    result["python"],
+                    "on" if result["gil"] else "off",
+                    result["repository"],
+                    result["threads"],
+                    ops,
+                    ops / baseline,
+                ]
+            )
+    print_table(
+        ["interpreter", "version", "GIL", "repository", "threads", "ops/s", "speedup"], rows
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
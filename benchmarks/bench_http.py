@@ -0,0 +1,152 @@
+"""Compare the threaded stdlib handler with the asyncio HTTP/1.1 server.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_http --clients 1 16 64 --requests 2000
+
+Each server runs in its own process over an in-memory repository seeded with items;
+``--clients`` concurrent clients fetch items by id. Against the threaded handler every
+request opens a new connection, since it speaks HTTP/1.0 and closes after each
+response. Against the asyncio server each client keeps one connection and either
+waits for every response (``keep-alive``) or writes ``--depth`` requests at a time
+(``pipelined``). Latency runs from writing a request to reading its whole response.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from http.server import ThreadingHTTPServer
+
+from template.app.adapters.input.rest.http_controller import HttpController
+from template.app.web.server import AsyncHttpServer, make_threaded_handler
+from template.benchmarks._harness import percentile, print_table
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+
+SEED_ITEMS = 1000
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connection bursts into SYN retransmits.
+    request_queue_size = 1024
+
+
+def serve(kind: str, workers: int, ready: multiprocessing.Queue) -> None:
+    facade = ContainerFactory(Settings(repository_type="memory")).create_facade()
+    ids = [
+        item.id for item in facade.create_items((f"item-{i}", float(i)) for i in range(SEED_ITEMS))
+    ]
+    controller = HttpController(facade)
+    if kind == "threaded":
+        server = _ThreadingServer(("127.0.0.1", 0), make_threaded_handler(controller))
+        ready.put((server.server_address[1], ids))
+        server.serve_forever()
+        return
+
+    async def main() -> None:
+        http = AsyncHttpServer(controller, BoundedExecutor(workers))
+        async with await http.start("127.0.0.1", 0) as listener:
+            ready.put((http.port, ids))
+            await listener.serve_forever()
+
+    asyncio.run(main())
+
+
+async def read_response(reader: asyncio.StreamReader) -> None:
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    await reader.readexactly(length)
+
+
+def request(item_id: str, version: str) -> bytes:
+    return f"GET /items/{item_id} {version}\r\nHost: bench\r\n\r\n".encode()
+
+
+async def client(
+    mode: str, port: int, ids: list[str], count: int, depth: int, latencies: list[float]
+) -> None:
+    if mode == "new connection":
+        for index in range(count):
+            started = time.perf_counter()
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request(ids[index % len(ids)], "HTTP/1.0"))
+            await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            writer.close()
+            await writer.wait_closed()
+        return
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    batch = depth if mode == "pipelined" else 1
+    for start in range(0, count, batch):
+        started = time.perf_counter()
+        writer.write(
+            b"".join(
+                request(ids[index % len(ids)], "HTTP/1.1")
+                for index in range(start, min(start + batch, count))
+            )
+        )
+        for _ in range(min(batch, count - start)):
+            await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load(
+    mode: str, port: int, ids: list[str], clients: int, requests: int, depth: int
+) -> list[float]:
+    latencies: list[float] = []
+    per_client = requests // clients
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(client(mode, port, ids, per_client, depth, latencies) for _ in range(clients))
+    )
+    elapsed = time.perf_counter() - started
+    return [
+        len(latencies) / elapsed,
+        percentile(latencies, 50) * 1000,
+        percentile(latencies, 99) * 1000,
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    runs = (
+        ("threaded", "new connection"),
+        ("asyncio", "keep-alive"),
+        ("asyncio", "pipelined"),
+    )
+    rows: list[list[object]] = []
+    for kind, mode in runs:
+        ready: multiprocessing.Queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=serve, args=(kind, args.workers, ready), daemon=True
+        )
+        process.start()
+        try:
+            port, ids = ready.get(timeout=30)
+            for clients in args.clients:
+                result = asyncio.run(load(mode, port, ids, clients, args.requests, args.depth))
+                rows.append([kind, mode, clients, *result])
+        finally:
+            process.terminate()
+            process.join()
+    print_table(["server", "connections", "clients", "requests/s", "p50 ms", "p99 ms"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""Compare random UUIDv4 ids with time-ordered UUIDv7 ids for generation and inserts.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_ids --items 1000000
+
+Random ids land all over the sqlite primary-key B-tree, so once it outgrows the page
+cache every insert touches a different page; time-ordered ids append at its right edge.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.benchmarks._harness import print_table, timer
+from template.core.domain.entities.model import Item
+from template.core.domain.services.ids import create_id_strategy
+
+
+def run(strategy: str, args: argparse.Namespace, root: Path) -> list[object]:
+    new_id = create_id_strategy(strategy)
+    with timer() as generate_time:
+        ids = [new_id() for _ in range(args.items)]
+    path = root / f"{strategy}.sqlite3"
+    repository = SqliteItemRepository(path)
+    with timer() as insert_time:
+        for start in range(0, args.items, args.batch):
+            repository.save_many(
+                [
+                    Item(name="bench", value=1.0, id=item_id)
+                    for item_id in ids[start : start + args.batch]
+                ]
+            )
+    repository.close()
+    return [
+        strategy,
+        args.items / generate_time(),
+        args.items / insert_time(),
+        path.stat().st_size / args.items,
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [run(strategy, args, Path(tmp)) for strategy in ("uuid4", "uuid7")]
+    print_table(["ids", "generated/s", "inserts/s", "bytes/item"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
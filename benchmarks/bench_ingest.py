@@ -0,0 +1,131 @@
+"""Measure ingest rate: one ``POST /items`` per item against ``POST /items:batch``.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_ingest --items 20000 --batch 100 1000
+
+Each run starts the asyncio stdlib server in its own process over a fresh repository
+and loads ``--items`` items through one keep-alive connection. ``single`` posts every
+item on its own, ``new connection`` does the same over a connection per item, like a
+client without keep-alive, and the batch modes send ``--batch`` items per request as a
+JSON array or as NDJSON. Batches are validated column by column and saved with one
+repository write per chunk, which is what separates the modes on sqlite, where every
+single insert commits its own transaction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from template.app.adapters.input.rest.http_controller import HttpController
+from template.app.web.server import AsyncHttpServer
+from template.benchmarks._harness import print_table
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+
+
+def serve(repository: str, directory: str, workers: int, ready: multiprocessing.Queue) -> None:
+    settings = Settings(repository_type=repository, sqlite_path=str(Path(directory) / "items.db"))
+    controller = HttpController(ContainerFactory(settings).create_facade())
+
+    async def main() -> None:
+        http = AsyncHttpServer(controller, BoundedExecutor(workers))
+        async with await http.start("127.0.0.1", 0) as listener:
+            ready.put(http.port)
+            await listener.serve_forever()
+
+    asyncio.run(main())
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    await reader.readexactly(length)
+    return int(head.split(b" ", 2)[1])
+
+
+def post(path: str, body: bytes, content_type: str = "application/json") -> bytes:
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: bench\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+def requests_for(mode: str, items: int, batch: int) -> list[bytes]:
+    rows = [{"name": f"item-{index}", "value": float(index)} for index in range(items)]
+    if mode in ("single", "new connection"):
+        return [post("/items", json.dumps(row).encode()) for row in rows]
+    chunks = [rows[start : start + batch] for start in range(0, items, batch)]
+    if mode == "batch json":
+        return [post("/items:batch", json.dumps(chunk).encode()) for chunk in chunks]
+    return [
+        post(
+            "/items:batch",
+            "".join(json.dumps(row) + "\n" for row in chunk).encode(),
+            "application/x-ndjson",
+        )
+        for chunk in chunks
+    ]
+
+
+async def load(mode: str, port: int, requests: list[bytes]) -> float:
+    started = time.perf_counter()
+    if mode == "new connection":
+        for request in requests:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            assert await read_response(reader) == 201
+            writer.close()
+            await writer.wait_closed()
+        return time.perf_counter() - started
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for request in requests:
+        writer.write(request)
+        assert await read_response(reader) == 201
+    writer.close()
+    await writer.wait_closed()
+    return time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repositories", nargs="+", default=["memory", "sqlite"])
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    runs = [("single", 1), ("new connection", 1)]
+    runs += [(mode, batch) for mode in ("batch json", "batch ndjson") for batch in args.batch]
+    rows: list[list[object]] = []
+    for repository in args.repositories:
+        for mode, batch in runs:
+            requests = requests_for(mode, args.items, batch)
+            with tempfile.TemporaryDirectory() as directory:
+                ready: multiprocessing.Queue = multiprocessing.Queue()
+                process = multiprocessing.Process(
+                    target=serve, args=(repository, directory, args.workers, ready), daemon=True
+                )
+                process.start()
+                try:
+                    elapsed = asyncio.run(load(mode, ready.get(timeout=30), requests))
+                finally:
+                    process.terminate()
+                    process.join()
+            rows.append([repository, mode, batch, len(requests) / elapsed, args.items / elapsed])
+    print_table(["repository", "mode", "batch", "requests/s", "items/s"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
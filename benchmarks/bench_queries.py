@@ -0,0 +1,80 @@
+"""Compare filtered/sorted item queries against listing everything and filtering client side.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_queries --items 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from template.app.adapters.output.db.columnar import ColumnarItemRepository
+from template.app.adapters.output.db.repository import InMemoryItemRepository
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.benchmarks._harness import percentile, print_table, timer
+from template.core.application.dtos.dto import ItemQuery
+from template.core.domain.entities.model import Item
+
+BACKENDS: dict[str, Callable[[Path], object]] = {
+    "memory": lambda root: InMemoryItemRepository(),
+    "columnar": lambda root: ColumnarItemRepository(),
+    "sqlite": lambda root: SqliteItemRepository(root / "items.sqlite3"),
+}
+QUERIES = {
+    "name": ItemQuery(name="item-42", limit=100),
+    "prefix": ItemQuery(name_prefix="item-99", limit=100),
+    "range": ItemQuery(min_value=5_000.0, max_value=5_010.0, limit=100),
+    "top-value": ItemQuery(sort="value", descending=True, limit=100),
+}
+
+
+def run_backend(name: str, items: list[Item], repeats: int) -> list[list[object]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = BACKENDS[name](Path(tmp))
+        with timer() as ingest:
+            for start in range(0, len(items), 10_000):
+                repository.save_many(items[start : start + 10_000])  # type: ignore[attr-defined]
+        with timer() as scan:
+            # What callers did before query(): list everything and filter client side.
+            [item for item in repository.list() if item.name == "item-42"]  # type: ignore[attr-defined]
+        rows = []
+        for label, query in QUERIES.items():
+            latencies = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                repository.query(query)  # type: ignore[attr-defined]
+                latencies.append((time.perf_counter() - start) * 1000)
+            rows.append(
+                [name, label, len(items) / ingest(), percentile(latencies, 50), scan() * 1000]
+            )
+        close = getattr(repository, "close", None)
+        if close is not None:
+            close()
+        return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    items = [
+        Item(name=f"item-{index % 1000}", value=float(index % 10_007))
+        for index in range(args.items)
+    ]
+    rows = []
+    for name in args.backends:
+        rows.extend(run_backend(name, items, args.repeats))
+    print_table(["backend", "query", "ingest/s", "query p50 ms", "list+filter ms"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
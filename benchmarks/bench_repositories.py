@@ -0,0 +1,112 @@
+"""Compare repository backends on ingest, cold open, point lookups and full scans.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_repositories --items 100000
+    python -m template.benchmarks.bench_repositories --items 1000000 --backends ndjson sqlite
+
+The JSON array backend rewrites the whole file on every save, so it is only run up to
+``--json-limit`` items.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.app.adapters.output.files.file import FileItemRepository
+from template.app.adapters.output.files.log import LogItemRepository
+from template.benchmarks._harness import percentile, print_table, timer
+from template.core.domain.entities.model import Item
+
+BACKENDS: dict[str, Callable[[Path], object]] = {
+    "json": lambda root: FileItemRepository(root / "items.json"),
+    "ndjson": lambda root: LogItemRepository(root / "items.ndjson"),
+    "sqlite": lambda root: SqliteItemRepository(root / "items.sqlite3"),
+}
+
+
+def _disk_bytes(root: Path) -> int:
+    return sum(path.stat().st_size for path in root.iterdir() if path.is_file())
+
+
+def _close(repository: object) -> None:
+    close = getattr(repository, "close", None)
+    if close is not None:
+        close()
+
+
+def run_backend(name: str, items: list[Item], lookups: int) -> list[object]:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        repository = BACKENDS[name](root)
+        with timer() as ingest:
+            for item in items:
+                repository.save(item)  # type: ignore[attr-defined]
+        _close(repository)
+
+        with timer() as cold_open:
+            repository = BACKENDS[name](root)
+            repository.get(items[0].id)  # type: ignore[attr-defined]
+
+        sample = random.sample(items, min(lookups, len(items)))
+        latencies: list[float] = []
+        for item in sample:
+            start = time.perf_counter()
+            repository.get(item.id)  # type: ignore[attr-defined]
+            latencies.append((time.perf_counter() - start) * 1e6)
+
+        with timer() as scan:
+            count = len(repository.list())  # type: ignore[attr-defined]
+        assert count == len(items)
+        _close(repository)
+
+        return [
+            name,
+            len(items),
+            len(items) / ingest(),
+            cold_open() * 1000,
+            percentile(latencies, 50),
+            percentile(latencies, 99),
+            scan() * 1000,
+            _disk_bytes(root) / len(items),
+        ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--json-limit", type=int, default=5_000)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    items = [Item(name=f"item-{index % 1000}", value=float(index)) for index in range(args.items)]
+    rows = []
+    for name in args.backends:
+        subset = items[: args.json_limit] if name == "json" else items
+        rows.append(run_backend(name, subset, args.lookups))
+
+    print_table(
+        [
+            "backend",
+            "items",
+            "ingest/s",
+            "open ms",
+            "get p50 us",
+            "get p99 us",
+            "list ms",
+            "B/item",
+        ],
+        rows,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
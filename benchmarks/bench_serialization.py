@@ -0,0 +1,76 @@
+"""Compare the old ``asdict`` + ``json.dumps`` response encoding with ``serialization.dumps``.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_serialization --page 100 --rounds 20000
+
+Each row encodes one response body the way a front end does per request: a single item,
+a page of items and an items stats document. ``stdlib`` is the cached per-class
+encoder path used when neither orjson nor msgspec is installed; the others appear only
+when their package is importable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Callable
+from dataclasses import asdict
+
+from template.benchmarks._harness import print_table, timer
+from template.core.application.dtos.dto import HistogramBinDTO, ItemResponseDTO, ItemStatsDTO
+from template.infrastructure.serialization import JSON_BACKENDS
+
+
+def legacy(payload: object) -> bytes:
+    if isinstance(payload, list):
+        return json.dumps([asdict(item) for item in payload], ensure_ascii=True).encode()
+    return json.dumps(asdict(payload), ensure_ascii=True).encode()  # type: ignore[call-overload]
+
+
+def build_payloads(page: int) -> dict[str, object]:
+    items = [
+        ItemResponseDTO(
+            id=f"0190a1b2-c3d4-7e5f-8a6b-{index:012x}", name=f"item-{index}", value=index * 1.5
+        )
+        for index in range(page)
+    ]
+    stats = ItemStatsDTO(
+        count=page,
+        sum=1.0,
+        mean=1.0,
+        min=0.0,
+        max=2.0,
+        percentiles={"p50": 1.0, "p90": 1.8, "p99": 1.98},
+        histogram=[HistogramBinDTO(i / 5, (i + 1) / 5, 1) for i in range(10)],
+    )
+    return {"item": items[0], f"page of {page}": items, "stats": stats}
+
+
+def per_request_us(encode: Callable[[object], bytes], payload: object, rounds: int) -> float:
+    with timer() as elapsed:
+        for _ in range(rounds):
+            encode(payload)
+    return elapsed() / rounds * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    encoders = {"asdict+json.dumps": legacy, **JSON_BACKENDS}
+    rows: list[list[object]] = []
+    for shape, payload in build_payloads(args.page).items():
+        rounds = args.rounds if isinstance(payload, ItemResponseDTO) else args.rounds // 10
+        baseline = per_request_us(legacy, payload, rounds)
+        for name, encode in encoders.items():
+            elapsed = baseline if encode is legacy else per_request_us(encode, payload, rounds)
+            rows.append([shape, name, elapsed, baseline / elapsed])
+    print_table(["payload", "encoder", "us/request", "speedup"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
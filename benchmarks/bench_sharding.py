@@ -0,0 +1,90 @@
+"""Compare one store against hash-sharded stores for writes, point reads and fan-out reads.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_sharding --items 200000 --shards 1 4 8
+
+Every backend is built through ``ContainerFactory`` with ``shard_count`` set, so the
+sharded runs use one file or database per shard. Listing, queries and aggregates fan
+out over the shard thread pool, so their gains depend on how much of each shard's work
+runs outside the GIL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from template.benchmarks._harness import print_table, timer
+from template.core.application.dtos.dto import ItemQuery, ItemStatsQuery
+from template.core.application.use_cases.use_case import AggregateItemsUseCase
+from template.core.domain.entities.model import Item
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+BACKENDS = ("memory", "sqlite", "ndjson")
+
+
+def build_settings(name: str, root: Path, shards: int) -> Settings:
+    if name == "ndjson":
+        return Settings(
+            repository_type="file",
+            items_file_format="ndjson",
+            items_file_path=str(root / "items.ndjson"),
+            shard_count=shards,
+        )
+    return Settings(
+        repository_type=name, sqlite_path=str(root / "items.sqlite3"), shard_count=shards
+    )
+
+
+def run(name: str, shards: int, args: argparse.Namespace) -> list[object]:
+    items = [Item(name=f"group-{index % 100}", value=float(index)) for index in range(args.items)]
+    reads = random.Random(7).choices([item.id for item in items], k=args.reads)
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = ContainerFactory(build_settings(name, Path(tmp), shards)).create_repository()
+        with timer() as save_time:
+            for start in range(0, len(items), 10_000):
+                repository.save_many(items[start : start + 10_000])
+        with timer() as get_time:
+            for item_id in reads:
+                repository.get(item_id)
+        with timer() as list_time:
+            repository.list()
+        with timer() as query_time:
+            repository.query(ItemQuery(sort="value", descending=True, limit=100))
+        with timer() as stats_time:
+            AggregateItemsUseCase(repository).execute(ItemStatsQuery(group_prefix=8))
+        close = getattr(repository, "close", None)
+        if close is not None:
+            close()
+    return [
+        name,
+        shards,
+        args.items / save_time(),
+        args.reads / get_time(),
+        list_time() * 1000,
+        query_time() * 1000,
+        stats_time() * 1000,
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    rows = [run(name, shards, args) for name in args.backends for shards in args.shards]
+    print_table(
+        ["backend", "shards", "saves/s", "gets/s", "list ms", "top-100 ms", "stats ms"], rows
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
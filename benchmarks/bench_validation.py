@@ -0,0 +1,81 @@
+"""Compare per-row item creation with batch validation in ``ItemDomainService``.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_validation --rows 1000000 --bad 0 0.01 0.1
+
+The per-row path calls ``create`` and catches ``ItemValidationError`` for each bad row,
+as a bulk loader built on it would; the batch path is one ``create_many`` call. Both
+issue UUIDv7 ids.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+
+from template.benchmarks._harness import print_table, timer
+from template.core.domain.exceptions.exception import ItemValidationError
+from template.core.domain.services.ids import create_id_strategy
+from template.core.domain.services.service import ItemDomainService
+
+
+def build_rows(count: int, bad: float, seed: int) -> tuple[list[str], list[object]]:
+    rng = random.Random(seed)
+    names: list[str] = []
+    values: list[object] = []
+    for index in range(count):
+        name, value = f"item-{index}", float(index)
+        if rng.random() < bad:
+            kind = rng.randrange(3)
+            if kind == 0:
+                name = " "
+            elif kind == 1:
+                value = math.nan
+            else:
+                value = "n/a"
+        names.append(name)
+        values.append(value)
+    return names, values
+
+
+def per_row(service: ItemDomainService, names: list[str], values: list[object]) -> int:
+    errors = 0
+    for name, value in zip(names, values):
+        try:
+            service.create(name, value)  # type: ignore[arg-type]
+        except (ItemValidationError, ValueError):
+            errors += 1
+    return errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--bad", type=float, nargs="+", default=[0.0, 0.01, 0.1])
+    args = parser.parse_args(argv)
+
+    service = ItemDomainService(create_id_strategy("uuid7"))
+    rows: list[list[object]] = []
+    for bad in args.bad:
+        names, values = build_rows(args.rows, bad, seed=7)
+        with timer() as row_time:
+            row_errors = per_row(service, names, values)
+        with timer() as batch_time:
+            batch = service.create_many(names, values)
+        assert row_errors == len(batch.errors)
+        rows.append(
+            [
+                f"{bad:.0%}",
+                args.rows / row_time(),
+                args.rows / batch_time(),
+                row_time() / batch_time(),
+            ]
+        )
+    print_table(["bad rows", "per-row rows/s", "batch rows/s", "speedup"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
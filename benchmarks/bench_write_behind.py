@@ -0,0 +1,55 @@
+"""Compare per-request saves to the JSON file repository with and without write-behind.
+
+Run with the package importable, for example::
+
+    python -m template.benchmarks.bench_write_behind --items 2000
+
+Every save is a separate ``save`` call, as ``POST /items`` issues them. The bare file
+repository rewrites the whole file per call; the write-behind layer rewrites it once per
+``batch`` saves.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from template.app.adapters.output.buffer.repository import WriteBehindItemRepository
+from template.app.adapters.output.files.file import FileItemRepository
+from template.benchmarks._harness import print_table, timer
+from template.core.domain.entities.model import Item
+
+
+def run(items: int, batch: int | None, path: Path) -> list[object]:
+    backend = FileItemRepository(path)
+    repository = (
+        backend
+        if batch is None
+        else WriteBehindItemRepository(backend, max_items=batch, max_delay_seconds=None)
+    )
+    with timer() as elapsed:
+        for index in range(items):
+            repository.save(Item(name=f"item-{index}", value=float(index)))
+        if isinstance(repository, WriteBehindItemRepository):
+            repository.close()
+    assert len(backend.list()) == items
+    return ["bare" if batch is None else f"batch {batch}", items, items / elapsed()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2_000)
+    parser.add_argument("--batches", nargs="+", type=int, default=[10, 100, 1000])
+    args = parser.parse_args(argv)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for index, batch in enumerate([None, *args.batches]):
+            rows.append(run(args.items, batch, Path(tmp) / f"items-{index}.json"))
+    print_table(["mode", "items", "saves/s"], rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from template.core.domain.entities.model import Item
 
@@ -23,3 +23,67 @@ class ItemResponseDTO:
     @classmethod
     def from_item(cls, item: Item) -> "ItemResponseDTO":
         return cls(id=item.id, name=item.name, value=item.value)
+
+
+@dataclass(slots=True)
+class ItemBatchResultDTO:
+    """Created items of a batch in row order, and the validation message of each bad row."""
+
+    items: list[ItemResponseDTO]
+    errors: dict[int, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ItemPageDTO:
+    items: list[ItemResponseDTO]
+    next_cursor: str | None
+
+
+@dataclass(slots=True)
+class ItemQuery:
+    name: str | None = None
+    name_prefix: str | None = None
+    min_value: float | None = None
+    max_value: float | None = None
+    sort: str | None = None
+    descending: bool = False
+    limit: int | None = None
+    cursor: str | None = None
+
+
+@dataclass(slots=True)
+class ItemStatsQuery:
+    percentiles: tuple[float, ...] = (50.0, 90.0, 99.0)
+    bins: int = 10
+    group_prefix: int | None = None
+
+
+@dataclass(slots=True)
+class HistogramBinDTO:
+    lower: float
+    upper: float
+    count: int
+
+
+@dataclass(slots=True)
+class ItemStatsDTO:
+    count: int
+    sum: float
+    mean: float | None
+    min: float | None
+    max: float | None
+    percentiles: dict[str, float]
+    histogram: list[HistogramBinDTO]
+    groups: dict[str, ItemStatsDTO] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class CompactionReportDTO:
+    items: int
+    bytes_before: int
+    bytes_after: int
+    seconds: float
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.bytes_before - self.bytes_after
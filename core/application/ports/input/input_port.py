@@ -1,11 +1,47 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator, Sequence
 from typing import Protocol
 
-from template.core.application.dtos.dto import CreateItemDTO, ItemResponseDTO
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemBatchResultDTO,
+    ItemPageDTO,
+    ItemQuery,
+    ItemResponseDTO,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
 
 
 class ItemInputPort(Protocol):
     def create_item(self, dto: CreateItemDTO) -> ItemResponseDTO: ...
+    def create_items(self, dtos: Sequence[CreateItemDTO]) -> list[ItemResponseDTO]: ...
+    def ingest_items(self, dtos: Sequence[CreateItemDTO]) -> ItemBatchResultDTO: ...
     def get_item(self, item_id: str) -> ItemResponseDTO: ...
+    def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]: ...
     def list_items(self) -> list[ItemResponseDTO]: ...
+    def iter_items(self) -> Iterator[ItemResponseDTO]: ...
+    def list_items_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> ItemPageDTO: ...
+    def query_items(self, query: ItemQuery) -> ItemPageDTO: ...
+    def item_stats(self, query: ItemStatsQuery) -> ItemStatsDTO: ...
+    def compact_storage(self) -> CompactionReportDTO | None: ...
+
+
+class AsyncItemInputPort(Protocol):
+    async def create_item(self, dto: CreateItemDTO) -> ItemResponseDTO: ...
+    async def create_items(self, dtos: Sequence[CreateItemDTO]) -> list[ItemResponseDTO]: ...
+    async def ingest_items(self, dtos: Sequence[CreateItemDTO]) -> ItemBatchResultDTO: ...
+    async def get_item(self, item_id: str) -> ItemResponseDTO: ...
+    async def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]: ...
+    async def list_items(self) -> list[ItemResponseDTO]: ...
+    def iter_items(self) -> AsyncIterator[ItemResponseDTO]: ...
+    async def list_items_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> ItemPageDTO: ...
+    async def query_items(self, query: ItemQuery) -> ItemPageDTO: ...
+    async def item_stats(self, query: ItemStatsQuery) -> ItemStatsDTO: ...
+    async def compact_storage(self) -> CompactionReportDTO | None: ...
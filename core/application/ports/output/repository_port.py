@@ -1,11 +1,55 @@
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Protocol, runtime_checkable
 
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    ItemQuery,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
 from template.core.domain.entities.model import Item
 
 
 class ItemRepositoryPort(Protocol):
     def save(self, item: Item) -> Item: ...
+    def save_many(self, items: Sequence[Item]) -> list[Item]: ...
     def get(self, item_id: str) -> Item | None: ...
+    def get_many(self, item_ids: Sequence[str]) -> list[Item]: ...
     def list(self) -> list[Item]: ...
+    def list_page(self, limit: int, cursor: str | None = None) -> list[Item]: ...
+    def iter_items(self) -> Iterator[Item]: ...
+    def query(self, query: ItemQuery) -> list[Item]: ...
+
+
+@runtime_checkable
+class ItemAggregationPort(Protocol):
+    def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO: ...
+
+
+@runtime_checkable
+class ItemCompactionPort(Protocol):
+    def compact(self) -> CompactionReportDTO: ...
+
+
+class AsyncItemRepositoryPort(Protocol):
+    async def save(self, item: Item) -> Item: ...
+    async def save_many(self, items: Sequence[Item]) -> list[Item]: ...
+    async def get(self, item_id: str) -> Item | None: ...
+    async def get_many(self, item_ids: Sequence[str]) -> list[Item]: ...
+    async def list(self) -> list[Item]: ...
+    async def list_page(self, limit: int, cursor: str | None = None) -> list[Item]: ...
+    def iter_items(self) -> AsyncIterator[Item]: ...
+    async def query(self, query: ItemQuery) -> list[Item]: ...
+
+
+@runtime_checkable
+class AsyncItemAggregationPort(Protocol):
+    async def aggregate(self, query: ItemStatsQuery) -> ItemStatsDTO: ...
+
+
+@runtime_checkable
+class AsyncItemCompactionPort(Protocol):
+    # ``None`` when the storage behind an adapter has nothing to compact.
+    async def compact(self) -> CompactionReportDTO | None: ...
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from math import floor, fsum
+
+from template.core.application.dtos.dto import HistogramBinDTO, ItemStatsDTO, ItemStatsQuery
+from template.core.domain.entities.model import Item
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def empty_stats() -> ItemStatsDTO:
+    return ItemStatsDTO(
+        count=0, sum=0.0, mean=None, min=None, max=None, percentiles={}, histogram=[]
+    )
+
+
+def histogram_edges(lower: float, upper: float, bins: int) -> list[float]:
+    # Same convention as numpy.histogram: a single distinct value gets a unit-wide range.
+    if lower == upper:
+        lower, upper = lower - 0.5, upper + 0.5
+    width = upper - lower
+    return [lower + width * index / bins for index in range(bins)] + [upper]
+
+
+def histogram_scale(edges: Sequence[float]) -> float:
+    """Multiplier that maps ``value - edges[0]`` to a bin number."""
+    return (len(edges) - 1) / (edges[-1] - edges[0])
+
+
+def percentile_position(count: int, percentile: float) -> tuple[int, float]:
+    """Index of the lower neighbour and interpolation weight, as numpy's ``linear`` method."""
+    rank = (count - 1) * percentile / 100.0
+    index = floor(rank)
+    return index, rank - index
+
+
+def interpolate(lower: float, upper: float, weight: float) -> float:
+    return lower + (upper - lower) * weight if weight else lower
+
+
+def build_stats(
+    count: int,
+    total: float,
+    lower: float,
+    upper: float,
+    percentiles: Sequence[float],
+    bin_counts: Sequence[int],
+    edges: Sequence[float],
+    query: ItemStatsQuery,
+) -> ItemStatsDTO:
+    return ItemStatsDTO(
+        count=count,
+        sum=total,
+        mean=total / count,
+        min=lower,
+        max=upper,
+        percentiles={
+            f"p{percentile:g}": value for percentile, value in zip(query.percentiles, percentiles)
+        },
+        histogram=[
+            HistogramBinDTO(lower=edges[index], upper=edges[index + 1], count=bin_count)
+            for index, bin_count in enumerate(bin_counts)
+        ],
+    )
+
+
+def summarize(values: Sequence[float], query: ItemStatsQuery) -> ItemStatsDTO:
+    """Summarize a float column; vectorized with NumPy when it is installed."""
+    if not len(values):
+        return empty_stats()
+    if np is None:
+        return _summarize_sorted(sorted(values), query)
+    column = np.asarray(values, dtype=np.float64)
+    lower, upper = float(column.min()), float(column.max())
+    edges = histogram_edges(lower, upper, query.bins)
+    bins = ((column - edges[0]) * histogram_scale(edges)).astype(np.intp)
+    np.minimum(bins, query.bins - 1, out=bins)
+    return build_stats(
+        len(column),
+        float(column.sum()),
+        lower,
+        upper,
+        np.percentile(column, query.percentiles).tolist() if query.percentiles else [],
+        np.bincount(bins, minlength=query.bins).tolist(),
+        edges,
+        query,
+    )
+
+
+def summarize_columns(
+    values: Sequence[float],
+    name_refs: Sequence[int],
+    names: Sequence[str],
+    query: ItemStatsQuery,
+) -> ItemStatsDTO:
+    """Summarize a value column whose rows point into an interned name table."""
+    stats = summarize(values, query)
+    if query.group_prefix is None:
+        return stats
+    keys = sorted({name[: query.group_prefix] for name in names})
+    key_codes = {key: code for code, key in enumerate(keys)}
+    name_codes = [key_codes[name[: query.group_prefix]] for name in names]
+    if np is None:
+        grouped: dict[str, array[float]] = {key: array("d") for key in keys}
+        for value, name_ref in zip(values, name_refs):
+            grouped[keys[name_codes[name_ref]]].append(value)
+        stats.groups = {key: summarize(column, query) for key, column in grouped.items() if column}
+        return stats
+    codes = np.asarray(name_codes, dtype=np.intp)[np.asarray(name_refs, dtype=np.intp)]
+    column = np.asarray(values, dtype=np.float64)
+    for code in np.unique(codes).tolist():
+        stats.groups[keys[code]] = summarize(column[codes == code], query)
+    return stats
+
+
+class ValueAccumulator:
+    """Collects item values, optionally per name prefix, during one streaming pass."""
+
+    def __init__(self, group_prefix: int | None = None) -> None:
+        self._group_prefix = group_prefix
+        self._values = array("d")
+        self._groups: dict[str, array[float]] = {}
+
+    def add_items(self, items: Iterable[Item]) -> None:
+        if self._group_prefix is None:
+            self._values.extend(float(item.value) for item in items)
+            return
+        for item in items:
+            self.add(item.name, item.value)
+
+    def add(self, name: str, value: float) -> None:
+        self._values.append(value)
+        if self._group_prefix is not None:
+            key = name[: self._group_prefix]
+            column = self._groups.get(key)
+            if column is None:
+                column = self._groups[key] = array("d")
+            column.append(value)
+
+    def merge(self, other: ValueAccumulator) -> None:
+        """Add the values collected by ``other``, e.g. from another partition."""
+        self._values.extend(other._values)
+        for key, values in other._groups.items():
+            column = self._groups.get(key)
+            if column is None:
+                column = self._groups[key] = array("d")
+            column.extend(values)
+
+    def result(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        stats = summarize(self._values, query)
+        stats.groups = {key: summarize(self._groups[key], query) for key in sorted(self._groups)}
+        return stats
+
+
+def _summarize_sorted(ordered: list[float], query: ItemStatsQuery) -> ItemStatsDTO:
+    lower, upper = ordered[0], ordered[-1]
+    edges = histogram_edges(lower, upper, query.bins)
+    scale = histogram_scale(edges)
+    bin_counts = [0] * query.bins
+    last_bin = query.bins - 1
+    for value in ordered:
+        bin_counts[min(int((value - edges[0]) * scale), last_bin)] += 1
+    percentiles = []
+    for percentile in query.percentiles:
+        index, weight = percentile_position(len(ordered), percentile)
+        upper_index = min(index + 1, len(ordered) - 1)
+        percentiles.append(interpolate(ordered[index], ordered[upper_index], weight))
+    return build_stats(
+        len(ordered), fsum(ordered), lower, upper, percentiles, bin_counts, edges, query
+    )
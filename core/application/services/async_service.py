@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemBatchResultDTO,
+    ItemPageDTO,
+    ItemQuery,
+    ItemResponseDTO,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
+from template.core.application.use_cases.async_use_case import (
+    AsyncAggregateItemsUseCase,
+    AsyncCompactStorageUseCase,
+    AsyncCreateItemsUseCase,
+    AsyncCreateItemUseCase,
+    AsyncGetItemsUseCase,
+    AsyncGetItemUseCase,
+    AsyncIngestItemsUseCase,
+    AsyncListItemsPageUseCase,
+    AsyncListItemsUseCase,
+    AsyncQueryItemsUseCase,
+    AsyncStreamItemsUseCase,
+)
+
+
+class AsyncApplicationService:
+    def __init__(
+        self,
+        create_use_case: AsyncCreateItemUseCase,
+        get_use_case: AsyncGetItemUseCase,
+        list_use_case: AsyncListItemsUseCase,
+        create_many_use_case: AsyncCreateItemsUseCase,
+        get_many_use_case: AsyncGetItemsUseCase,
+        list_page_use_case: AsyncListItemsPageUseCase,
+        stream_use_case: AsyncStreamItemsUseCase,
+        stats_use_case: AsyncAggregateItemsUseCase,
+        query_use_case: AsyncQueryItemsUseCase,
+        compact_use_case: AsyncCompactStorageUseCase,
+        ingest_use_case: AsyncIngestItemsUseCase,
+    ) -> None:
+        self._create_use_case = create_use_case
+        self._get_use_case = get_use_case
+        self._list_use_case = list_use_case
+        self._create_many_use_case = create_many_use_case
+        self._get_many_use_case = get_many_use_case
+        self._list_page_use_case = list_page_use_case
+        self._stream_use_case = stream_use_case
+        self._stats_use_case = stats_use_case
+        self._query_use_case = query_use_case
+        self._compact_use_case = compact_use_case
+        self._ingest_use_case = ingest_use_case
+
+    async def create_item(self, dto: CreateItemDTO) -> ItemResponseDTO:
+        return ItemResponseDTO.from_item(await self._create_use_case.execute(dto))
+
+    async def create_items(self, dtos: Sequence[CreateItemDTO]) -> list[ItemResponseDTO]:
+        return [
+            ItemResponseDTO.from_item(item)
+            for item in await self._create_many_use_case.execute(dtos)
+        ]
+
+    async def ingest_items(self, dtos: Sequence[CreateItemDTO]) -> ItemBatchResultDTO:
+        batch = await self._ingest_use_case.execute(dtos)
+        return ItemBatchResultDTO(
+            items=[ItemResponseDTO.from_item(item) for item in batch.items], errors=batch.errors
+        )
+
+    async def get_item(self, item_id: str) -> ItemResponseDTO:
+        return ItemResponseDTO.from_item(await self._get_use_case.execute(item_id))
+
+    async def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]:
+        return [
+            ItemResponseDTO.from_item(item)
+            for item in await self._get_many_use_case.execute(item_ids)
+        ]
+
+    async def list_items(self) -> list[ItemResponseDTO]:
+        return [ItemResponseDTO.from_item(item) for item in await self._list_use_case.execute()]
+
+    async def iter_items(self) -> AsyncIterator[ItemResponseDTO]:
+        async for item in self._stream_use_case.execute():
+            yield ItemResponseDTO.from_item(item)
+
+    async def list_items_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> ItemPageDTO:
+        items, next_cursor = await self._list_page_use_case.execute(limit, cursor)
+        return ItemPageDTO(
+            items=[ItemResponseDTO.from_item(item) for item in items],
+            next_cursor=next_cursor,
+        )
+
+    async def query_items(self, query: ItemQuery) -> ItemPageDTO:
+        items, next_cursor = await self._query_use_case.execute(query)
+        return ItemPageDTO(
+            items=[ItemResponseDTO.from_item(item) for item in items],
+            next_cursor=next_cursor,
+        )
+
+    async def item_stats(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        return await self._stats_use_case.execute(query)
+
+    async def compact_storage(self) -> CompactionReportDTO | None:
+        return await self._compact_use_case.execute()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from operator import itemgetter
+
+from template.core.application.dtos.dto import ItemQuery
+from template.core.domain.entities.model import Item
+
+SORT_FIELDS = ("name", "value")
+SortKey = tuple[object, ...]
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string that sorts after every string starting with ``prefix``."""
+    while prefix:
+        code_point = ord(prefix[-1]) + 1
+        if code_point in _SURROGATES:
+            code_point = _SURROGATES.stop
+        if code_point <= _MAX_CODE_POINT:
+            return prefix[:-1] + chr(code_point)
+        prefix = prefix[:-1]
+    return None
+
+
+def matches(query: ItemQuery, item: Item) -> bool:
+    if query.name is not None and item.name != query.name:
+        return False
+    if query.name_prefix is not None and not item.name.startswith(query.name_prefix):
+        return False
+    if query.min_value is not None and item.value < query.min_value:
+        return False
+    return query.max_value is None or item.value <= query.max_value
+
+
+def sort_key(query: ItemQuery, item: Item, position: int) -> SortKey:
+    """Keyset position of a stored item; ties on the sort field break on insertion order."""
+    if query.sort == "name":
+        return (item.name, position)
+    if query.sort == "value":
+        return (float(item.value), position)
+    return (position,)
+
+
+def select(
+    query: ItemQuery,
+    rows: Iterable[tuple[int, Item]],
+    after: SortKey | None = None,
+) -> list[Item]:
+    """Filter ``(position, item)`` rows and return the page that follows ``after``.
+
+    This is the full-scan plan for backends without secondary indexes; only ``limit``
+    rows are kept in memory while scanning.
+    """
+    keyed = (
+        (sort_key(query, item, position), item) for position, item in rows if matches(query, item)
+    )
+    if after is not None:
+        if query.descending:
+            keyed = (entry for entry in keyed if entry[0] < after)
+        else:
+            keyed = (entry for entry in keyed if entry[0] > after)
+    if query.limit is None:
+        ordered = sorted(keyed, key=itemgetter(0), reverse=query.descending)
+    elif query.descending:
+        ordered = heapq.nlargest(query.limit, keyed, key=itemgetter(0))
+    else:
+        ordered = heapq.nsmallest(query.limit, keyed, key=itemgetter(0))
+    return [item for _, item in ordered]
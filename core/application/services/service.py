@@ -1,10 +1,29 @@
 from __future__ import annotations
 
-from template.core.application.dtos.dto import CreateItemDTO, ItemResponseDTO
+from collections.abc import Iterator, Sequence
+
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemBatchResultDTO,
+    ItemPageDTO,
+    ItemQuery,
+    ItemResponseDTO,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
 from template.core.application.use_cases.use_case import (
+    AggregateItemsUseCase,
+    CompactStorageUseCase,
+    CreateItemsUseCase,
     CreateItemUseCase,
+    GetItemsUseCase,
     GetItemUseCase,
+    IngestItemsUseCase,
+    ListItemsPageUseCase,
     ListItemsUseCase,
+    QueryItemsUseCase,
+    StreamItemsUseCase,
 )
 
 
@@ -14,16 +33,71 @@ class ApplicationService:
         create_use_case: CreateItemUseCase,
         get_use_case: GetItemUseCase,
         list_use_case: ListItemsUseCase,
+        create_many_use_case: CreateItemsUseCase,
+        get_many_use_case: GetItemsUseCase,
+        list_page_use_case: ListItemsPageUseCase,
+        stream_use_case: StreamItemsUseCase,
+        stats_use_case: AggregateItemsUseCase,
+        query_use_case: QueryItemsUseCase,
+        compact_use_case: CompactStorageUseCase,
+        ingest_use_case: IngestItemsUseCase,
     ) -> None:
         self._create_use_case = create_use_case
         self._get_use_case = get_use_case
         self._list_use_case = list_use_case
+        self._create_many_use_case = create_many_use_case
+        self._get_many_use_case = get_many_use_case
+        self._list_page_use_case = list_page_use_case
+        self._stream_use_case = stream_use_case
+        self._stats_use_case = stats_use_case
+        self._query_use_case = query_use_case
+        self._compact_use_case = compact_use_case
+        self._ingest_use_case = ingest_use_case
 
     def create_item(self, dto: CreateItemDTO) -> ItemResponseDTO:
         return ItemResponseDTO.from_item(self._create_use_case.execute(dto))
 
+    def create_items(self, dtos: Sequence[CreateItemDTO]) -> list[ItemResponseDTO]:
+        return [
+            ItemResponseDTO.from_item(item) for item in self._create_many_use_case.execute(dtos)
+        ]
+
+    def ingest_items(self, dtos: Sequence[CreateItemDTO]) -> ItemBatchResultDTO:
+        batch = self._ingest_use_case.execute(dtos)
+        return ItemBatchResultDTO(
+            items=[ItemResponseDTO.from_item(item) for item in batch.items], errors=batch.errors
+        )
+
     def get_item(self, item_id: str) -> ItemResponseDTO:
         return ItemResponseDTO.from_item(self._get_use_case.execute(item_id))
 
+    def get_items(self, item_ids: Sequence[str]) -> list[ItemResponseDTO]:
+        return [
+            ItemResponseDTO.from_item(item) for item in self._get_many_use_case.execute(item_ids)
+        ]
+
     def list_items(self) -> list[ItemResponseDTO]:
         return [ItemResponseDTO.from_item(item) for item in self._list_use_case.execute()]
+
+    def iter_items(self) -> Iterator[ItemResponseDTO]:
+        return (ItemResponseDTO.from_item(item) for item in self._stream_use_case.execute())
+
+    def list_items_page(self, limit: int | None = None, cursor: str | None = None) -> ItemPageDTO:
+        items, next_cursor = self._list_page_use_case.execute(limit, cursor)
+        return ItemPageDTO(
+            items=[ItemResponseDTO.from_item(item) for item in items],
+            next_cursor=next_cursor,
+        )
+
+    def query_items(self, query: ItemQuery) -> ItemPageDTO:
+        items, next_cursor = self._query_use_case.execute(query)
+        return ItemPageDTO(
+            items=[ItemResponseDTO.from_item(item) for item in items],
+            next_cursor=next_cursor,
+        )
+
+    def item_stats(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        return self._stats_use_case.execute(query)
+
+    def compact_storage(self) -> CompactionReportDTO | None:
+        return self._compact_use_case.execute()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import replace
+
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemQuery,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
+from template.core.application.ports.output.repository_port import (
+    AsyncItemAggregationPort,
+    AsyncItemCompactionPort,
+    AsyncItemRepositoryPort,
+)
+from template.core.application.services.aggregation import ValueAccumulator
+from template.core.application.use_cases.use_case import (
+    missing_id,
+    page_limit,
+    split_page,
+    validate_query,
+    validate_stats_query,
+)
+from template.core.domain.entities.model import Item, ItemBatch
+from template.core.domain.exceptions.exception import ItemNotFoundError, ItemValidationError
+from template.core.domain.services.service import ItemDomainService
+
+
+class AsyncCreateItemUseCase:
+    def __init__(
+        self, repository: AsyncItemRepositoryPort, domain_service: ItemDomainService | None = None
+    ) -> None:
+        self._repository = repository
+        self._domain_service = domain_service or ItemDomainService()
+
+    async def execute(self, dto: CreateItemDTO) -> Item:
+        item = self._domain_service.create(dto.name, dto.value)
+        return await self._repository.save(item)
+
+
+class AsyncCreateItemsUseCase:
+    def __init__(
+        self, repository: AsyncItemRepositoryPort, domain_service: ItemDomainService | None = None
+    ) -> None:
+        self._repository = repository
+        self._domain_service = domain_service or ItemDomainService()
+
+    async def execute(self, dtos: Sequence[CreateItemDTO]) -> list[Item]:
+        batch = self._domain_service.create_many(
+            [dto.name for dto in dtos], [dto.value for dto in dtos]
+        )
+        if batch.errors:
+            raise ItemValidationError(batch.errors[min(batch.errors)])
+        return await self._repository.save_many(batch.items)
+
+
+class AsyncIngestItemsUseCase:
+    def __init__(
+        self, repository: AsyncItemRepositoryPort, domain_service: ItemDomainService | None = None
+    ) -> None:
+        self._repository = repository
+        self._domain_service = domain_service or ItemDomainService()
+
+    async def execute(self, dtos: Sequence[CreateItemDTO]) -> ItemBatch:
+        batch = self._domain_service.create_many(
+            [dto.name for dto in dtos], [dto.value for dto in dtos]
+        )
+        if not batch.items:
+            return batch
+        return ItemBatch(await self._repository.save_many(batch.items), batch.errors)
+
+
+class AsyncGetItemUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, item_id: str) -> Item:
+        item = await self._repository.get(item_id)
+        if item is None:
+            raise ItemNotFoundError(item_id)
+        return item
+
+
+class AsyncGetItemsUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, item_ids: Sequence[str]) -> list[Item]:
+        items = await self._repository.get_many(item_ids)
+        missing = missing_id(item_ids, items)
+        if missing is not None:
+            raise ItemNotFoundError(missing)
+        return items
+
+
+class AsyncListItemsUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self) -> list[Item]:
+        return await self._repository.list()
+
+
+class AsyncStreamItemsUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(self) -> AsyncIterator[Item]:
+        return self._repository.iter_items()
+
+
+class AsyncListItemsPageUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> tuple[list[Item], str | None]:
+        limit = page_limit(limit)
+        return split_page(await self._repository.list_page(limit + 1, cursor), limit)
+
+
+class AsyncQueryItemsUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, query: ItemQuery) -> tuple[list[Item], str | None]:
+        validate_query(query)
+        limit = page_limit(query.limit)
+        return split_page(await self._repository.query(replace(query, limit=limit + 1)), limit)
+
+
+class AsyncAggregateItemsUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        validate_stats_query(query)
+        if isinstance(self._repository, AsyncItemAggregationPort):
+            return await self._repository.aggregate(query)
+        accumulator = ValueAccumulator(query.group_prefix)
+        async for item in self._repository.iter_items():
+            accumulator.add(item.name, float(item.value))
+        return accumulator.result(query)
+
+
+class AsyncCompactStorageUseCase:
+    def __init__(self, repository: AsyncItemRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self) -> CompactionReportDTO | None:
+        if isinstance(self._repository, AsyncItemCompactionPort):
+            return await self._repository.compact()
+        return None
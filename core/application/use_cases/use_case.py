@@ -1,11 +1,72 @@
 from __future__ import annotations
 
-from template.core.application.dtos.dto import CreateItemDTO
-from template.core.application.ports.output.repository_port import ItemRepositoryPort
-from template.core.domain.entities.model import Item
-from template.core.domain.exceptions.exception import ItemNotFoundError
+from collections.abc import Iterator, Sequence
+from dataclasses import replace
+
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemQuery,
+    ItemStatsDTO,
+    ItemStatsQuery,
+)
+from template.core.application.ports.output.repository_port import (
+    ItemAggregationPort,
+    ItemCompactionPort,
+    ItemRepositoryPort,
+)
+from template.core.application.services.aggregation import ValueAccumulator
+from template.core.application.services.query import SORT_FIELDS
+from template.core.domain.entities.model import Item, ItemBatch
+from template.core.domain.exceptions.exception import (
+    InvalidQueryError,
+    ItemNotFoundError,
+    ItemValidationError,
+)
 from template.core.domain.services.service import ItemDomainService
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_HISTOGRAM_BINS = 1000
+
+
+def page_limit(limit: int | None) -> int:
+    return min(max(limit or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+
+
+def split_page(items: list[Item], limit: int) -> tuple[list[Item], str | None]:
+    """Cut a ``limit + 1`` fetch down to one page and the cursor for the next one."""
+    if len(items) > limit:
+        return items[:limit], items[limit - 1].id
+    return items, None
+
+
+def validate_query(query: ItemQuery) -> None:
+    if query.sort is not None and query.sort not in SORT_FIELDS:
+        raise InvalidQueryError(f"Sort field must be one of: {', '.join(SORT_FIELDS)}.")
+    if (
+        query.min_value is not None
+        and query.max_value is not None
+        and query.min_value > query.max_value
+    ):
+        raise InvalidQueryError("min_value must not be greater than max_value.")
+
+
+def validate_stats_query(query: ItemStatsQuery) -> None:
+    if not 1 <= query.bins <= MAX_HISTOGRAM_BINS:
+        raise InvalidQueryError(f"Histogram bins must be between 1 and {MAX_HISTOGRAM_BINS}.")
+    if any(not 0 <= percentile <= 100 for percentile in query.percentiles):
+        raise InvalidQueryError("Percentiles must be between 0 and 100.")
+    if query.group_prefix is not None and query.group_prefix < 1:
+        raise InvalidQueryError("Group prefix length must be positive.")
+
+
+def missing_id(item_ids: Sequence[str], items: Sequence[Item]) -> str | None:
+    if len(items) == len(item_ids):
+        return None
+    found = {item.id for item in items}
+    return next(item_id for item_id in item_ids if item_id not in found)
+
 
 class CreateItemUseCase:
     def __init__(self, repository: ItemRepositoryPort, domain_service: ItemDomainService | None = None) -> None:
@@ -17,6 +78,43 @@ class CreateItemUseCase:
         return self._repository.save(item)
 
 
+class CreateItemsUseCase:
+    def __init__(self, repository: ItemRepositoryPort, domain_service: ItemDomainService | None = None) -> None:
+        self._repository = repository
+        self._domain_service = domain_service or ItemDomainService()
+
+    def execute(self, dtos: Sequence[CreateItemDTO]) -> list[Item]:
+        batch = self._domain_service.create_many(
+            [dto.name for dto in dtos], [dto.value for dto in dtos]
+        )
+        if batch.errors:
+            # The batch is saved all or nothing, so report the first bad row like ``create``.
+            raise ItemValidationError(batch.errors[min(batch.errors)])
+        return self._repository.save_many(batch.items)
+
+
+class IngestItemsUseCase:
+    """Save the valid rows of a batch with one write and report the others.
+
+    Unlike ``CreateItemsUseCase`` a bad row does not fail the batch, so bulk ingest can
+    keep going and tell the client which rows were rejected.
+    """
+
+    def __init__(
+        self, repository: ItemRepositoryPort, domain_service: ItemDomainService | None = None
+    ) -> None:
+        self._repository = repository
+        self._domain_service = domain_service or ItemDomainService()
+
+    def execute(self, dtos: Sequence[CreateItemDTO]) -> ItemBatch:
+        batch = self._domain_service.create_many(
+            [dto.name for dto in dtos], [dto.value for dto in dtos]
+        )
+        if not batch.items:
+            return batch
+        return ItemBatch(self._repository.save_many(batch.items), batch.errors)
+
+
 class GetItemUseCase:
     def __init__(self, repository: ItemRepositoryPort) -> None:
         self._repository = repository
@@ -28,6 +126,18 @@ class GetItemUseCase:
         return item
 
 
+class GetItemsUseCase:
+    def __init__(self, repository: ItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(self, item_ids: Sequence[str]) -> list[Item]:
+        items = self._repository.get_many(item_ids)
+        missing = missing_id(item_ids, items)
+        if missing is not None:
+            raise ItemNotFoundError(missing)
+        return items
+
+
 class ListItemsUseCase:
     def __init__(self, repository: ItemRepositoryPort) -> None:
         self._repository = repository
@@ -36,6 +146,61 @@ class ListItemsUseCase:
         return self._repository.list()
 
 
+class StreamItemsUseCase:
+    def __init__(self, repository: ItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(self) -> Iterator[Item]:
+        return self._repository.iter_items()
+
+
+class ListItemsPageUseCase:
+    def __init__(self, repository: ItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> tuple[list[Item], str | None]:
+        limit = page_limit(limit)
+        # One extra row tells whether another page exists without a second query.
+        return split_page(self._repository.list_page(limit + 1, cursor), limit)
+
+
+class QueryItemsUseCase:
+    def __init__(self, repository: ItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(self, query: ItemQuery) -> tuple[list[Item], str | None]:
+        validate_query(query)
+        limit = page_limit(query.limit)
+        return split_page(self._repository.query(replace(query, limit=limit + 1)), limit)
+
+
+class AggregateItemsUseCase:
+    def __init__(self, repository: ItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(self, query: ItemStatsQuery) -> ItemStatsDTO:
+        validate_stats_query(query)
+        if isinstance(self._repository, ItemAggregationPort):
+            return self._repository.aggregate(query)
+        # Backends without native aggregates are summarized in one streaming pass.
+        accumulator = ValueAccumulator(query.group_prefix)
+        accumulator.add_items(self._repository.iter_items())
+        return accumulator.result(query)
+
+
+class CompactStorageUseCase:
+    def __init__(self, repository: ItemRepositoryPort) -> None:
+        self._repository = repository
+
+    def execute(self) -> CompactionReportDTO | None:
+        # Only append-based storage accumulates superseded records; others have nothing to do.
+        if isinstance(self._repository, ItemCompactionPort):
+            return self._repository.compact()
+        return None
+
+
 def list_items(*, source_id: str) -> list[dict[str, object]]:
     return [
         {
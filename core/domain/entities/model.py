@@ -7,6 +7,10 @@ from uuid import uuid4
 from template.core.domain.events.event import ItemCreatedEvent
 from template.core.domain.exceptions.exception import ItemValidationError
 
+EMPTY_NAME_ERROR = "Item name must not be empty."
+NON_NUMERIC_ERROR = "Item value must be numeric."
+NON_FINITE_ERROR = "Item value must be finite."
+
 
 @dataclass(slots=True)
 class Item:
@@ -16,12 +20,20 @@ class Item:
 
     def validate(self) -> "Item":
         if not self.name or not self.name.strip():
-            raise ItemValidationError("Item name must not be empty.")
+            raise ItemValidationError(EMPTY_NAME_ERROR)
         if not isinstance(self.value, int | float):
-            raise ItemValidationError("Item value must be numeric.")
+            raise ItemValidationError(NON_NUMERIC_ERROR)
         if not isfinite(float(self.value)):
-            raise ItemValidationError("Item value must be finite.")
+            raise ItemValidationError(NON_FINITE_ERROR)
         return self
 
     def to_event(self) -> ItemCreatedEvent:
         return ItemCreatedEvent(item_id=self.id, name=self.name, value=float(self.value))
+
+
+@dataclass(slots=True)
+class ItemBatch:
+    """Valid items of a batch in row order, and the validation message of each bad row."""
+
+    items: list[Item]
+    errors: dict[int, str] = field(default_factory=dict)
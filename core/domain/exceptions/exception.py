@@ -8,3 +8,12 @@ class ItemNotFoundError(Exception):
 
 class ItemValidationError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Cursor '{cursor}' does not match any item.")
+
+
+class InvalidQueryError(Exception):
+    pass
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import secrets
+import time
+from collections.abc import Callable
+from threading import Lock
+from uuid import uuid4
+
+IdStrategy = Callable[[], str]
+ID_STRATEGIES = ("uuid4", "uuid7")
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_COUNTER_MAX = 0xFFF
+_VERSION_7 = 0x7 << 76
+_VARIANT = 0b10 << 62
+# Maps a random hex digit to one whose top two bits are the RFC 9562 variant 0b10.
+_VARIANT_DIGITS = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+def uuid4_id() -> str:
+    return str(uuid4())
+
+
+class UuidV7Generator:
+    """RFC 9562 UUIDv7 ids that increase strictly within one process.
+
+    The first 48 bits are a Unix timestamp in milliseconds, so ids created later sort
+    later as canonical strings and indexes, files and B-trees append instead of
+    splitting pages at random. The 12 ``rand_a`` bits are a counter that starts at a
+    random value below 2048 in every millisecond; when it runs out, or the clock steps
+    back, the timestamp field is advanced past the last one issued instead. The other
+    62 bits are random.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], int] = time.time_ns,
+        randbits: Callable[[int], int] = secrets.randbits,
+    ) -> None:
+        self._clock = clock
+        self._randbits = randbits
+        self._lock = Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            (stamp,) = self._next_stamps(1)
+        counter = stamp & _COUNTER_MAX
+        return _format(
+            (stamp >> 12) << 80 | _VERSION_7 | counter << 64 | _VARIANT | self._randbits(62)
+        )
+
+    def many(self, count: int) -> list[str]:
+        """``count`` consecutive ids, with one clock read per millisecond they span."""
+        with self._lock:
+            stamps = self._next_stamps(count)
+        # 16 random hex digits per id; the first becomes the variant digit (0b10xx).
+        random_hex = self._randbits(64 * count).to_bytes(8 * count, "big").hex()
+        return [
+            f"{stamp[:8]}-{stamp[8:12]}-7{stamp[12:]}-"
+            f"{_VARIANT_DIGITS[random_hex[offset]]}{random_hex[offset + 1 : offset + 4]}-"
+            f"{random_hex[offset + 4 : offset + 16]}"
+            for stamp, offset in zip(map("{:015x}".format, stamps), range(0, 16 * count, 16))
+        ]
+
+    def _next_stamps(self, count: int) -> list[int]:
+        """``(timestamp << 12) | counter`` for the next ``count`` ids; callers hold the lock."""
+        stamps: list[int] = []
+        while len(stamps) < count:
+            now_ms = self._clock() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = self._randbits(11)
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+            else:
+                self._last_ms += 1
+                self._counter = 0
+            # The rest of this millisecond's counter range needs no further clock reads.
+            take = min(count - len(stamps), _COUNTER_MAX - self._counter + 1)
+            first = (self._last_ms & _TIMESTAMP_MASK) << 12 | self._counter
+            stamps.extend(range(first, first + take))
+            self._counter += take - 1
+        return stamps
+
+
+_UUID7 = UuidV7Generator()
+
+
+def create_id_strategy(name: str) -> IdStrategy:
+    """Id factory for a configured strategy name.
+
+    ``uuid7`` returns one generator shared by the whole process, so ids stay monotonic
+    across every container and use case that asks for it.
+    """
+    if name == "uuid4":
+        return uuid4_id
+    if name == "uuid7":
+        return _UUID7
+    raise ValueError(
+        f"Unsupported id strategy {name!r}; expected one of {', '.join(ID_STRATEGIES)}."
+    )
+
+
+def uuid7_timestamp_ms(item_id: str) -> int | None:
+    """Creation time in Unix milliseconds of a canonical UUIDv7 id, else ``None``."""
+    if len(item_id) != 36 or item_id[14] != "7" or item_id[19] not in "89ab":
+        return None
+    try:
+        return int(item_id[:8] + item_id[9:13], 16)
+    except ValueError:
+        return None
+
+
+def uuid7_bound(timestamp_ms: int) -> str:
+    """Lower bound for range scans by creation time: ids created earlier sort before it."""
+    return _format((timestamp_ms & _TIMESTAMP_MASK) << 80)
+
+
+def canonical_uuid_bytes(item_id: str) -> bytes | None:
+    """The 16 bytes of a canonical lowercase UUID string, else ``None``.
+
+    Other spellings are not packed, so ``str(UUID(bytes=...))`` restores ids exactly.
+    """
+    if len(item_id) != 36 or item_id[8] + item_id[13] + item_id[18] + item_id[23] != "----":
+        return None
+    digits = item_id.replace("-", "")
+    if len(digits) != 32 or digits != digits.lower():
+        return None
+    try:
+        packed = bytes.fromhex(digits)
+    except ValueError:
+        return None
+    # ``fromhex`` skips whitespace, so a short result means the id was not all hex digits.
+    return packed if len(packed) == 16 else None
+
+
+def _format(value: int) -> str:
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
@@ -1,8 +1,78 @@
 from __future__ import annotations
 
-from template.core.domain.entities.model import Item
+from array import array
+from collections.abc import Sequence
+from math import isfinite
+
+from template.core.domain.entities.model import (
+    EMPTY_NAME_ERROR,
+    NON_FINITE_ERROR,
+    NON_NUMERIC_ERROR,
+    Item,
+    ItemBatch,
+)
+from template.core.domain.services.ids import IdStrategy, uuid4_id
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 
 class ItemDomainService:
+    def __init__(self, id_strategy: IdStrategy = uuid4_id) -> None:
+        self._new_id = id_strategy
+
     def create(self, name: str, value: float) -> Item:
-        return Item(name=name, value=float(value)).validate()
+        return Item(name=name, value=float(value), id=self._new_id()).validate()
+
+    def create_many(self, names: Sequence[str], values: Sequence[object]) -> ItemBatch:
+        """Validate a batch column by column and build its valid items.
+
+        Bad rows are reported in ``ItemBatch.errors`` with the message ``Item.validate``
+        would raise, instead of raising on the first one. Values are converted by one
+        ``array("d")`` call and checked with NumPy's ``isfinite`` when it is installed;
+        ids are only issued for valid rows.
+        """
+        if len(names) != len(values):
+            raise ValueError("A batch needs one value per name.")
+        errors = {
+            row: EMPTY_NAME_ERROR for row, name in enumerate(names) if not name or not name.strip()
+        }
+        column = _float_column(values, errors)
+        for row in _non_finite_rows(column):
+            errors.setdefault(row, NON_FINITE_ERROR)
+        if not errors:
+            return ItemBatch(list(map(Item, names, column.tolist(), self._ids(len(names)))))
+        rows = [row for row in range(len(names)) if row not in errors]
+        ids = self._ids(len(rows))
+        items = [Item(names[row], column[row], item_id) for row, item_id in zip(rows, ids)]
+        return ItemBatch(items, dict(sorted(errors.items())))
+
+    def _ids(self, count: int) -> list[str]:
+        many = getattr(self._new_id, "many", None)
+        if many is not None:
+            return many(count)
+        return [self._new_id() for _ in range(count)]
+
+
+def _float_column(values: Sequence[object], errors: dict[int, str]) -> array[float]:
+    try:
+        return array("d", values)  # type: ignore[arg-type]
+    except (TypeError, OverflowError):
+        pass
+    # Some value has no ``__float__`` or is an integer too large for a float; convert
+    # row by row like ``create`` does.
+    column = array("d", bytes(8 * len(values)))
+    for row, value in enumerate(values):
+        try:
+            column[row] = float(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError, OverflowError):
+            errors.setdefault(row, NON_NUMERIC_ERROR)
+    return column
+
+
+def _non_finite_rows(column: array[float]) -> list[int]:
+    if np is None:
+        return [row for row, value in enumerate(column) if not isfinite(value)]
+    return np.flatnonzero(~np.isfinite(np.frombuffer(column, dtype=np.float64))).tolist()
@@ -16,8 +16,24 @@ if BaseSettings is not None:
         environment: str = "development"
         repository_type: str = "memory"
         items_file_path: str = "template/items.json"
+        items_file_format: str = "json"
+        items_file_compression: str = "none"
+        sqlite_path: str = "template/items.sqlite3"
+        log_compaction_ratio: float | None = None
+        cache_size: int = 0
+        cache_ttl_seconds: float | None = None
+        write_buffer_size: int = 0
+        write_buffer_delay_seconds: float | None = 0.05
+        shard_count: int = 1
+        id_strategy: str = "uuid7"
         web_host: str = "127.0.0.1"
         web_port: int = 8000
+        web_stdlib_server: str = "asyncio"
+        web_executor_workers: int = 8
+        web_executor_queue_size: int = 64
+        web_keepalive_seconds: float = 5.0
+        web_workers: int = 1
+        web_drain_seconds: float = 30.0
         log_level: str = "INFO"
         telegram_bot_token: Optional[str] = None
 
@@ -35,8 +51,48 @@ else:
         environment: str = field(default_factory=lambda: os.getenv("TEMPLATE_ENVIRONMENT", "development"))
         repository_type: str = field(default_factory=lambda: os.getenv("TEMPLATE_REPOSITORY_TYPE", "memory"))
         items_file_path: str = field(default_factory=lambda: os.getenv("TEMPLATE_ITEMS_FILE_PATH", "template/items.json"))
+        items_file_format: str = field(default_factory=lambda: os.getenv("TEMPLATE_ITEMS_FILE_FORMAT", "json"))
+        items_file_compression: str = field(
+            default_factory=lambda: os.getenv("TEMPLATE_ITEMS_FILE_COMPRESSION", "none")
+        )
+        sqlite_path: str = field(default_factory=lambda: os.getenv("TEMPLATE_SQLITE_PATH", "template/items.sqlite3"))
+        log_compaction_ratio: float | None = field(
+            default_factory=lambda: float(os.environ["TEMPLATE_LOG_COMPACTION_RATIO"])
+            if os.getenv("TEMPLATE_LOG_COMPACTION_RATIO")
+            else None
+        )
+        cache_size: int = field(default_factory=lambda: int(os.getenv("TEMPLATE_CACHE_SIZE", "0")))
+        cache_ttl_seconds: float | None = field(
+            default_factory=lambda: float(os.environ["TEMPLATE_CACHE_TTL_SECONDS"])
+            if os.getenv("TEMPLATE_CACHE_TTL_SECONDS")
+            else None
+        )
+        write_buffer_size: int = field(
+            default_factory=lambda: int(os.getenv("TEMPLATE_WRITE_BUFFER_SIZE", "0"))
+        )
+        write_buffer_delay_seconds: float | None = field(
+            default_factory=lambda: float(os.getenv("TEMPLATE_WRITE_BUFFER_DELAY_SECONDS", "0.05"))
+        )
+        shard_count: int = field(default_factory=lambda: int(os.getenv("TEMPLATE_SHARD_COUNT", "1")))
+        id_strategy: str = field(default_factory=lambda: os.getenv("TEMPLATE_ID_STRATEGY", "uuid7"))
         web_host: str = field(default_factory=lambda: os.getenv("TEMPLATE_WEB_HOST", "127.0.0.1"))
         web_port: int = field(default_factory=lambda: int(os.getenv("TEMPLATE_WEB_PORT", "8000")))
+        web_stdlib_server: str = field(
+            default_factory=lambda: os.getenv("TEMPLATE_WEB_STDLIB_SERVER", "asyncio")
+        )
+        web_executor_workers: int = field(
+            default_factory=lambda: int(os.getenv("TEMPLATE_WEB_EXECUTOR_WORKERS", "8"))
+        )
+        web_executor_queue_size: int = field(
+            default_factory=lambda: int(os.getenv("TEMPLATE_WEB_EXECUTOR_QUEUE_SIZE", "64"))
+        )
+        web_keepalive_seconds: float = field(
+            default_factory=lambda: float(os.getenv("TEMPLATE_WEB_KEEPALIVE_SECONDS", "5.0"))
+        )
+        web_workers: int = field(default_factory=lambda: int(os.getenv("TEMPLATE_WEB_WORKERS", "1")))
+        web_drain_seconds: float = field(
+            default_factory=lambda: float(os.getenv("TEMPLATE_WEB_DRAIN_SECONDS", "30.0"))
+        )
         log_level: str = field(default_factory=lambda: os.getenv("TEMPLATE_LOG_LEVEL", "INFO"))
         telegram_bot_token: Optional[str] = field(
             default_factory=lambda: os.getenv("TEMPLATE_TELEGRAM_BOT_TOKEN")
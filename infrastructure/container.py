@@ -1,28 +1,74 @@
 from __future__ import annotations
 
 from asyncio import Queue
+from pathlib import Path
+from threading import Lock
 from typing import Any, TypeVar, cast
 
 from template.app.airflow.etl.stubs import StubConsumer, StubProducer
-from template.app.adapters.output.db.repository import InMemoryItemRepository
-from template.app.adapters.output.files.file import FileItemRepository
-from template.app.facade import AppFacade
+from template.app.adapters.output.buffer.repository import WriteBehindItemRepository
+from template.app.adapters.output.cache.repository import CachingItemRepository
+from template.app.adapters.output.db.columnar import ColumnarItemRepository
+from template.app.adapters.output.db.concurrent import StripedItemRepository
+from template.app.adapters.output.db.repository import (
+    AsyncInMemoryItemRepository,
+    InMemoryItemRepository,
+)
+from template.app.adapters.output.db.sqlite import (
+    AsyncSqliteItemRepository,
+    SqliteItemRepository,
+    aiosqlite,
+)
+from template.app.adapters.output.offload.repository import ThreadOffloadItemRepository
+from template.app.adapters.output.shard.repository import ShardedItemRepository
+from template.app.facade import AppFacade, AsyncAppFacade
 from template.core.application.ports.input.producer import IProducer
 from template.core.application.ports.output.consumer import IConsumer
-from template.core.application.ports.output.repository_port import ItemRepositoryPort
+from template.core.application.ports.output.repository_port import (
+    AsyncItemRepositoryPort,
+    ItemRepositoryPort,
+)
+from template.core.application.services.async_service import AsyncApplicationService
 from template.core.application.services.service import ApplicationService
+from template.core.application.use_cases.async_use_case import (
+    AsyncAggregateItemsUseCase,
+    AsyncCompactStorageUseCase,
+    AsyncCreateItemsUseCase,
+    AsyncCreateItemUseCase,
+    AsyncGetItemsUseCase,
+    AsyncGetItemUseCase,
+    AsyncIngestItemsUseCase,
+    AsyncListItemsPageUseCase,
+    AsyncListItemsUseCase,
+    AsyncQueryItemsUseCase,
+    AsyncStreamItemsUseCase,
+)
 from template.core.application.use_cases.etl_use_case import ETLUseCase
 from template.core.application.use_cases.use_case import (
+    AggregateItemsUseCase,
+    CompactStorageUseCase,
+    CreateItemsUseCase,
     CreateItemUseCase,
+    GetItemsUseCase,
     GetItemUseCase,
+    IngestItemsUseCase,
+    ListItemsPageUseCase,
     ListItemsUseCase,
+    QueryItemsUseCase,
+    StreamItemsUseCase,
 )
+from template.core.domain.services.ids import create_id_strategy
+from template.core.domain.services.service import ItemDomainService
 from template.infrastructure.config.settings import Settings
+from template.infrastructure.executor import BoundedExecutor
 from template.infrastructure.queue import AsyncQueue
+from template.infrastructure.storage import open_items_file
 
 
 T = TypeVar("T")
+PROCESS_SAFE_REPOSITORIES = ("sqlite", "file")
 _SINGLETONS: dict[type[object], object] = {}
+_SINGLETONS_LOCK = Lock()
 
 
 class ContainerFactory:
@@ -30,23 +76,110 @@ class ContainerFactory:
         self.settings = settings or Settings()
 
     def create_repository(self) -> ItemRepositoryPort:
+        if self.settings.shard_count > 1:
+            repository: ItemRepositoryPort = ShardedItemRepository(
+                [self._create_backend(shard) for shard in range(self.settings.shard_count)]
+            )
+        else:
+            repository = self._create_backend()
+        if self.settings.write_buffer_size > 0:
+            repository = WriteBehindItemRepository(
+                repository,
+                self.settings.write_buffer_size,
+                self.settings.write_buffer_delay_seconds,
+            )
+        if self.settings.cache_size > 0:
+            return CachingItemRepository(
+                repository, self.settings.cache_size, self.settings.cache_ttl_seconds
+            )
+        return repository
+
+    def create_async_repository(
+        self, executor: BoundedExecutor | None = None
+    ) -> AsyncItemRepositoryPort:
+        """Repository for the async stack.
+
+        A plain memory store is awaited inline and a plain sqlite database goes through
+        aiosqlite when it is installed. Every other configuration, including sharding,
+        the cache and the write buffer, is the sync repository run on ``executor``.
+        """
+        wrapped = (
+            self.settings.shard_count > 1
+            or self.settings.write_buffer_size > 0
+            or self.settings.cache_size > 0
+        )
+        if not wrapped and self.settings.repository_type == "memory":
+            return AsyncInMemoryItemRepository()
+        if not wrapped and self.settings.repository_type == "sqlite" and aiosqlite is not None:
+            return AsyncSqliteItemRepository(self.settings.sqlite_path)
+        return ThreadOffloadItemRepository(self.create_repository(), executor)
+
+    def check_process_safe(self) -> None:
+        """Raise ``ValueError`` unless separate processes see one shared set of items.
+
+        Prefork web workers each build their own repository. sqlite databases and
+        ``json``/``binary`` item files live on disk, are written under a lock and are
+        re-read when another process changes them, so they can be shared. The memory,
+        striped and columnar stores exist once per process, the ``ndjson`` log keeps
+        its offset index in memory, and the read cache and write buffer hold items that
+        the other workers cannot see.
+        """
+        repository_type = self.settings.repository_type
+        if repository_type not in PROCESS_SAFE_REPOSITORIES:
+            raise ValueError(
+                f"repository_type {repository_type!r} keeps items in process memory; "
+                f"multiple workers need one of {', '.join(PROCESS_SAFE_REPOSITORIES)}."
+            )
+        if repository_type == "file" and self.settings.items_file_format == "ndjson":
+            raise ValueError(
+                "The ndjson items file indexes records in process memory; "
+                "multiple workers need items_file_format json or binary."
+            )
+        if self.settings.cache_size > 0 or self.settings.write_buffer_size > 0:
+            raise ValueError(
+                "cache_size and write_buffer_size keep items in process memory; "
+                "set both to 0 for multiple workers."
+            )
+
+    def _create_backend(self, shard: int | None = None) -> ItemRepositoryPort:
         if self.settings.repository_type == "file":
-            return FileItemRepository(self.settings.items_file_path)
+            return open_items_file(
+                _shard_path(self.settings.items_file_path, shard),
+                self.settings.items_file_format,
+                self.settings.items_file_compression,
+                self.settings.log_compaction_ratio,
+            )
+        if self.settings.repository_type == "sqlite":
+            return SqliteItemRepository(_shard_path(self.settings.sqlite_path, shard))
+        if self.settings.repository_type == "columnar":
+            return ColumnarItemRepository()
+        if self.settings.repository_type == "striped":
+            return StripedItemRepository()
         return InMemoryItemRepository()
 
     def resolve(self, dependency: type[T]) -> T:
         if dependency is Queue:
-            if dependency not in _SINGLETONS:
-                _SINGLETONS[dependency] = AsyncQueue[Any]()
-            return cast(T, _SINGLETONS[dependency])
+            with _SINGLETONS_LOCK:
+                if dependency not in _SINGLETONS:
+                    _SINGLETONS[dependency] = AsyncQueue[Any]()
+                return cast(T, _SINGLETONS[dependency])
         raise KeyError(f"Unsupported dependency: {dependency!r}")
 
     def create_use_cases(self) -> dict[str, object]:
         repository = self.create_repository()
+        domain_service = ItemDomainService(create_id_strategy(self.settings.id_strategy))
         return {
-            "create": CreateItemUseCase(repository),
+            "create": CreateItemUseCase(repository, domain_service),
             "get": GetItemUseCase(repository),
             "list": ListItemsUseCase(repository),
+            "create_many": CreateItemsUseCase(repository, domain_service),
+            "get_many": GetItemsUseCase(repository),
+            "list_page": ListItemsPageUseCase(repository),
+            "stream": StreamItemsUseCase(repository),
+            "stats": AggregateItemsUseCase(repository),
+            "query": QueryItemsUseCase(repository),
+            "compact": CompactStorageUseCase(repository),
+            "ingest": IngestItemsUseCase(repository, domain_service),
         }
 
     def create_app_service(self) -> ApplicationService:
@@ -55,6 +188,51 @@ class ContainerFactory:
             create_use_case=use_cases["create"],
             get_use_case=use_cases["get"],
             list_use_case=use_cases["list"],
+            create_many_use_case=use_cases["create_many"],
+            get_many_use_case=use_cases["get_many"],
+            list_page_use_case=use_cases["list_page"],
+            stream_use_case=use_cases["stream"],
+            stats_use_case=use_cases["stats"],
+            query_use_case=use_cases["query"],
+            compact_use_case=use_cases["compact"],
+            ingest_use_case=use_cases["ingest"],
+        )
+
+    def create_async_use_cases(
+        self, repository: AsyncItemRepositoryPort | None = None
+    ) -> dict[str, object]:
+        repository = repository or self.create_async_repository()
+        domain_service = ItemDomainService(create_id_strategy(self.settings.id_strategy))
+        return {
+            "create": AsyncCreateItemUseCase(repository, domain_service),
+            "get": AsyncGetItemUseCase(repository),
+            "list": AsyncListItemsUseCase(repository),
+            "create_many": AsyncCreateItemsUseCase(repository, domain_service),
+            "get_many": AsyncGetItemsUseCase(repository),
+            "list_page": AsyncListItemsPageUseCase(repository),
+            "stream": AsyncStreamItemsUseCase(repository),
+            "stats": AsyncAggregateItemsUseCase(repository),
+            "query": AsyncQueryItemsUseCase(repository),
+            "compact": AsyncCompactStorageUseCase(repository),
+            "ingest": AsyncIngestItemsUseCase(repository, domain_service),
+        }
+
+    def create_async_app_service(
+        self, repository: AsyncItemRepositoryPort | None = None
+    ) -> AsyncApplicationService:
+        use_cases = self.create_async_use_cases(repository)
+        return AsyncApplicationService(
+            create_use_case=use_cases["create"],
+            get_use_case=use_cases["get"],
+            list_use_case=use_cases["list"],
+            create_many_use_case=use_cases["create_many"],
+            get_many_use_case=use_cases["get_many"],
+            list_page_use_case=use_cases["list_page"],
+            stream_use_case=use_cases["stream"],
+            stats_use_case=use_cases["stats"],
+            query_use_case=use_cases["query"],
+            compact_use_case=use_cases["compact"],
+            ingest_use_case=use_cases["ingest"],
         )
 
     def create_producer(self) -> IProducer:
@@ -72,3 +250,17 @@ class ContainerFactory:
 
     def create_facade(self) -> AppFacade:
         return AppFacade(self.create_app_service())
+
+    def create_async_facade(self, executor: BoundedExecutor | None = None) -> AsyncAppFacade:
+        repository = self.create_async_repository(executor)
+        return AsyncAppFacade(
+            self.create_async_app_service(repository), getattr(repository, "close", None)
+        )
+
+
+def _shard_path(path: str, shard: int | None) -> str:
+    """``items.json`` for an unsharded store, ``items.shard0.json`` for shard 0."""
+    if shard is None or path == ":memory:":
+        return path
+    location = Path(path)
+    return str(location.with_name(f"{location.stem}.shard{shard}{location.suffix}"))
@@ -1,5 +1,37 @@
 from __future__ import annotations
 
+import sqlite3
+from pathlib import Path
 
-def init_db() -> None:
-    return None
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (name);
+CREATE INDEX IF NOT EXISTS items_value ON items (value);
+"""
+PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+
+
+def connect(path: str | Path) -> sqlite3.Connection:
+    # Connections are confined to one thread by their owner; close() may run elsewhere.
+    connection = sqlite3.connect(
+        path, timeout=5.0, cached_statements=256, check_same_thread=False
+    )
+    for pragma in PRAGMAS:
+        connection.execute(pragma)
+    return connection
+
+
+def init_db(path: str | Path | None = None) -> None:
+    if path is None:
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = connect(path)
+    try:
+        with connection:
+            connection.executescript(SCHEMA)
+    finally:
+        connection.close()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class ExecutorStats:
+    max_workers: int
+    queue_size: int
+    running: int
+    queued: int
+    waiting: int
+    peak_queued: int
+    completed: int
+
+
+class BoundedExecutor:
+    """Thread pool for blocking calls made from async code, with a cap on queued work.
+
+    At most ``max_workers`` calls run at once and ``queue_size`` more wait for a worker;
+    further callers wait in their coroutine until a slot frees up, so a burst of requests
+    holds back its connections instead of growing an unbounded backlog of threads or
+    queued closures. ``stats`` reports how deep each of those stages is right now.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_size: int | None = None,
+        thread_name_prefix: str = "template-executor",
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+        self.queue_size = max_workers * 4 if queue_size is None else queue_size
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = asyncio.Semaphore(self.max_workers + self.queue_size)
+        # Worker threads update the counters, so they share a lock with ``stats``.
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._waiting = 0
+        self._peak_queued = 0
+        self._completed = 0
+
+    async def run(self, fn: Callable[..., T], *args: object) -> T:
+        with self._lock:
+            self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        try:
+            with self._lock:
+                self._queued += 1
+                self._peak_queued = max(self._peak_queued, self._queued)
+            try:
+                future = self._pool.submit(self._call, fn, *args)
+            except RuntimeError:
+                with self._lock:
+                    self._queued -= 1
+                raise
+            future.add_done_callback(self._forget_cancelled)
+            return await asyncio.wrap_future(future)
+        finally:
+            self._slots.release()
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self.max_workers,
+                queue_size=self.queue_size,
+                running=self._running,
+                queued=self._queued,
+                waiting=self._waiting,
+                peak_queued=self._peak_queued,
+                completed=self._completed,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def _call(self, fn: Callable[..., T], *args: object) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def _forget_cancelled(self, future: Future[object]) -> None:
+        # A future can only be cancelled before a worker picks it up, so ``_call``
+        # never ran to move it out of the queue.
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
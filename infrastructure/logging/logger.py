@@ -1,8 +1,18 @@
 from __future__ import annotations
 
 import logging
+from threading import Lock
+
+_configured = False
+_configure_lock = Lock()
 
 
 def get_logger(name: str) -> logging.Logger:
-    logging.basicConfig(level=logging.INFO)
+    global _configured
+    # Configure the root logger once; later calls skip both the lock and basicConfig.
+    if not _configured:
+        with _configure_lock:
+            if not _configured:
+                logging.basicConfig(level=logging.INFO)
+                _configured = True
     return logging.getLogger(name)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import sys
+import time
+from collections.abc import Callable
+
+from template.infrastructure.logging.logger import get_logger
+
+LISTEN_BACKLOG = 1024
+RESTART_BACKOFF_MAX_SECONDS = 10.0
+# A worker that exits this soon after starting counts as a crash loop and backs off.
+_QUICK_EXIT_SECONDS = 1.0
+_POLL_SECONDS = 0.05
+
+logger = get_logger(__name__)
+
+
+def bind_listener(host: str, port: int, reuse_port: bool) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    try:
+        sock.bind((host, port))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class PreforkSupervisor:
+    """Runs ``workers`` forked processes that serve one address and keeps them running.
+
+    The parent binds the address before forking, so a busy port fails at once and port
+    0 resolves to a single port. With ``SO_REUSEPORT`` (Linux, the BSDs, macOS) every
+    worker listens on its own socket bound to that address and the kernel spreads new
+    connections across them; elsewhere the parent listens and the workers inherit its
+    socket. ``serve`` gets the listening socket in the worker and blocks until told to
+    stop. Servers that bind by themselves, with ``SO_REUSEPORT``, pass
+    ``share_socket=False`` and get ``None`` instead.
+
+    A worker that exits is replaced, after a growing delay if workers keep dying right
+    after they start. SIGTERM or SIGINT to the parent sends SIGTERM to every worker so
+    it can drain its in-flight requests; workers still running after ``drain_seconds``
+    are killed.
+    """
+
+    def __init__(
+        self,
+        serve: Callable[[socket.socket | None], object],
+        workers: int,
+        host: str,
+        port: int,
+        drain_seconds: float = 30.0,
+        reuse_port: bool | None = None,
+        share_socket: bool = True,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.serve = serve
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.drain_seconds = drain_seconds
+        self.reuse_port = hasattr(socket, "SO_REUSEPORT") if reuse_port is None else reuse_port
+        self.share_socket = share_socket
+        if not share_socket and not self.reuse_port:
+            raise ValueError("Workers that bind their own socket need SO_REUSEPORT.")
+        self._listener: socket.socket | None = None
+        self._pids: dict[int, float] = {}
+        self._stopping = False
+        self._crashes = 0
+        self._respawn_at = 0.0
+
+    def run(self) -> int:
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Prefork workers need os.fork, which this platform lacks.")
+        self._listener = bind_listener(self.host, self.port, self.reuse_port)
+        if not self.reuse_port:
+            self._listener.listen(LISTEN_BACKLOG)
+        self.port = self._listener.getsockname()[1]
+        previous = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            while not self._stopping:
+                self._reap()
+                if len(self._pids) < self.workers and time.monotonic() >= self._respawn_at:
+                    self._spawn()
+                else:
+                    time.sleep(_POLL_SECONDS)
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            self._drain()
+            self._listener.close()
+        return 0
+
+    def _request_stop(self, signum: int, frame: object) -> None:
+        _ = signum, frame
+        self._stopping = True
+
+    def _spawn(self) -> None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker process
+            os._exit(self._run_worker())
+        self._pids[pid] = time.monotonic()
+
+    def _run_worker(self) -> int:  # pragma: no cover - runs in the worker process
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        listener = self._listener
+        try:
+            if self.reuse_port and listener is not None:
+                listener.close()
+                listener = None
+                if self.share_socket:
+                    listener = bind_listener(self.host, self.port, reuse_port=True)
+                    listener.listen(LISTEN_BACKLOG)
+            self.serve(listener)
+        except KeyboardInterrupt:
+            pass
+        except BaseException:
+            logger.exception("Worker %d failed.", os.getpid())
+            return 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        return 0
+
+    def _reap(self) -> None:
+        while self._pids:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            started = self._pids.pop(pid, None)
+            if started is None or self._stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if time.monotonic() - started < _QUICK_EXIT_SECONDS:
+                self._crashes += 1
+                delay = min(RESTART_BACKOFF_MAX_SECONDS, 0.1 * 2**self._crashes)
+                self._respawn_at = time.monotonic() + delay
+            else:
+                self._crashes = 0
+            logger.warning("Worker %d exited with status %d; starting a replacement.", pid, code)
+
+    def _drain(self) -> None:
+        for pid in self._pids:
+            _signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.drain_seconds
+        while self._pids and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(_POLL_SECONDS)
+        for pid in list(self._pids):
+            logger.warning("Worker %d did not drain in time; killing it.", pid)
+            _signal(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            del self._pids[pid]
+
+
+def _signal(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
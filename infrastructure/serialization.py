@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass, fields, is_dataclass
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+from threading import Lock
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+STREAM_CHUNK_ITEMS = 256
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_ROW_CHARS = 1024 * 1024
+
+Encoder = Callable[[object], str]
+
+_ENCODERS: dict[type, Encoder] = {}
+_ENCODERS_LOCK = Lock()
+
+
+def _float(value: float) -> str:
+    if value - value == 0.0:
+        return float.__repr__(value)
+    # NaN and the infinities, spelled the way ``json.dumps`` spells them.
+    return json.dumps(value)
+
+
+def _encode(value: object) -> str:
+    """``json.dumps(value, ensure_ascii=True)`` with dataclasses encoded as their fields."""
+    encoder = _ENCODERS.get(value.__class__)
+    if encoder is not None:
+        return encoder(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return encoder_for(value.__class__)(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(map(_encode, value)) + "]"
+    if isinstance(value, dict):
+        return (
+            "{"
+            + ", ".join(
+                f"{encode_basestring_ascii(key if isinstance(key, str) else json.dumps(key))}: "
+                f"{_encode(item)}"
+                for key, item in value.items()
+            )
+            + "}"
+        )
+    return json.dumps(value, ensure_ascii=True)
+
+
+def encoder_for(cls: type) -> Encoder:
+    """Encoder for the dataclass ``cls``, built once and cached.
+
+    The JSON key of every field is escaped up front, and one ``attrgetter`` reads all
+    field values per call. Fields annotated ``str``, ``float`` or ``int`` are written by
+    a direct helper when the value has exactly that type; anything else goes through the
+    generic encoder. The output is byte-identical to
+    ``json.dumps(asdict(obj), ensure_ascii=True)`` without building the intermediate dict.
+    """
+    encoder = _ENCODERS.get(cls)
+    if encoder is not None:
+        return encoder
+    names: list[str] = []
+    specs: list[tuple[str, type | None, Callable[..., str]]] = []
+    for index, field in enumerate(fields(cls)):
+        annotation = (
+            field.type if isinstance(field.type, str) else getattr(field.type, "__name__", "")
+        )
+        kind, helper = _FIELD_ENCODERS.get(annotation, (None, _encode))
+        key = ("{" if index == 0 else ", ") + encode_basestring_ascii(field.name) + ": "
+        names.append(field.name)
+        specs.append((key, kind, helper))
+    encoder = _object_encoder(tuple(names), tuple(specs))
+    with _ENCODERS_LOCK:
+        return _ENCODERS.setdefault(cls, encoder)
+
+
+def _object_encoder(
+    names: tuple[str, ...], specs: tuple[tuple[str, type | None, Callable[..., str]], ...]
+) -> Encoder:
+    if not names:
+        return lambda obj: "{}"
+    read = attrgetter(*names)
+    if len(names) == 1:
+        # ``attrgetter`` returns the bare value for a single name.
+        single = read
+        read = lambda obj: (single(obj),)
+
+    def encode(obj: object) -> str:
+        return (
+            "".join(
+                [
+                    key + (helper(value) if value.__class__ is kind else _encode(value))
+                    for (key, kind, helper), value in zip(specs, read(obj))
+                ]
+            )
+            + "}"
+        )
+
+    return encode
+
+
+_FIELD_ENCODERS: dict[str, tuple[type, Callable[..., str]]] = {
+    "str": (str, encode_basestring_ascii),
+    "float": (float, _float),
+    "int": (int, int.__repr__),
+}
+_ENCODERS.update(
+    {
+        str: encode_basestring_ascii,
+        float: _float,
+        int: int.__repr__,
+        bool: lambda value: "true" if value else "false",
+        type(None): lambda value: "null",
+    }
+)
+
+
+def _stdlib_dumps(payload: object) -> bytes:
+    # Every non-ASCII character is escaped, so the text is pure ASCII.
+    return _encode(payload).encode("ascii")
+
+
+JSON_BACKENDS: dict[str, Callable[[object], bytes]] = {"stdlib": _stdlib_dumps}
+if msgspec is not None:  # pragma: no cover - optional dependency
+    JSON_BACKENDS["msgspec"] = msgspec.json.encode
+if orjson is not None:  # pragma: no cover - optional dependency
+    JSON_BACKENDS["orjson"] = orjson.dumps
+JSON_BACKEND = next(name for name in ("orjson", "msgspec", "stdlib") if name in JSON_BACKENDS)
+_ARRAY_SEPARATORS = {"stdlib": b", "}
+
+
+def dumps(payload: object) -> bytes:
+    """Encode dataclasses, lists, dicts and scalars as JSON bytes ready for the wire.
+
+    Uses orjson or msgspec when installed, which emit compact UTF-8 and write NaN as
+    ``null``; otherwise the per-class encoders produce the same bytes as
+    ``json.dumps(..., ensure_ascii=True)`` over ``asdict``.
+    """
+    return JSON_BACKENDS[JSON_BACKEND](payload)
+
+
+def iter_ndjson(items: Iterable[object], chunk_items: int = STREAM_CHUNK_ITEMS) -> Iterator[bytes]:
+    """Encode dataclass instances as NDJSON, yielding one bytes chunk per ``chunk_items``."""
+    encode = JSON_BACKENDS[JSON_BACKEND]
+    chunk: list[bytes] = []
+    for item in items:
+        chunk.append(encode(item) + b"\n")
+        if len(chunk) >= chunk_items:
+            yield b"".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def aiter_ndjson(
+    items: AsyncIterable[object], chunk_items: int = STREAM_CHUNK_ITEMS
+) -> AsyncIterator[bytes]:
+    """``iter_ndjson`` over an async stream of items."""
+    encode = JSON_BACKENDS[JSON_BACKEND]
+    chunk: list[bytes] = []
+    async for item in items:
+        chunk.append(encode(item) + b"\n")
+        if len(chunk) >= chunk_items:
+            yield b"".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield b"".join(chunk)
+
+
+def iter_json_array(
+    items: Iterable[object], chunk_items: int = STREAM_CHUNK_ITEMS
+) -> Iterator[bytes]:
+    """Encode dataclass instances as one JSON array, byte-identical to ``dumps(list)``."""
+    encode = JSON_BACKENDS[JSON_BACKEND]
+    item_separator = _ARRAY_SEPARATORS.get(JSON_BACKEND, b",")
+    chunk: list[bytes] = [b"["]
+    separator = b""
+    for item in items:
+        chunk.append(separator + encode(item))
+        separator = item_separator
+        if len(chunk) >= chunk_items:
+            yield b"".join(chunk)
+            chunk.clear()
+    chunk.append(b"]")
+    yield b"".join(chunk)
+
+
+def _stdlib_loads(data: bytes) -> object:
+    return json.loads(data)
+
+
+# orjson rejects NaN and the infinities, which the stdlib reads; both raise ``ValueError``.
+loads: Callable[[bytes], object] = orjson.loads if orjson is not None else _stdlib_loads
+_WHITESPACE = " \t\r\n"
+_BLANK = b" \t\r\n"
+
+
+@dataclass(slots=True)
+class MalformedRow:
+    detail: str
+
+
+class JsonRowParser:
+    """Incremental parser for rows sent as one JSON array or as NDJSON, one per line.
+
+    ``feed`` takes the body as it arrives and returns the rows completed so far, and
+    ``close`` returns the rest, so a large body is never decoded in one piece. The
+    framing comes from the first non-blank byte: ``[`` opens a JSON array and anything
+    else is read as NDJSON. Rows that are not valid JSON come back as ``MalformedRow``;
+    NDJSON carries on with the next line, while a broken JSON array ends there.
+
+    An array row that does not decode yet is retried only once its buffered text has
+    doubled, so a row cut into many small pieces, or one that never becomes valid,
+    costs linear rather than quadratic decoding work. A row longer than
+    ``max_row_chars`` ends the array. NDJSON only searches each new piece for line
+    breaks; a line longer than ``max_row_chars`` bytes is reported as ``MalformedRow``
+    and skipped up to the next line break without being buffered.
+    """
+
+    def __init__(self, max_row_chars: int = MAX_ROW_CHARS) -> None:
+        self.framing: str | None = None
+        self.max_row_chars = max_row_chars
+        self._pending = bytearray()
+        self._skipping = False
+        self._text = ""
+        # Decoded text that arrived while a cut-off row waits for more of the body.
+        self._tail: list[str] = []
+        self._tail_chars = 0
+        self._chars = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        # Array states: "open", "first", "value", "separator", "end" and "failed".
+        self._state = "open"
+        # Buffered characters of an undecoded row needed before decoding is retried.
+        self._retry_chars = 0
+
+    def feed(self, data: bytes) -> list[object]:
+        return self._parse(data, final=False)
+
+    def close(self) -> list[object]:
+        return self._parse(b"", final=True)
+
+    def _parse(self, data: bytes, final: bool) -> list[object]:
+        if self.framing is None:
+            start = data.lstrip(_BLANK)
+            if not start:
+                return []
+            self.framing = "array" if start[:1] == b"[" else "ndjson"
+        if self.framing == "ndjson":
+            return self._parse_lines(data, final)
+        if self._state == "failed":
+            return []
+        try:
+            piece = self._chars.decode(data, final)
+        except UnicodeDecodeError:
+            return self._fail("Request body is not valid UTF-8.")
+        self._tail.append(piece)
+        self._tail_chars += len(piece)
+        if not final and len(self._text) + self._tail_chars < self._retry_chars:
+            return []
+        self._text = "".join([self._text, *self._tail])
+        self._tail = []
+        self._tail_chars = 0
+        return self._parse_array(final)
+
+    def _parse_lines(self, data: bytes, final: bool) -> list[object]:
+        rows: list[object] = []
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            if self._skipping:
+                self._skipping = False
+            elif self._pending:
+                self._pending += data[start:end]
+                self._parse_line(bytes(self._pending), rows)
+                self._pending.clear()
+            else:
+                self._parse_line(data[start:end], rows)
+            start = end + 1
+        if not self._skipping:
+            self._pending += data[start:]
+            if len(self._pending) > self.max_row_chars:
+                rows.append(self._too_long())
+                self._pending.clear()
+                self._skipping = True
+        if final:
+            self._parse_line(bytes(self._pending), rows)
+            self._pending.clear()
+        return rows
+
+    def _parse_line(self, line: bytes, rows: list[object]) -> None:
+        if not line.strip(_BLANK):
+            return
+        if len(line) > self.max_row_chars:
+            rows.append(self._too_long())
+            return
+        try:
+            rows.append(loads(line))
+        except ValueError:
+            rows.append(MalformedRow("Row is not valid JSON."))
+
+    def _too_long(self) -> MalformedRow:
+        return MalformedRow(f"Row is longer than {self.max_row_chars} bytes.")
+
+    def _parse_array(self, final: bool) -> list[object]:
+        rows: list[object] = []
+        text = self._text
+        position = 0
+        while True:
+            while position < len(text) and text[position] in _WHITESPACE:
+                position += 1
+            if position == len(text):
+                break
+            char = text[position]
+            if self._state == "open":
+                self._state = "first"
+                position += 1
+            elif self._state == "separator" or (self._state == "first" and char == "]"):
+                if char not in ",]":
+                    return rows + self._fail("Request body is not a valid JSON array.")
+                self._state = "value" if char == "," else "end"
+                position += 1
+            elif self._state == "end":
+                return rows + self._fail("Unexpected data after the JSON array.")
+            else:
+                try:
+                    row, end = self._decoder.raw_decode(text, position)
+                except ValueError:
+                    if final:
+                        return rows + self._fail("Request body is not a valid JSON array.")
+                    end = len(text)
+                if end == len(text) and not final:
+                    # Most likely a row cut off by the end of this piece of the body, or a
+                    # number at the very end that may still have digits to come.
+                    buffered = len(text) - position
+                    if buffered > self.max_row_chars:
+                        return rows + self._fail(
+                            f"Row is not valid JSON or longer than {self.max_row_chars} characters."
+                        )
+                    self._retry_chars = 2 * buffered
+                    break
+                self._retry_chars = 0
+                rows.append(row)
+                self._state = "separator"
+                position = end
+        self._text = text[position:]
+        if final and self._state not in ("end", "failed"):
+            rows += self._fail("Request body is not a valid JSON array.")
+        return rows
+
+    def _fail(self, detail: str) -> list[object]:
+        self._state = "failed"
+        self._text = ""
+        return [MalformedRow(detail)]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from template.app.facade import AppFacade
+from template.app.facade import AppFacade, AsyncAppFacade
 from template.infrastructure.config.settings import Settings
 from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
 
 
 def bootstrap(settings: Settings | None = None) -> AppFacade:
     return ContainerFactory(settings=settings).create_facade()
+
+
+def bootstrap_async(
+    settings: Settings | None = None, executor: BoundedExecutor | None = None
+) -> AsyncAppFacade:
+    return ContainerFactory(settings=settings).create_async_facade(executor)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+from template.app.adapters.output.files.file import FileItemRepository
+from template.app.adapters.output.files.log import LogItemRepository, read_log_items
+from template.core.application.ports.output.repository_port import ItemRepositoryPort
+
+ITEMS_FILE_FORMATS = ("json", "ndjson", "binary")
+
+
+def open_items_file(
+    path: str | Path,
+    file_format: str = "json",
+    compression: str = "none",
+    compaction_ratio: float | None = None,
+) -> ItemRepositoryPort:
+    if file_format == "ndjson":
+        return LogItemRepository(path, compaction_ratio)
+    return FileItemRepository(path, file_format, compression)
+
+
+def convert_items_file(
+    source: str | Path,
+    target: str | Path,
+    source_format: str,
+    target_format: str,
+    compression: str = "none",
+) -> int:
+    """Copy every item from one items file into a new file of another format.
+
+    Returns the number of items written. ``target`` must not exist yet, so a log target
+    is never appended to an unrelated history. The source is only read, and the target
+    is built in a temporary directory beside it and moved into place once complete, so
+    a failed conversion leaves neither file changed.
+    """
+    for file_format in (source_format, target_format):
+        if file_format not in ITEMS_FILE_FORMATS:
+            raise ValueError(
+                f"Unsupported file format {file_format!r}; "
+                f"expected one of {', '.join(ITEMS_FILE_FORMATS)}."
+            )
+    if compression != "none" and target_format != "binary":
+        raise ValueError(
+            f"Compression {compression!r} applies only to binary targets, not {target_format}."
+        )
+    source, target = Path(source), Path(target)
+    if not source.exists():
+        raise FileNotFoundError(f"Source file {source} does not exist.")
+    if target.exists():
+        raise FileExistsError(f"Target file {target} already exists.")
+    if source_format == "ndjson":
+        items = read_log_items(source)
+    else:
+        items = FileItemRepository(source, source_format).list()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Sidecars the writer creates (the log index, the file lock) stay behind in here.
+    with tempfile.TemporaryDirectory(dir=target.parent, prefix=f".{target.name}.") as staging:
+        partial = Path(staging) / target.name
+        writer = open_items_file(partial, target_format, compression)
+        try:
+            count = len(writer.save_many(items))
+        finally:
+            close = getattr(writer, "close", None)
+            if close is not None:
+                close()
+        os.replace(partial, target)
+    return count
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from template.app.adapters.output.db.repository import (
+    AsyncInMemoryItemRepository,
+    InMemoryItemRepository,
+)
+from template.app.adapters.output.db.sqlite import AsyncSqliteItemRepository, aiosqlite
+from template.app.adapters.output.offload.repository import ThreadOffloadItemRepository
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import (
+    InvalidCursorError,
+    InvalidQueryError,
+    ItemNotFoundError,
+)
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+
+
+class _SlowRepository(InMemoryItemRepository):
+    def get(self, item_id: str) -> Item | None:
+        time.sleep(0.2)
+        return super().get(item_id)
+
+
+class AsyncStackTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.executor = BoundedExecutor(2)
+        self.addCleanup(self.executor.shutdown)
+
+    def _settings(self) -> list[Settings]:
+        settings = [
+            Settings(repository_type="memory"),
+            Settings(repository_type="file", items_file_path=str(self.directory / "items.json")),
+            Settings(
+                repository_type="file",
+                items_file_format="ndjson",
+                items_file_path=str(self.directory / "items.ndjson"),
+            ),
+            Settings(repository_type="memory", cache_size=16),
+        ]
+        if aiosqlite is not None:
+            settings.append(
+                Settings(repository_type="sqlite", sqlite_path=str(self.directory / "items.db"))
+            )
+        return settings
+
+    async def test_every_backend_serves_the_facade(self) -> None:
+        for settings in self._settings():
+            with self.subTest(settings=settings):
+                async with ContainerFactory(settings).create_async_facade(self.executor) as facade:
+                    created = await facade.create_items(
+                        (f"item-{index}", float(index)) for index in range(5)
+                    )
+                    fetched = await facade.get_items([created[3].id, created[1].id])
+                    first = await facade.list_items_page(limit=2)
+                    second = await facade.list_items_page(limit=2, cursor=first.next_cursor)
+                    top = await facade.query_items(sort="-value", limit=2)
+                    below = await facade.query_items(sort="-value", limit=2, cursor=top.next_cursor)
+                    stats = await facade.item_stats([50], bins=2, group_prefix=4)
+                    streamed = [item.name async for item in facade.iter_items()]
+                    with self.assertRaises(ItemNotFoundError):
+                        await facade.get_item("missing")
+                    with self.assertRaises(InvalidCursorError):
+                        await facade.list_items_page(cursor="missing")
+                    with self.assertRaises(InvalidQueryError):
+                        await facade.query_items(sort="color")
+
+                self.assertEqual([item.name for item in fetched], ["item-3", "item-1"])
+                self.assertEqual(
+                    [item.name for item in first.items + second.items],
+                    ["item-0", "item-1", "item-2", "item-3"],
+                )
+                self.assertEqual([item.value for item in top.items + below.items], [4, 3, 2, 1])
+                self.assertEqual((stats.count, stats.percentiles["p50"]), (5, 2.0))
+                self.assertEqual(list(stats.groups), ["item"])
+                self.assertEqual(streamed, [f"item-{index}" for index in range(5)])
+
+    async def test_container_picks_an_adapter_per_backend(self) -> None:
+        cases = [
+            (Settings(repository_type="memory"), AsyncInMemoryItemRepository),
+            (Settings(repository_type="memory", shard_count=2), ThreadOffloadItemRepository),
+            (
+                Settings(repository_type="file", items_file_path=str(self.directory / "a.json")),
+                ThreadOffloadItemRepository,
+            ),
+        ]
+        if aiosqlite is not None:
+            cases.append(
+                (
+                    Settings(repository_type="sqlite", sqlite_path=str(self.directory / "a.db")),
+                    AsyncSqliteItemRepository,
+                )
+            )
+        for settings, expected in cases:
+            with self.subTest(settings=settings):
+                repository = ContainerFactory(settings).create_async_repository()
+                self.assertIsInstance(repository, expected)
+                close = getattr(repository, "close", None)
+                if close is not None:
+                    await close()
+
+    async def test_offloaded_calls_run_concurrently_on_the_executor(self) -> None:
+        backend = _SlowRepository()
+        item = backend.save(Item(name="slow", value=1.0, id="item-1"))
+        repository = ThreadOffloadItemRepository(backend, self.executor)
+
+        started = time.perf_counter()
+        results = [await repository.get(item.id), await repository.get(item.id)]
+        sequential = time.perf_counter() - started
+        started = time.perf_counter()
+        concurrent = await asyncio.gather(repository.get(item.id), repository.get(item.id))
+        overlapped = time.perf_counter() - started
+
+        self.assertEqual(results, [item, item])
+        self.assertEqual(concurrent, [item, item])
+        self.assertLess(overlapped, sequential * 0.8)
+        self.assertEqual(self.executor.stats().completed, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
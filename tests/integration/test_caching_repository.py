@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from template.app.adapters.output.cache.repository import CachingItemRepository
+from template.app.adapters.output.db.repository import InMemoryItemRepository
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.core.application.ports.output.repository_port import ItemAggregationPort
+from template.core.domain.entities.model import Item
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CachingItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = InMemoryItemRepository()
+        self.clock = FakeClock()
+        self.repository = CachingItemRepository(
+            self.backend, max_entries=2, ttl_seconds=10, clock=self.clock
+        )
+        self.items = self.backend.save_many(
+            [Item(name=f"item-{index}", value=1.0) for index in range(3)]
+        )
+
+    def test_repeated_gets_are_served_from_cache(self) -> None:
+        with patch.object(self.backend, "get", wraps=self.backend.get) as backend_get:
+            for _ in range(3):
+                self.assertEqual(self.repository.get(self.items[0].id), self.items[0])
+
+        backend_get.assert_called_once_with(self.items[0].id)
+        stats = self.repository.stats
+        self.assertEqual((stats.hits, stats.misses, stats.size), (2, 1, 1))
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+
+    def test_missing_ids_are_cached_negatively(self) -> None:
+        with patch.object(self.backend, "get", wraps=self.backend.get) as backend_get:
+            self.assertIsNone(self.repository.get("missing"))
+            self.assertIsNone(self.repository.get("missing"))
+
+        backend_get.assert_called_once_with("missing")
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        first, second, third = (item.id for item in self.items)
+        self.repository.get(first)
+        self.repository.get(second)
+        self.repository.get(first)
+        self.repository.get(third)
+
+        with patch.object(self.backend, "get", wraps=self.backend.get) as backend_get:
+            self.repository.get(first)
+            self.repository.get(second)
+
+        backend_get.assert_called_once_with(second)
+        self.assertEqual(self.repository.stats.evictions, 2)
+
+    def test_entries_expire_after_ttl(self) -> None:
+        self.repository.get(self.items[0].id)
+        self.clock.now = 10.0
+
+        with patch.object(self.backend, "get", wraps=self.backend.get) as backend_get:
+            self.repository.get(self.items[0].id)
+
+        backend_get.assert_called_once()
+
+    def test_save_invalidates_cached_and_negative_entries(self) -> None:
+        self.repository.get(self.items[0].id)
+        self.repository.get("late")
+        renamed = Item(name="renamed", value=2.0, id=self.items[0].id)
+
+        self.repository.save(renamed)
+        self.repository.save_many([Item(name="late", value=3.0, id="late")])
+
+        self.assertEqual(self.repository.get(self.items[0].id), renamed)
+        self.assertEqual(self.repository.get("late"), Item(name="late", value=3.0, id="late"))
+
+    def test_get_many_fetches_only_uncached_ids(self) -> None:
+        self.repository.get(self.items[0].id)
+
+        with patch.object(
+            self.backend, "get_many", wraps=self.backend.get_many
+        ) as backend_get_many:
+            found = self.repository.get_many([self.items[1].id, "missing", self.items[0].id])
+
+        self.assertEqual(found, [self.items[1], self.items[0]])
+        backend_get_many.assert_called_once_with([self.items[1].id, "missing"])
+
+    def test_read_that_raced_with_a_save_is_not_cached(self) -> None:
+        stale = self.items[0]
+        fresh = Item(name="fresh", value=9.0, id=stale.id)
+
+        def save_during_read(item_id: str) -> Item | None:
+            self.repository.save(fresh)
+            return stale
+
+        with patch.object(self.backend, "get", side_effect=save_during_read):
+            self.assertEqual(self.repository.get(stale.id), stale)
+
+        self.assertEqual(self.repository.get(stale.id), fresh)
+
+    def test_optional_backend_capabilities_pass_through(self) -> None:
+        self.assertNotIsInstance(self.repository, ItemAggregationPort)
+        self.assertFalse(hasattr(self.repository, "compact"))
+
+    def test_container_wraps_backend_when_cache_is_configured(self) -> None:
+        repository = ContainerFactory(
+            Settings(
+                repository_type="sqlite",
+                sqlite_path=":memory:",
+                cache_size=8,
+                cache_ttl_seconds=1.5,
+            )
+        ).create_repository()
+
+        self.assertIsInstance(repository, CachingItemRepository)
+        self.assertIsInstance(repository, ItemAggregationPort)
+        self.assertIsInstance(repository._backend, SqliteItemRepository)  # type: ignore[attr-defined]
+        repository.close()  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import gc
+import json
+
 import pytest
 
 pytest.importorskip("typer")
@@ -40,3 +43,70 @@ def test_each_autodiscovered_group_exposes_help(group_name: str) -> None:
 
     assert result.exit_code == 0
     assert group_name in result.stdout
+
+
+@pytest.mark.parametrize(("flags", "expected"), [([], "[]\n"), (["--ndjson"], "")])
+def test_items_list_streams_empty_store(flags: list[str], expected: str) -> None:
+    result = runner.invoke(app, ["items", "list", *flags])
+
+    assert result.exit_code == 0
+    assert result.stdout == expected
+
+
+def test_items_stats_reports_empty_store() -> None:
+    result = runner.invoke(app, ["items", "stats", "-p", "50", "--bins", "2"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {
+        "count": 0,
+        "sum": 0.0,
+        "mean": None,
+        "min": None,
+        "max": None,
+        "percentiles": {},
+        "histogram": [],
+        "groups": {},
+    }
+
+
+# Each CLI invocation opens the log repository and leaves closing it to process exit;
+# the handles are collected inside this test so their warnings cannot leak into others.
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
+def test_maintenance_compact_prints_report_for_log_storage(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("TEMPLATE_REPOSITORY_TYPE", "file")
+    monkeypatch.setenv("TEMPLATE_ITEMS_FILE_FORMAT", "ndjson")
+    monkeypatch.setenv("TEMPLATE_ITEMS_FILE_PATH", str(tmp_path / "items.ndjson"))
+    assert runner.invoke(app, ["items", "create", "demo", "1"]).exit_code == 0
+    assert runner.invoke(app, ["items", "create", "demo", "2"]).exit_code == 0
+
+    result = runner.invoke(app, ["maintenance", "compact"])
+
+    assert result.exit_code == 0
+    report = json.loads(result.stdout)
+    assert report["items"] == 2
+    assert report["saved_bytes"] == 0
+    gc.collect()
+
+
+def test_maintenance_compact_skips_in_memory_storage() -> None:
+    result = runner.invoke(app, ["maintenance", "compact"])
+
+    assert result.exit_code == 0
+    assert "does not need compaction" in result.stdout
+
+
+def test_maintenance_convert_writes_binary_items_file(tmp_path) -> None:
+    source = tmp_path / "items.json"
+    source.write_text('[{"id": "item-1", "name": "demo", "value": 1.5}]', encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["maintenance", "convert", str(source), str(tmp_path / "items.bin"), "--to", "binary"],
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["items"] == 1
+    repeated = runner.invoke(
+        app, ["maintenance", "convert", str(source), str(tmp_path / "items.bin")]
+    )
+    assert repeated.exit_code != 0
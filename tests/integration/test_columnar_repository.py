@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import unittest
+
+from template.app.adapters.output.db.columnar import ColumnarItemRepository
+from template.core.application.dtos.dto import ItemStatsQuery
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class ColumnarItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repository = ColumnarItemRepository()
+
+    def test_round_trip_and_overwrite_keeps_row(self) -> None:
+        first = self.repository.save(Item(name="first", value=1.0))
+        second = self.repository.save(Item(name="second", value=2.0))
+        self.repository.save(Item(name="renamed", value=3.0, id=first.id))
+
+        self.assertEqual(
+            self.repository.get(first.id), Item(name="renamed", value=3.0, id=first.id)
+        )
+        self.assertIsNone(self.repository.get("00000000-0000-0000-0000-000000000000"))
+        self.assertEqual([item.id for item in self.repository.list()], [first.id, second.id])
+        self.assertEqual(len(self.repository), 2)
+
+    def test_non_uuid_ids_fall_back_to_text_lookup(self) -> None:
+        self.repository.save(Item(name="text", value=1.0, id="item-1"))
+        upper = Item(name="upper", value=2.0, id="8F0C2B6E-1D34-4B8A-9E0A-3C2E5A7D9B11")
+        self.repository.save(upper)
+
+        self.assertEqual(self.repository.get("item-1"), Item(name="text", value=1.0, id="item-1"))
+        self.assertEqual(self.repository.get(upper.id), upper)
+        self.assertIsNone(self.repository.get(upper.id.lower()))
+
+    def test_lookups_survive_hash_table_growth(self) -> None:
+        items = self.repository.save_many(
+            [Item(name=f"name-{index % 3}", value=float(index)) for index in range(5_000)]
+        )
+
+        found = self.repository.get_many([items[4_999].id, "missing", items[0].id])
+
+        self.assertEqual(found, [items[4_999], items[0]])
+        self.assertEqual(self.repository.list(), items)
+
+    def test_list_page_continues_after_cursor(self) -> None:
+        items = self.repository.save_many(
+            [Item(name=f"item-{index}", value=1.0) for index in range(5)]
+        )
+
+        first = self.repository.list_page(2)
+        second = self.repository.list_page(2, cursor=first[-1].id)
+
+        self.assertEqual(first + second, items[:4])
+        with self.assertRaises(InvalidCursorError):
+            self.repository.list_page(2, cursor="missing")
+
+    def test_aggregate_groups_by_name_prefix(self) -> None:
+        self.repository.save_many(
+            [
+                Item(name="alpha", value=1.0),
+                Item(name="beta", value=2.0),
+                Item(name="alps", value=5.0),
+            ]
+        )
+
+        stats = self.repository.aggregate(
+            ItemStatsQuery(percentiles=(50.0,), bins=2, group_prefix=2)
+        )
+
+        self.assertEqual((stats.count, stats.sum, stats.min, stats.max), (3, 8.0, 1.0, 5.0))
+        self.assertEqual(
+            {key: group.count for key, group in stats.groups.items()}, {"al": 2, "be": 1}
+        )
+        self.assertEqual(stats.groups["al"].percentiles, {"p50": 3.0})
+
+    def test_container_selects_columnar_repository(self) -> None:
+        repository = ContainerFactory(Settings(repository_type="columnar")).create_repository()
+
+        self.assertIsInstance(repository, ColumnarItemRepository)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import os
+import time
 import unittest
 from asyncio import Queue
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from template.app.web import dependencies
 
 from template.infrastructure.startup import bootstrap
 from template.infrastructure.container import ContainerFactory
@@ -32,6 +37,41 @@ class ContainerIntegrationTestCase(unittest.TestCase):
         self.assertEqual(produced[0]["source_id"], "demo-source")
         self.assertEqual(consumed["status"], "processed")
 
+    def test_batch_round_trip_through_facade(self) -> None:
+        facade = ContainerFactory().create_facade()
+
+        created = facade.create_items([("first", 1.0), ("second", 2.0)])
+        fetched = facade.get_items([created[1].id, created[0].id])
+
+        self.assertEqual([item.name for item in fetched], ["second", "first"])
+
+    def test_pages_walk_every_item_once(self) -> None:
+        facade = ContainerFactory().create_facade()
+        created = facade.create_items((f"item-{index}", float(index)) for index in range(7))
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = facade.list_items_page(limit=3, cursor=cursor)
+            seen.extend(item.id for item in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(seen, [item.id for item in created])
+
+    def test_iter_items_tolerates_saves_while_streaming(self) -> None:
+        facade = ContainerFactory().create_facade()
+        facade.create_items((f"item-{index}", float(index)) for index in range(3))
+
+        streamed = []
+        for item in facade.iter_items():
+            streamed.append(item.name)
+            if len(streamed) == 1:
+                facade.create_item("late", 9.0)
+
+        self.assertEqual(streamed, ["item-0", "item-1", "item-2", "late"])
+
     def test_resolve_queue_returns_singleton(self) -> None:
         container = ContainerFactory()
 
@@ -40,3 +80,18 @@ class ContainerIntegrationTestCase(unittest.TestCase):
 
         self.assertIs(first, second)
         self.assertIsInstance(first, AsyncQueue)
+
+    def test_get_facade_bootstraps_once_for_concurrent_first_calls(self) -> None:
+        def slow_bootstrap() -> object:
+            time.sleep(0.01)
+            return object()
+
+        with (
+            patch.object(dependencies, "_facade", None),
+            patch.object(dependencies, "bootstrap", side_effect=slow_bootstrap) as bootstrap,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            facades = list(pool.map(lambda _: dependencies.get_facade(), range(8)))
+
+        bootstrap.assert_called_once_with()
+        self.assertTrue(all(facade is facades[0] for facade in facades))
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from template.app.adapters.output.files.codec import decode_items, is_binary_items
+from template.app.adapters.output.files.file import FileItemRepository
+from template.app.adapters.output.files.log import LogItemRepository
+from template.core.domain.entities.model import Item
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.storage import convert_items_file
+
+
+class FileItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "items.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trip(self) -> None:
+        repository = FileItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        repository.save(Item(name="second", value=2.0, id="item-2"))
+
+        reopened = FileItemRepository(self.path)
+
+        self.assertEqual(reopened.get("item-2"), Item(name="second", value=2.0, id="item-2"))
+        self.assertEqual([item.id for item in reopened.list()], ["item-1", "item-2"])
+
+    def test_parsed_items_are_reused_until_file_changes(self) -> None:
+        FileItemRepository(self.path).save(Item(name="first", value=1.0, id="item-1"))
+        repository = FileItemRepository(self.path)
+
+        with patch("template.app.adapters.output.files.file.json.loads", wraps=json.loads) as loads:
+            repository.get("item-1")
+            repository.list()
+            repository.save(Item(name="second", value=2.0, id="item-2"))
+            repository.get("item-2")
+
+        self.assertEqual(loads.call_count, 1)
+
+    def test_external_edit_is_picked_up(self) -> None:
+        repository = FileItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        self.path.write_text(
+            json.dumps([{"id": "item-1", "name": "edited elsewhere", "value": 10.0}]),
+            encoding="utf-8",
+        )
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(repository.get("item-1").name, "edited elsewhere")  # type: ignore[union-attr]
+
+    def test_list_page_continues_after_cursor(self) -> None:
+        repository = FileItemRepository(self.path)
+        items = repository.save_many([Item(name=f"item-{index}", value=1.0) for index in range(5)])
+
+        page = repository.list_page(2, cursor=items[2].id)
+
+        self.assertEqual(page, items[3:5])
+
+    def test_concurrent_writers_do_not_lose_items(self) -> None:
+        # Separate instances share nothing but the file, like separate processes do.
+        repositories = [FileItemRepository(self.path) for _ in range(4)]
+
+        def save_range(worker: int) -> None:
+            for index in range(25):
+                repositories[worker].save(Item(name="w", value=1.0, id=f"{worker}-{index}"))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(save_range, range(4)))
+
+        self.assertEqual(len(FileItemRepository(self.path).list()), 100)
+        self.assertFalse(self.path.with_name("items.json.tmp").exists())
+
+
+class BinaryFileItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trip_in_binary_format(self) -> None:
+        path = self.root / "items.bin"
+        repository = FileItemRepository(path, file_format="binary", compression="zlib")
+        saved = repository.save_many(
+            [Item(name=f"item-{index}", value=index) for index in range(5)]
+        )
+
+        reopened = FileItemRepository(path, file_format="binary")
+
+        self.assertEqual(reopened.list(), saved)
+        self.assertTrue(is_binary_items(path.read_bytes()))
+
+    def test_unknown_format_or_compression_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            FileItemRepository(self.root / "items.xml", file_format="xml")
+        with self.assertRaises(ValueError):
+            FileItemRepository(self.root / "items.bin", file_format="binary", compression="zip")
+
+    def test_container_selects_binary_format(self) -> None:
+        path = self.root / "items.bin"
+        repository = ContainerFactory(
+            Settings(
+                repository_type="file",
+                items_file_path=str(path),
+                items_file_format="binary",
+                items_file_compression="lzma",
+            )
+        ).create_repository()
+
+        repository.save(Item(name="demo", value=1.0))
+
+        self.assertIsInstance(repository, FileItemRepository)
+        self.assertEqual(len(decode_items(path.read_bytes())), 1)
+
+    def test_convert_between_every_format(self) -> None:
+        items = [Item(name=f"item-{index}", value=float(index)) for index in range(4)]
+        FileItemRepository(self.root / "items.json").save_many(items)
+
+        written = [
+            convert_items_file(
+                self.root / "items.json", self.root / "items.bin", "json", "binary", "zlib"
+            ),
+            convert_items_file(
+                self.root / "items.bin", self.root / "items.ndjson", "binary", "ndjson"
+            ),
+            convert_items_file(
+                self.root / "items.ndjson", self.root / "back.json", "ndjson", "json"
+            ),
+        ]
+
+        self.assertEqual(written, [4, 4, 4])
+        self.assertEqual(FileItemRepository(self.root / "back.json").list(), items)
+
+    def test_convert_refuses_to_overwrite_target(self) -> None:
+        FileItemRepository(self.root / "items.json").save(Item(name="demo", value=1.0))
+        (self.root / "items.bin").write_bytes(b"keep")
+
+        with self.assertRaises(FileExistsError):
+            convert_items_file(self.root / "items.json", self.root / "items.bin", "json", "binary")
+        with self.assertRaises(FileNotFoundError):
+            convert_items_file(self.root / "missing.json", self.root / "new.bin", "json", "binary")
+        self.assertEqual((self.root / "items.bin").read_bytes(), b"keep")
+
+    def test_convert_leaves_an_ndjson_source_untouched(self) -> None:
+        records = b"".join(
+            json.dumps({"id": f"item-{index}", "name": "demo", "value": index}).encode() + b"\n"
+            for index in range(2)
+        )
+        source = self.root / "items.ndjson"
+        source.write_bytes(records + b'{"id": "torn"')
+
+        written = convert_items_file(source, self.root / "items.json", "ndjson", "json")
+
+        self.assertEqual(written, 2)
+        self.assertEqual(source.read_bytes(), records + b'{"id": "torn"')
+        self.assertEqual(
+            sorted(path.name for path in self.root.iterdir()), ["items.json", "items.ndjson"]
+        )
+
+    def test_failed_convert_leaves_no_target(self) -> None:
+        FileItemRepository(self.root / "items.json").save(Item(name="demo", value=1.0))
+
+        with (
+            patch.object(LogItemRepository, "save_many", side_effect=OSError("disk full")),
+            self.assertRaises(OSError),
+        ):
+            convert_items_file(
+                self.root / "items.json", self.root / "items.ndjson", "json", "ndjson"
+            )
+
+        self.assertEqual([path.name for path in self.root.glob("*ndjson*")], [])
+
+    def test_convert_rejects_compression_for_text_targets(self) -> None:
+        FileItemRepository(self.root / "items.json").save(Item(name="demo", value=1.0))
+
+        for target_format in ("json", "ndjson"):
+            with self.subTest(target_format=target_format), self.assertRaises(ValueError):
+                convert_items_file(
+                    self.root / "items.json", self.root / "out", "json", target_format, "zlib"
+                )
+        self.assertFalse((self.root / "out").exists())
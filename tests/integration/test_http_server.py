@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from collections.abc import Iterator
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+
+from template.app.adapters.input.rest.http_controller import HttpController, HttpResponse
+from template.app.facade import AppFacade
+from template.app.web.server import AsyncHttpServer, make_threaded_handler
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+
+
+class _SlowController(HttpController):
+    def __init__(self, facade: AppFacade) -> None:
+        super().__init__(facade)
+        self.started = threading.Event()
+
+    def handle(self, method: str, target: str, body: bytes = b"") -> HttpResponse:
+        self.started.set()
+        time.sleep(0.2)
+        return super().handle(method, target, body)
+
+
+class _BrokenStreamController(HttpController):
+    def handle(self, method: str, target: str, body: bytes = b"") -> HttpResponse:
+        def stream() -> Iterator[bytes]:
+            yield b"first\n"
+            raise RuntimeError("storage went away")
+
+        return HttpResponse(200, stream=stream())
+
+
+def _controller() -> HttpController:
+    return HttpController(ContainerFactory(Settings(repository_type="memory")).create_facade())
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, dict[str, str], bytes]:
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(head[0].split(" ")[1])
+    headers = {
+        name.lower(): value.strip()
+        for name, _, value in (line.partition(":") for line in head[1:] if line)
+    }
+    if headers.get("transfer-encoding") == "chunked":
+        body = b""
+        while size := int(await reader.readuntil(b"\r\n"), 16):
+            body += (await reader.readexactly(size + 2))[:-2]
+        await reader.readexactly(2)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+    return status, headers, body
+
+
+def _post(path: str, payload: object) -> bytes:
+    body = json.dumps(payload).encode()
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+
+
+class AsyncHttpServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.executor = BoundedExecutor(2, 2)
+        self.server = AsyncHttpServer(_controller(), self.executor, keepalive_seconds=1.0)
+        self.listener = await self.server.start("127.0.0.1", 0)
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+
+    async def asyncTearDown(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.listener.close()
+        await self.listener.wait_closed()
+        self.executor.shutdown()
+
+    async def test_connection_is_reused_across_requests(self) -> None:
+        self.writer.write(_post("/items", {"name": "a", "value": 1}))
+        status, headers, body = await _read_response(self.reader)
+        item_id = json.loads(body)["id"]
+        self.writer.write(f"GET /items/{item_id} HTTP/1.1\r\nHost: test\r\n\r\n".encode())
+        fetched = await _read_response(self.reader)
+
+        self.assertEqual((status, headers["connection"]), (201, "keep-alive"))
+        self.assertEqual(fetched[0], 200)
+        self.assertEqual(json.loads(fetched[2])["name"], "a")
+
+    async def test_pipelined_requests_are_answered_in_order(self) -> None:
+        self.writer.write(
+            _post("/items:batch", [{"name": f"item-{index}", "value": index} for index in range(3)])
+            + b"GET /items?limit=2 HTTP/1.1\r\nHost: test\r\n\r\n"
+            + b"GET /missing HTTP/1.1\r\nHost: test\r\n\r\n"
+            + b"GET /items:stats HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n"
+        )
+
+        responses = [await _read_response(self.reader) for _ in range(4)]
+
+        self.assertEqual([status for status, _, _ in responses], [201, 200, 404, 200])
+        created = json.loads(responses[0][2])
+        self.assertEqual([row["row"] for row in created], [0, 1, 2])
+        self.assertEqual(
+            [item["id"] for item in json.loads(responses[1][2])],
+            [row["id"] for row in created[:2]],
+        )
+        self.assertEqual(responses[1][1]["x-next-cursor"], created[1]["id"])
+        self.assertEqual(json.loads(responses[3][2])["count"], 3)
+        self.assertEqual(responses[3][1]["connection"], "close")
+        self.assertEqual(await self.reader.read(), b"")
+
+    async def test_ndjson_streams_chunked_and_keeps_the_connection(self) -> None:
+        body = b'[{"name": "a", "value": 1}, {"name": "b", "value": 2}]'
+        self.writer.write(
+            b"POST /items:batch HTTP/1.1\r\nHost: test\r\nTransfer-Encoding: chunked\r\n\r\n"
+            + b"%x\r\n%b\r\n" % (10, body[:10])
+            + b"%x\r\n%b\r\n0\r\n\r\n" % (len(body) - 10, body[10:])
+            + b"GET /items?format=ndjson HTTP/1.1\r\nHost: test\r\n\r\n"
+        )
+
+        created = await _read_response(self.reader)
+        status, headers, streamed = await _read_response(self.reader)
+
+        self.assertEqual(created[0], 201)
+        self.assertEqual((status, headers["transfer-encoding"]), (200, "chunked"))
+        self.assertEqual([json.loads(line)["name"] for line in streamed.splitlines()], ["a", "b"])
+        self.writer.write(b"GET /items HTTP/1.1\r\nHost: test\r\n\r\n")
+        self.assertEqual((await _read_response(self.reader))[0], 200)
+
+    async def test_batch_reports_a_result_per_row(self) -> None:
+        rows = [
+            b'{"name": "a", "value": 1}',
+            b'{"name": "", "value": 2}',
+            b"not json",
+            b'{"name": "d"}',
+            b'{"name": "e", "value": "5"}',
+        ]
+        body = b"\n".join(rows) + b"\n"
+        self.writer.write(
+            b"POST /items:batch HTTP/1.1\r\nHost: test\r\nContent-Type: application/x-ndjson\r\n"
+            + b"Content-Length: %d\r\n\r\n%b" % (len(body), body)
+            + b"GET /items HTTP/1.1\r\nHost: test\r\n\r\n"
+        )
+
+        status, headers, results = await _read_response(self.reader)
+        stored = json.loads((await _read_response(self.reader))[2])
+
+        self.assertEqual((status, headers["content-type"]), (207, "application/x-ndjson"))
+        self.assertEqual(
+            [json.loads(line) for line in results.splitlines()],
+            [
+                {"row": 0, "id": stored[0]["id"], "name": "a", "value": 1.0},
+                {"row": 1, "detail": "Item name must not be empty."},
+                {"row": 2, "detail": "Row is not valid JSON."},
+                {"row": 3, "detail": "Missing field: value"},
+                {"row": 4, "id": stored[1]["id"], "name": "e", "value": 5.0},
+            ],
+        )
+
+    async def test_batch_chunks_are_saved_while_the_body_is_still_arriving(self) -> None:
+        rows = b"".join(b'{"name": "n%d", "value": %d}\n' % (row, row) for row in range(1001))
+        first, rest = rows[:-30], rows[-30:]
+        self.writer.write(
+            b"POST /items:batch HTTP/1.1\r\nHost: test\r\nTransfer-Encoding: chunked\r\n\r\n"
+            + b"%x\r\n%b\r\n" % (len(first), first)
+        )
+        facade = self.server.controller.facade
+        for _ in range(100):
+            if facade.list_items():
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(facade.list_items()), 1000)
+
+        self.writer.write(b"%x\r\n%b\r\n0\r\n\r\n" % (len(rest), rest))
+        status, _, body = await _read_response(self.reader)
+
+        self.assertEqual(status, 201)
+        self.assertEqual(len(body.splitlines()), 1001)
+        self.assertEqual(len(facade.list_items()), 1001)
+
+    async def test_http_10_clients_get_one_response_per_connection(self) -> None:
+        self.writer.write(b"GET /items HTTP/1.0\r\n\r\n")
+
+        status, headers, body = await _read_response(self.reader)
+
+        self.assertEqual((status, headers["connection"], body), (200, "close", b"[]"))
+        self.assertEqual(await self.reader.read(), b"")
+
+    async def test_malformed_and_oversized_requests_close_the_connection(self) -> None:
+        self.server.max_body_bytes = 8
+        for request, expected in (
+            (b"NONSENSE\r\n\r\n", 400),
+            (_post("/items", {"name": "too long"}), 413),
+        ):
+            with self.subTest(expected=expected):
+                reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+                writer.write(request)
+                status, headers, _ = await _read_response(reader)
+                writer.close()
+                await writer.wait_closed()
+                self.assertEqual((status, headers["connection"]), (expected, "close"))
+
+    async def test_slow_request_bodies_get_a_408_and_close_the_connection(self) -> None:
+        self.server.body_timeout_seconds = 0.05
+        self.writer.write(b"POST /items HTTP/1.1\r\nHost: test\r\nContent-Length: 10\r\n\r\n{")
+
+        status, headers, _ = await _read_response(self.reader)
+
+        self.assertEqual((status, headers["connection"]), (408, "close"))
+        self.assertEqual(await self.reader.read(), b"")
+
+    async def test_a_failing_stream_is_logged_and_cut_short(self) -> None:
+        self.server.controller = _BrokenStreamController(self.server.controller.facade)
+        self.writer.write(b"GET /items?format=ndjson HTTP/1.1\r\nHost: test\r\n\r\n")
+
+        with self.assertLogs("template.app.web.server", "ERROR"):
+            head = await self.reader.readuntil(b"\r\n\r\n")
+            rest = await self.reader.read()
+
+        self.assertIn(b"Transfer-Encoding: chunked", head)
+        self.assertEqual(rest, b"6\r\nfirst\n\r\n")
+
+    async def test_drain_finishes_requests_in_flight_and_closes_idle_connections(self) -> None:
+        controller = _SlowController(self.server.controller.facade)
+        self.server.controller = controller
+        port = self.server.port
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        self.addAsyncCleanup(writer.wait_closed)
+        self.addCleanup(writer.close)
+        writer.write(b"GET /items HTTP/1.1\r\nHost: test\r\n\r\n")
+        self.assertTrue(await asyncio.to_thread(controller.started.wait, 5))
+
+        await self.server.drain()
+        status, headers, _ = await _read_response(reader)
+
+        self.assertEqual((status, headers["connection"]), (200, "close"))
+        self.assertEqual(await self.reader.read(), b"")
+        with self.assertRaises(OSError):
+            await asyncio.open_connection("127.0.0.1", port)
+
+    async def test_idle_connections_are_closed_after_the_keepalive_timeout(self) -> None:
+        self.server.keepalive_seconds = 0.05
+
+        self.assertEqual(await asyncio.wait_for(self.reader.read(), 2), b"")
+
+
+class ThreadedHandlerTestCase(unittest.TestCase):
+    def test_threaded_handler_serves_the_same_routes(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_threaded_handler(_controller()))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        connection = HTTPConnection("127.0.0.1", server.server_address[1])
+        self.addCleanup(connection.close)
+
+        connection.request("POST", "/items", body=json.dumps({"name": "a", "value": 1}))
+        created = connection.getresponse()
+        created_body = json.loads(created.read())
+        connection.request("POST", "/items", body=json.dumps({"name": "b"}))
+        missing = connection.getresponse()
+        missing_body = json.loads(missing.read())
+
+        self.assertEqual((created.status, created_body["name"]), (201, "a"))
+        self.assertEqual((missing.status, missing_body), (400, {"detail": "Missing field: value"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
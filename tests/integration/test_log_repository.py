@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from template.app.adapters.output.files.log import LogItemRepository
+from template.core.domain.entities.model import Item
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class LogItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "items.ndjson"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_save_appends_one_record_per_item(self) -> None:
+        repository = LogItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        first_record = self.path.read_bytes()
+        repository.save(Item(name="second", value=2.0, id="item-2"))
+        repository.close()
+
+        self.assertTrue(self.path.read_bytes().startswith(first_record))
+        self.assertEqual(len(self.path.read_bytes().splitlines()), 2)
+
+    def test_reopen_replays_latest_version_of_each_item(self) -> None:
+        repository = LogItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        repository.save(Item(name="second", value=2.0, id="item-2"))
+        repository.save(Item(name="renamed", value=3.0, id="item-1"))
+        repository.close()
+
+        reopened = LogItemRepository(self.path)
+
+        self.assertEqual(reopened.get("item-1"), Item(name="renamed", value=3.0, id="item-1"))
+        self.assertEqual([item.id for item in reopened.list()], ["item-1", "item-2"])
+        self.assertIsNone(reopened.get("missing"))
+        reopened.close()
+
+    def test_save_many_and_get_many(self) -> None:
+        repository = LogItemRepository(self.path)
+        items = [Item(name=f"item-{index}", value=float(index)) for index in range(10)]
+
+        repository.save_many(items)
+        fetched = repository.get_many([items[3].id, "missing", items[7].id])
+        repository.close()
+
+        reopened = LogItemRepository(self.path)
+        self.assertEqual(fetched, [items[3], items[7]])
+        self.assertEqual(len(reopened.list()), 10)
+        reopened.close()
+
+    def test_list_page_survives_reopen(self) -> None:
+        repository = LogItemRepository(self.path)
+        items = repository.save_many([Item(name=f"item-{index}", value=1.0) for index in range(5)])
+        repository.save(Item(name="updated", value=2.0, id=items[1].id))
+        repository.close()
+
+        reopened = LogItemRepository(self.path)
+        page = reopened.list_page(2, cursor=items[0].id)
+        reopened.close()
+
+        self.assertEqual([item.id for item in page], [items[1].id, items[2].id])
+        self.assertEqual(page[0].name, "updated")
+
+    def test_torn_trailing_record_is_discarded_on_open(self) -> None:
+        repository = LogItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        repository.close()
+        with self.path.open("ab") as handle:
+            handle.write(b'{"id": "item-2", "na')
+
+        reopened = LogItemRepository(self.path)
+        reopened.save(Item(name="second", value=2.0, id="item-2"))
+        reopened.close()
+
+        recovered = LogItemRepository(self.path)
+        self.assertEqual([item.name for item in recovered.list()], ["first", "second"])
+        recovered.close()
+
+    def test_reopen_loads_sidecar_index_and_replays_only_the_tail(self) -> None:
+        repository = LogItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        repository.close()
+        with self.path.open("ab") as handle:
+            handle.write(b'{"id": "item-2", "name": "second", "value": 2.0}\n')
+
+        with patch("template.app.adapters.output.files.log.json.loads", wraps=json.loads) as loads:
+            reopened = LogItemRepository(self.path)
+
+        self.assertEqual(loads.call_count, 2)
+        self.assertEqual(reopened.get("item-2"), Item(name="second", value=2.0, id="item-2"))
+        self.assertEqual(reopened.get("item-1"), Item(name="first", value=1.0, id="item-1"))
+        reopened.close()
+
+    def test_stale_sidecar_index_is_rebuilt(self) -> None:
+        repository = LogItemRepository(self.path)
+        repository.save(Item(name="first", value=1.0, id="item-1"))
+        repository.close()
+        self.path.write_bytes(b'{"id": "other", "name": "replaced", "value": 5.0}\n')
+
+        reopened = LogItemRepository(self.path)
+
+        self.assertIsNone(reopened.get("item-1"))
+        self.assertEqual([item.id for item in reopened.list()], ["other"])
+        reopened.close()
+
+    def test_compact_keeps_latest_records_and_survives_reopen(self) -> None:
+        repository = LogItemRepository(self.path)
+        for version in range(5):
+            repository.save_many(
+                [Item(name=f"v{version}", value=float(version), id=f"item-{i}") for i in range(3)]
+            )
+        size = self.path.stat().st_size
+
+        report = repository.compact()
+
+        self.assertEqual((report.items, report.bytes_before), (3, size))
+        self.assertEqual(report.bytes_after, self.path.stat().st_size)
+        self.assertEqual(report.saved_bytes, size - report.bytes_after)
+        self.assertEqual(len(self.path.read_bytes().splitlines()), 3)
+        self.assertEqual(repository.get("item-1"), Item(name="v4", value=4.0, id="item-1"))
+        repository.save(Item(name="after", value=9.0, id="item-3"))
+        repository.close()
+
+        reopened = LogItemRepository(self.path)
+        self.assertEqual(
+            [item.id for item in reopened.list()], ["item-0", "item-1", "item-2", "item-3"]
+        )
+        self.assertEqual(reopened.get("item-2"), Item(name="v4", value=4.0, id="item-2"))
+        reopened.close()
+
+    def test_saves_during_compaction_are_kept(self) -> None:
+        repository = LogItemRepository(self.path)
+        repository.save(Item(name="old", value=1.0, id="item-1"))
+        repository.save(Item(name="stale", value=2.0, id="item-2"))
+        copy_records = repository._copy_records
+
+        def save_while_copying(*args: object) -> dict[str, tuple[int, int]]:
+            relocated = copy_records(*args)  # type: ignore[arg-type]
+            repository.save(Item(name="fresh", value=3.0, id="item-2"))
+            repository.save(Item(name="new", value=4.0, id="item-3"))
+            return relocated
+
+        with patch.object(repository, "_copy_records", side_effect=save_while_copying):
+            repository.compact()
+
+        self.assertEqual(repository.get("item-2"), Item(name="fresh", value=3.0, id="item-2"))
+        repository.close()
+        reopened = LogItemRepository(self.path)
+        self.assertEqual(
+            reopened.list(),
+            [
+                Item(name="old", value=1.0, id="item-1"),
+                Item(name="fresh", value=3.0, id="item-2"),
+                Item(name="new", value=4.0, id="item-3"),
+            ],
+        )
+        reopened.close()
+
+    def test_compaction_starts_in_background_past_the_ratio(self) -> None:
+        with patch("template.app.adapters.output.files.log._MIN_COMPACTION_BYTES", 0):
+            repository = LogItemRepository(self.path, compaction_ratio=3.0)
+            item = Item(name="hot", value=0.0, id="item-1")
+            for version in range(3):
+                repository.save(Item(name="hot", value=float(version), id=item.id))
+
+            deadline = time.monotonic() + 5
+            while repository.last_compaction is None and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+        self.assertIsNotNone(repository.last_compaction)
+        self.assertEqual(len(self.path.read_bytes().splitlines()), 1)
+        self.assertEqual(repository.get(item.id), Item(name="hot", value=2.0, id=item.id))
+        repository.close()
+
+    def test_container_selects_log_repository_for_ndjson_format(self) -> None:
+        settings = Settings(
+            repository_type="file",
+            items_file_path=str(self.path),
+            items_file_format="ndjson",
+        )
+
+        repository = ContainerFactory(settings).create_repository()
+
+        self.assertIsInstance(repository, LogItemRepository)
+        repository.close()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+from template.app.robyn import main as robyn_main
+from template.app.web import main as web_main
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+SUPERVISOR_SCRIPT = textwrap.dedent(
+    """
+    import os
+    import sys
+
+    from template.infrastructure.prefork import PreforkSupervisor
+
+
+    def serve(sock):
+        # One write per line, so lines from different workers never interleave.
+        os.write(1, f"{os.getpid()} {sock.getsockname()[1]}\\n".encode())
+        while True:
+            connection, _ = sock.accept()
+            connection.sendall(str(os.getpid()).encode())
+            connection.close()
+
+
+    sys.exit(PreforkSupervisor(serve, 2, "127.0.0.1", 0, drain_seconds=5).run())
+    """
+)
+
+
+def _read_line(process: subprocess.Popen[bytes], timeout: float = 10.0) -> list[int]:
+    assert process.stdout is not None
+    line = b""
+    deadline = time.monotonic() + timeout
+    while not line.endswith(b"\n"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([process.stdout], [], [], remaining)[0]:
+            raise AssertionError(f"No worker started within {timeout} seconds.")
+        chunk = os.read(process.stdout.fileno(), 1)
+        if not chunk:
+            raise AssertionError("The supervisor exited early.")
+        line += chunk
+    return [int(field) for field in line.split()]
+
+
+def _ask_pid(port: int) -> int:
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+        return int(connection.recv(64))
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "prefork needs os.fork")
+class PreforkSupervisorTestCase(unittest.TestCase):
+    def test_workers_share_the_port_are_replaced_and_stop_on_sigterm(self) -> None:
+        process = subprocess.Popen(
+            [sys.executable, "-c", SUPERVISOR_SCRIPT],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert process.stdout is not None
+        self.addCleanup(process.stdout.close)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        (first, port), (second, second_port) = _read_line(process), _read_line(process)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(port, second_port)
+        self.assertIn(_ask_pid(port), {first, second})
+
+        os.kill(first, signal.SIGKILL)
+        replacement, replacement_port = _read_line(process)
+
+        self.assertNotIn(replacement, {first, second})
+        self.assertEqual(replacement_port, port)
+        self.assertIn(_ask_pid(port), {second, replacement})
+
+        process.send_signal(signal.SIGTERM)
+        self.assertEqual(process.wait(timeout=10), 0)
+        for pid in (second, replacement):
+            with self.assertRaises(ProcessLookupError):
+                os.kill(pid, 0)
+
+
+class ProcessSafetyTestCase(unittest.TestCase):
+    def test_only_shared_on_disk_repositories_pass(self) -> None:
+        safe = (
+            Settings(repository_type="sqlite"),
+            Settings(repository_type="file", items_file_format="binary"),
+            Settings(repository_type="sqlite", shard_count=4),
+        )
+        unsafe = (
+            Settings(repository_type="memory"),
+            Settings(repository_type="striped"),
+            Settings(repository_type="file", items_file_format="ndjson"),
+            Settings(repository_type="sqlite", cache_size=100),
+            Settings(repository_type="file", write_buffer_size=10),
+        )
+
+        for settings in safe:
+            with self.subTest(settings=settings):
+                ContainerFactory(settings).check_process_safe()
+        for settings in unsafe:
+            with self.subTest(settings=settings), self.assertRaises(ValueError):
+                ContainerFactory(settings).check_process_safe()
+
+    def test_web_entry_points_refuse_unsafe_repositories_with_an_exit_code(self) -> None:
+        environment = {"TEMPLATE_WEB_WORKERS": "2", "TEMPLATE_REPOSITORY_TYPE": "memory"}
+
+        for module in (web_main, robyn_main):
+            output = StringIO()
+            with (
+                self.subTest(module=module.__name__),
+                patch.dict(os.environ, environment),
+                patch.object(module, "PreforkSupervisor") as supervisor,
+                redirect_stdout(output),
+            ):
+                self.assertEqual(module.run([]), 1)
+                supervisor.assert_not_called()
+                self.assertIn("keeps items in process memory", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
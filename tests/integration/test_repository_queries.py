@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+from template.app.adapters.output.db.columnar import ColumnarItemRepository
+from template.app.adapters.output.db.concurrent import StripedItemRepository
+from template.app.adapters.output.db.repository import InMemoryItemRepository
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.app.adapters.output.files.file import FileItemRepository
+from template.app.adapters.output.files.log import LogItemRepository
+from template.core.application.dtos.dto import ItemQuery
+from template.core.application.services.query import matches, sort_key
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+
+BACKENDS: dict[str, Callable[[Path], object]] = {
+    "memory": lambda root: InMemoryItemRepository(),
+    "columnar": lambda root: ColumnarItemRepository(),
+    "striped": lambda root: StripedItemRepository(stripes=4),
+    "sqlite": lambda root: SqliteItemRepository(root / "items.sqlite3"),
+    "json": lambda root: FileItemRepository(root / "items.json"),
+    "ndjson": lambda root: LogItemRepository(root / "items.ndjson"),
+}
+NAMES = ("alpha", "alps", "beta", "b", "gamma")
+
+
+class RepositoryQueryTestCase(unittest.TestCase):
+    """Every backend must return the same pages as a brute-force filter and sort."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repositories = {
+            name: factory(Path(self._tmp.name)) for name, factory in BACKENDS.items()
+        }
+        generator = random.Random(7)
+        items = [
+            Item(name=generator.choice(NAMES), value=float(generator.randint(-3, 3)))
+            for _ in range(120)
+        ]
+        # Overwrites move items within the name and value indexes but keep their position.
+        items += [replace(item, name="beta", value=9.0) for item in items[:10]]
+        for repository in self.repositories.values():
+            for item in items:
+                repository.save(item)  # type: ignore[attr-defined]
+        self.stored = self.repositories["memory"].list()  # type: ignore[attr-defined]
+
+    def tearDown(self) -> None:
+        for repository in self.repositories.values():
+            close = getattr(repository, "close", None)
+            if close is not None:
+                close()
+        self._tmp.cleanup()
+
+    def expected(self, query: ItemQuery) -> list[str]:
+        rows = [
+            (position, item) for position, item in enumerate(self.stored) if matches(query, item)
+        ]
+        rows.sort(key=lambda row: sort_key(query, row[1], row[0]), reverse=query.descending)
+        return [item.id for _, item in rows]
+
+    def walk(self, repository: object, query: ItemQuery) -> list[str]:
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = repository.query(replace(query, cursor=cursor))  # type: ignore[attr-defined]
+            seen.extend(item.id for item in page)
+            if len(page) < (query.limit or 0):
+                return seen
+            cursor = page[-1].id
+
+    def test_backends_agree_on_filtered_sorted_pages(self) -> None:
+        queries = [
+            ItemQuery(limit=25),
+            ItemQuery(name="beta", limit=4),
+            ItemQuery(name_prefix="al", sort="value", limit=6),
+            ItemQuery(name_prefix="b", sort="name", descending=True, limit=5),
+            ItemQuery(min_value=-1.0, max_value=1.0, sort="value", descending=True, limit=7),
+            ItemQuery(min_value=0.0, sort="name", limit=9),
+            ItemQuery(name_prefix="al", min_value=0.0, limit=3),
+            ItemQuery(max_value=-2.0, descending=True, limit=2),
+        ]
+        for query in queries:
+            expected = self.expected(query)
+            for name, repository in self.repositories.items():
+                with self.subTest(backend=name, query=query):
+                    self.assertEqual(self.walk(repository, query), expected)
+
+    def test_saves_after_a_query_keep_results_current(self) -> None:
+        query = ItemQuery(name_prefix="al", sort="value", limit=10)
+        for repository in self.repositories.values():
+            repository.query(query)  # type: ignore[attr-defined]
+            repository.save(replace(self.stored[20], name="also", value=-9.0))  # type: ignore[attr-defined]
+            repository.save(Item(name="alpine", value=9.5, id="late"))  # type: ignore[attr-defined]
+        self.stored = self.repositories["memory"].list()  # type: ignore[attr-defined]
+
+        expected = self.expected(query)
+        self.assertEqual(expected[0], self.stored[20].id)
+        for name, repository in self.repositories.items():
+            with self.subTest(backend=name):
+                self.assertEqual(self.walk(repository, query), expected)
+
+    def test_concurrent_saves_keep_indexes_consistent(self) -> None:
+        query = ItemQuery(name_prefix="al", sort="value")
+        for name in ("memory", "striped", "columnar"):
+            repository = self.repositories[name]
+            repository.query(query)  # type: ignore[attr-defined]
+
+            def save_and_query(worker: int, repository: object = repository) -> None:
+                for index in range(200):
+                    item = self.stored[(worker * 200 + index) % len(self.stored)]
+                    repository.save(replace(item, name="alpha", value=float(index)))  # type: ignore[attr-defined]
+                    repository.save(Item(name="alps", value=-float(index), id=f"{worker}-{index}"))  # type: ignore[attr-defined]
+                    if index % 20 == 0:
+                        repository.query(query)  # type: ignore[attr-defined]
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(save_and_query, range(4)))
+
+            with self.subTest(backend=name):
+                stored = repository.list()  # type: ignore[attr-defined]
+                expected = sorted(
+                    (item for item in stored if item.name.startswith("al")),
+                    key=lambda item: (item.value, stored.index(item)),
+                )
+                self.assertEqual(repository.query(query), expected)  # type: ignore[attr-defined]
+
+    def test_unknown_cursor_is_rejected(self) -> None:
+        for name, repository in self.repositories.items():
+            with self.subTest(backend=name), self.assertRaises(InvalidCursorError):
+                repository.query(ItemQuery(sort="value", limit=1, cursor="missing"))  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
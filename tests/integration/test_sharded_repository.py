@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+from template.app.adapters.output.db.repository import InMemoryItemRepository
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.app.adapters.output.shard.repository import ShardedItemRepository, shard_of
+from template.core.application.dtos.dto import ItemQuery, ItemStatsQuery
+from template.core.application.services.aggregation import ValueAccumulator
+from template.core.application.use_cases.use_case import ListItemsPageUseCase, QueryItemsUseCase
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+def sort_key(
+    repository: ShardedItemRepository, query: ItemQuery, item: Item
+) -> tuple[object, int, int]:
+    """Documented global order: sort value, then shard, then position inside the shard."""
+    index = shard_of(item.id, len(repository.shards))
+    position = [stored.id for stored in repository.shards[index].list()].index(item.id)
+    value = item.name if query.sort == "name" else float(item.value)
+    return value, index, position
+
+
+def expected(repository: ShardedItemRepository, query: ItemQuery) -> list[Item]:
+    matches = [
+        item
+        for item in repository.list()
+        if (query.name is None or item.name == query.name)
+        and (query.min_value is None or item.value >= query.min_value)
+        and (query.max_value is None or item.value <= query.max_value)
+    ]
+    if query.sort is None:
+        return matches[::-1] if query.descending else matches
+    return sorted(
+        matches, key=lambda item: sort_key(repository, query, item), reverse=query.descending
+    )
+
+
+class ShardedItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repository = ShardedItemRepository([InMemoryItemRepository() for _ in range(4)])
+        # Few distinct names and values, so ties cross shard boundaries.
+        self.items = self.repository.save_many(
+            [
+                Item(name=f"name-{index % 5}", value=float(index % 7), id=f"item-{index}")
+                for index in range(60)
+            ]
+        )
+
+    def tearDown(self) -> None:
+        self.repository.close()
+
+    def test_point_operations_touch_only_the_owning_shard(self) -> None:
+        item = self.items[0]
+        owner = self.repository.shards[shard_of(item.id, 4)]
+
+        with patch.object(owner, "get", wraps=owner.get) as owner_get:
+            self.assertEqual(self.repository.get(item.id), item)
+
+        owner_get.assert_called_once_with(item.id)
+        self.assertEqual(owner.get(item.id), item)
+        self.assertEqual(sum(len(shard.list()) for shard in self.repository.shards), 60)
+        self.assertTrue(all(shard.list() for shard in self.repository.shards))
+
+    def test_get_many_keeps_request_order(self) -> None:
+        ids = [self.items[5].id, "missing", self.items[1].id, self.items[30].id]
+
+        self.assertEqual(
+            self.repository.get_many(ids), [self.items[5], self.items[1], self.items[30]]
+        )
+
+    def test_list_page_walks_every_item_once(self) -> None:
+        use_case = ListItemsPageUseCase(self.repository)
+        seen: list[Item] = []
+        cursor = None
+        while True:
+            page, cursor = use_case.execute(limit=7, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, self.repository.list())
+        self.assertCountEqual(seen, self.items)
+
+    def test_query_pages_follow_the_merged_order(self) -> None:
+        use_case = QueryItemsUseCase(self.repository)
+        rng = random.Random(3)
+        queries = [ItemQuery(sort=sort) for sort in (None, "name", "value")]
+        for _ in range(30):
+            queries.append(
+                ItemQuery(
+                    name=rng.choice([None, "name-1", "name-3"]),
+                    min_value=rng.choice([None, 1.0, 2.5]),
+                    max_value=rng.choice([None, 4.0, 6.0]),
+                    sort=rng.choice([None, "name", "value"]),
+                    descending=rng.random() < 0.5,
+                )
+            )
+        for query in queries:
+            with self.subTest(query=query):
+                walked: list[Item] = []
+                cursor = None
+                while True:
+                    page_query = replace(query, limit=rng.randint(1, 9), cursor=cursor)
+                    page, cursor = use_case.execute(page_query)
+                    walked.extend(page)
+                    if cursor is None:
+                        break
+                self.assertEqual(walked, expected(self.repository, query))
+
+    def test_query_rejects_unknown_cursors(self) -> None:
+        with self.assertRaises(InvalidCursorError):
+            self.repository.query(ItemQuery(sort="value", cursor="missing"))
+
+    def test_aggregate_matches_a_single_pass_over_all_items(self) -> None:
+        query = ItemStatsQuery(percentiles=(10.0, 50.0, 99.0), bins=4, group_prefix=6)
+        accumulator = ValueAccumulator(query.group_prefix)
+        accumulator.add_items(self.items)
+
+        self.assertEqual(self.repository.aggregate(query), accumulator.result(query))
+
+
+class ShardedContainerTestCase(unittest.TestCase):
+    def test_container_builds_one_store_per_shard(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repository = ContainerFactory(
+                Settings(
+                    repository_type="sqlite",
+                    sqlite_path=str(Path(tmp) / "items.sqlite3"),
+                    shard_count=3,
+                )
+            ).create_repository()
+            repository.save_many([Item(name="a", value=float(index)) for index in range(30)])
+
+            self.assertIsInstance(repository, ShardedItemRepository)
+            self.assertEqual(
+                sorted(path.name for path in Path(tmp).glob("*.sqlite3")),
+                [f"items.shard{index}.sqlite3" for index in range(3)],
+            )
+            self.assertTrue(
+                all(isinstance(shard, SqliteItemRepository) for shard in repository.shards)  # type: ignore[attr-defined]
+            )
+            self.assertEqual(len(repository.list()), 30)
+            repository.close()  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
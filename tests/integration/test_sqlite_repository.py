@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.core.application.dtos.dto import ItemStatsQuery
+from template.core.application.services.aggregation import ValueAccumulator
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class SqliteItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "items.sqlite3"
+        self.repository = SqliteItemRepository(self.path)
+
+    def tearDown(self) -> None:
+        self.repository.close()
+        self._tmp.cleanup()
+
+    def test_round_trip_and_upsert_keeps_insertion_order(self) -> None:
+        self.repository.save(Item(name="first", value=1.0, id="item-1"))
+        self.repository.save(Item(name="second", value=2.0, id="item-2"))
+        self.repository.save(Item(name="renamed", value=3.0, id="item-1"))
+
+        self.assertEqual(
+            self.repository.get("item-1"), Item(name="renamed", value=3.0, id="item-1")
+        )
+        self.assertIsNone(self.repository.get("missing"))
+        self.assertEqual([item.id for item in self.repository.list()], ["item-1", "item-2"])
+
+    def test_save_many_writes_one_batch(self) -> None:
+        items = [Item(name=f"item-{index}", value=float(index)) for index in range(50)]
+
+        saved = self.repository.save_many(items)
+
+        self.assertEqual(saved, items)
+        self.assertEqual(len(self.repository.list()), 50)
+
+    def test_list_page_continues_after_cursor(self) -> None:
+        items = self.repository.save_many(
+            [Item(name=f"item-{index}", value=1.0) for index in range(5)]
+        )
+
+        first = self.repository.list_page(2)
+        second = self.repository.list_page(2, cursor=first[-1].id)
+
+        self.assertEqual(first + second, items[:4])
+        with self.assertRaises(InvalidCursorError):
+            self.repository.list_page(2, cursor="missing")
+
+    def test_concurrent_saves_use_per_thread_connections(self) -> None:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda index: self.repository.save(Item(name="demo", value=float(index))),
+                    range(200),
+                )
+            )
+
+        self.assertEqual(len(self.repository.list()), 200)
+
+    def test_connections_close_when_their_threads_exit(self) -> None:
+        threads = [
+            threading.Thread(target=self.repository.save, args=(Item(name="a", value=1.0),))
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.repository.list()), 20)
+        self.assertEqual(len(self.repository._connections), 1)
+
+    def test_in_memory_database_is_shared_by_every_thread(self) -> None:
+        repository = SqliteItemRepository(":memory:")
+        self.addCleanup(repository.close)
+        item = repository.save(Item(name="a", value=1.0))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fetched = pool.submit(repository.get, item.id).result()
+
+        self.assertEqual(fetched, item)
+
+    def test_aggregate_matches_streamed_summary(self) -> None:
+        items = self.repository.save_many(
+            [
+                Item(name=f"{'ab'[index % 2]}-{index}", value=float(index % 7) * 1.5)
+                for index in range(100)
+            ]
+        )
+        query = ItemStatsQuery(percentiles=(0.0, 33.3, 50.0, 100.0), bins=4, group_prefix=1)
+        accumulator = ValueAccumulator(query.group_prefix)
+        accumulator.add_items(items)
+
+        self.assertEqual(
+            asdict(self.repository.aggregate(query)), asdict(accumulator.result(query))
+        )
+
+    def test_container_selects_sqlite_repository(self) -> None:
+        repository = ContainerFactory(
+            Settings(repository_type="sqlite", sqlite_path=str(self.path))
+        ).create_repository()
+
+        self.assertIsInstance(repository, SqliteItemRepository)
+        repository.close()  # type: ignore[attr-defined]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from template.app.adapters.output.db.concurrent import StripedItemRepository
+from template.core.application.dtos.dto import ItemQuery
+from template.core.domain.entities.model import Item
+from template.core.domain.exceptions.exception import InvalidCursorError
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class StripedItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repository = StripedItemRepository(stripes=4)
+
+    def test_concurrent_saves_keep_every_item_once(self) -> None:
+        def save_range(worker: int) -> None:
+            for index in range(500):
+                # Every worker also rewrites a shared id, so stripes see contended updates.
+                self.repository.save(
+                    Item(name=f"w{worker}", value=float(index), id=f"{worker}-{index}")
+                )
+                self.repository.save(
+                    Item(name="shared", value=float(index), id=f"shared-{index % 20}")
+                )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save_range, range(8)))
+
+        items = self.repository.list()
+        self.assertEqual(len(items), 8 * 500 + 20)
+        self.assertEqual(len({item.id for item in items}), len(items))
+        self.assertEqual(
+            [item.id for item in self.repository.iter_items()], [item.id for item in items]
+        )
+
+    def test_scans_read_snapshots_while_writers_continue(self) -> None:
+        self.repository.save_many([Item(name="seed", value=float(index)) for index in range(100)])
+        stop = Event()
+
+        def write() -> None:
+            index = 0
+            while not stop.is_set():
+                self.repository.save(Item(name="late", value=float(index)))
+                index += 1
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            writer = pool.submit(write)
+            try:
+                sizes = [len(self.repository.list()) for _ in range(50)]
+                pages = [self.repository.query(ItemQuery(name="seed")) for _ in range(10)]
+            finally:
+                stop.set()
+            writer.result()
+
+        self.assertEqual(sizes, sorted(sizes))
+        self.assertTrue(all(len(page) == 100 for page in pages))
+
+    def test_snapshot_is_reused_until_a_save(self) -> None:
+        first = self.repository.save(Item(name="a", value=1.0))
+        rows = self.repository._rows()
+
+        self.assertIs(self.repository._rows(), rows)
+        second = self.repository.save(Item(name="b", value=2.0))
+        self.assertEqual(self.repository.list(), [first, second])
+        self.assertEqual(rows, [first])
+
+    def test_unknown_cursors_are_rejected(self) -> None:
+        with self.assertRaises(InvalidCursorError):
+            self.repository.list_page(10, "missing")
+        with self.assertRaises(InvalidCursorError):
+            self.repository.query(ItemQuery(cursor="missing"))
+
+    def test_container_builds_striped_repository(self) -> None:
+        repository = ContainerFactory(Settings(repository_type="striped")).create_repository()
+
+        self.assertIsInstance(repository, StripedItemRepository)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from template.app.adapters.output.buffer.repository import WriteBehindItemRepository
+from template.app.adapters.output.db.sqlite import SqliteItemRepository
+from template.app.adapters.output.files.file import FileItemRepository
+from template.core.application.dtos.dto import ItemQuery, ItemStatsQuery
+from template.core.application.ports.output.repository_port import ItemAggregationPort
+from template.core.domain.entities.model import Item
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class WriteBehindItemRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.backend = FileItemRepository(Path(self._tmp.name) / "items.json")
+        self.repository = WriteBehindItemRepository(
+            self.backend, max_items=3, max_delay_seconds=None
+        )
+
+    def tearDown(self) -> None:
+        self.repository.close()
+        self._tmp.cleanup()
+
+    def test_saves_are_group_committed_when_the_buffer_fills(self) -> None:
+        items = [Item(name=f"item-{index}", value=float(index)) for index in range(7)]
+
+        with patch.object(
+            self.backend, "save_many", wraps=self.backend.save_many
+        ) as backend_save_many:
+            for item in items:
+                self.repository.save(item)
+
+        self.assertEqual(
+            [len(call.args[0]) for call in backend_save_many.call_args_list], [3, 3]
+        )
+        self.assertEqual(self.repository.pending, 1)
+        self.assertIsNone(self.backend.get(items[6].id))
+
+    def test_reads_see_buffered_saves(self) -> None:
+        stored = self.backend.save(Item(name="stored", value=1.0))
+        buffered = self.repository.save(Item(name="buffered", value=2.0))
+
+        self.assertEqual(self.repository.get(buffered.id), buffered)
+        self.assertEqual(
+            self.repository.get_many([buffered.id, "missing", stored.id]), [buffered, stored]
+        )
+        self.assertIsNone(self.backend.get(buffered.id))
+
+    def test_scans_flush_before_reading(self) -> None:
+        first = self.repository.save(Item(name="alpha", value=1.0))
+        second = self.repository.save(Item(name="beta", value=2.0))
+
+        self.assertEqual(self.repository.list(), [first, second])
+        self.assertEqual(self.repository.pending, 0)
+        self.repository.save(Item(name="alpha", value=3.0))
+        self.assertEqual(len(self.repository.query(ItemQuery(name="alpha"))), 2)
+
+    def test_resaving_an_id_keeps_only_the_latest_value(self) -> None:
+        original = self.repository.save(Item(name="original", value=1.0, id="item-1"))
+        updated = Item(name="updated", value=2.0, id=original.id)
+
+        self.repository.save(updated)
+        self.repository.flush()
+
+        self.assertEqual(self.backend.list(), [updated])
+
+    def test_failed_flush_keeps_items_for_the_next_attempt(self) -> None:
+        item = self.repository.save(Item(name="retry", value=1.0))
+
+        with (
+            patch.object(self.backend, "save_many", side_effect=OSError("disk full")),
+            self.assertRaises(OSError),
+        ):
+            self.repository.flush()
+
+        self.assertEqual(self.repository.get(item.id), item)
+        self.repository.flush()
+        self.assertEqual(self.backend.get(item.id), item)
+
+    def test_close_flushes_and_rejects_further_saves(self) -> None:
+        item = self.repository.save(Item(name="last", value=1.0))
+
+        self.repository.close()
+
+        self.assertEqual(self.backend.get(item.id), item)
+        with self.assertRaises(RuntimeError):
+            self.repository.save(Item(name="late", value=2.0))
+
+    def test_pending_saves_are_flushed_after_the_delay(self) -> None:
+        repository = WriteBehindItemRepository(
+            self.backend, max_items=100, max_delay_seconds=0.01
+        )
+        item = repository.save(Item(name="timed", value=1.0))
+
+        deadline = time.monotonic() + 5
+        while repository.pending and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        self.assertEqual(repository.pending, 0)
+        self.assertEqual(self.backend.get(item.id), item)
+        repository.close()
+
+    def test_container_wraps_backend_when_write_buffer_is_configured(self) -> None:
+        repository = ContainerFactory(
+            Settings(
+                repository_type="sqlite",
+                sqlite_path=str(Path(self._tmp.name) / "items.sqlite3"),
+                write_buffer_size=16,
+                write_buffer_delay_seconds=None,
+            )
+        ).create_repository()
+        item = repository.save(Item(name="queued", value=4.0))
+
+        self.assertIsInstance(repository, WriteBehindItemRepository)
+        self.assertIsInstance(repository._backend, SqliteItemRepository)  # type: ignore[attr-defined]
+        self.assertIsInstance(repository, ItemAggregationPort)
+        stats = repository.aggregate(ItemStatsQuery())  # type: ignore[attr-defined]
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(repository.list(), [item])
+        repository.close()  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
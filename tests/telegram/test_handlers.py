@@ -13,11 +13,11 @@ async def test_start_handler_calls_facade_with_dto() -> None:
     message = Mock()
     message.text = "/start"
     message.answer = AsyncMock()
-    facade = Mock(return_value=ItemResponseDTO(id="item-1", name="telegram-start", value=0.0))
+    facade = AsyncMock(return_value=ItemResponseDTO(id="item-1", name="telegram-start", value=0.0))
 
     await start_handler(message, facade)
 
-    facade.assert_called_once_with(ApplicationDTO(name="telegram-start", value=0.0))
+    facade.assert_awaited_once_with(ApplicationDTO(name="telegram-start", value=0.0))
     message.answer.assert_awaited_once()
 
 
@@ -26,9 +26,9 @@ async def test_message_handler_calls_facade_with_dto() -> None:
     message = Mock()
     message.text = "demo 7.5"
     message.answer = AsyncMock()
-    facade = Mock(return_value=ItemResponseDTO(id="item-1", name="demo", value=7.5))
+    facade = AsyncMock(return_value=ItemResponseDTO(id="item-1", name="demo", value=7.5))
 
     await message_handler(message, facade)
 
-    facade.assert_called_once_with(ApplicationDTO(name="demo", value=7.5))
+    facade.assert_awaited_once_with(ApplicationDTO(name="demo", value=7.5))
     message.answer.assert_awaited_once()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import unittest
+from array import array
+from dataclasses import asdict
+from unittest.mock import patch
+
+from template.core.application.dtos.dto import ItemStatsQuery
+from template.core.application.services import aggregation
+from template.core.application.services.aggregation import ValueAccumulator, summarize
+from template.core.domain.entities.model import Item
+
+
+class AggregationTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.values = array("d", [4.0, 1.0, 3.0, 2.0, 10.0])
+        self.query = ItemStatsQuery(percentiles=(0.0, 50.0, 75.0, 100.0), bins=3)
+
+    def test_summarize_interpolates_percentiles_and_bins_values(self) -> None:
+        stats = summarize(self.values, self.query)
+
+        self.assertEqual((stats.count, stats.sum, stats.mean), (5, 20.0, 4.0))
+        self.assertEqual((stats.min, stats.max), (1.0, 10.0))
+        self.assertEqual(stats.percentiles, {"p0": 1.0, "p50": 3.0, "p75": 4.0, "p100": 10.0})
+        self.assertEqual([bin.count for bin in stats.histogram], [3, 1, 1])
+        self.assertEqual((stats.histogram[0].lower, stats.histogram[-1].upper), (1.0, 10.0))
+
+    def test_pure_python_path_matches_vectorized_path(self) -> None:
+        vectorized = asdict(summarize(self.values, self.query))
+
+        with patch.object(aggregation, "np", None):
+            fallback = asdict(summarize(self.values, self.query))
+
+        self.assertEqual(fallback, vectorized)
+
+    def test_single_distinct_value_gets_unit_wide_histogram(self) -> None:
+        stats = summarize(array("d", [2.0, 2.0]), ItemStatsQuery(bins=2))
+
+        self.assertEqual(
+            [(bin.lower, bin.upper, bin.count) for bin in stats.histogram],
+            [(1.5, 2.0, 0), (2.0, 2.5, 2)],
+        )
+
+    def test_empty_column_has_no_extremes(self) -> None:
+        stats = summarize(array("d"), self.query)
+
+        self.assertEqual(stats.count, 0)
+        self.assertIsNone(stats.mean)
+        self.assertEqual(stats.histogram, [])
+
+    def test_accumulator_groups_by_name_prefix(self) -> None:
+        accumulator = ValueAccumulator(group_prefix=2)
+        accumulator.add_items(
+            [
+                Item(name="alpha", value=1.0),
+                Item(name="beta", value=2.0),
+                Item(name="alps", value=3.0),
+            ]
+        )
+
+        stats = accumulator.result(ItemStatsQuery(percentiles=(50.0,), bins=1))
+
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(list(stats.groups), ["al", "be"])
+        self.assertEqual(stats.groups["al"].percentiles, {"p50": 2.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from template.app.adapters.output.files.codec import (
+    COMPRESSIONS,
+    decode_items,
+    encode_items,
+    is_binary_items,
+)
+from template.core.domain.entities.model import Item
+
+
+class BinaryCodecTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.items = [
+            Item(name="plain", value=1.5),
+            Item(name="ünïcødé ✓", value=-2.25, id="item-1"),
+            Item(name="upper", value=3.0, id="6F9619FF-8B86-D011-B42D-00C04FC964FF"),
+            Item(name="x" * 300, value=1e300, id=""),
+        ]
+
+    def test_round_trip_for_every_compression(self) -> None:
+        for compression in COMPRESSIONS:
+            with self.subTest(compression=compression):
+                data = encode_items(self.items, compression)
+
+                self.assertTrue(is_binary_items(data))
+                self.assertEqual(decode_items(data), self.items)
+
+    def test_canonical_uuid_ids_are_packed_into_sixteen_bytes(self) -> None:
+        uuid_item = Item(name="n", value=0.0)
+        text_item = Item(name="n", value=0.0, id=uuid_item.id.upper())
+
+        packed = len(encode_items([uuid_item])) - len(encode_items([]))
+        unpacked = len(encode_items([text_item])) - len(encode_items([]))
+
+        self.assertEqual(unpacked - packed, 36 - 16)
+        self.assertEqual(decode_items(encode_items([text_item])), [text_item])
+
+    def test_records_span_several_blocks(self) -> None:
+        items = [Item(name=f"item-{index}", value=float(index)) for index in range(10)]
+
+        with patch("template.app.adapters.output.files.codec._BLOCK_ITEMS", 3):
+            data = encode_items(items, "zlib")
+
+        self.assertEqual(decode_items(data), items)
+
+    def test_empty_file_round_trips(self) -> None:
+        self.assertEqual(decode_items(encode_items([])), [])
+
+    def test_invalid_input_is_rejected(self) -> None:
+        data = encode_items(self.items)
+
+        for corrupt in (b"", b'[{"id": "x"}]', data[:-3], data[:5] + b"\xff" * 8):
+            with self.subTest(corrupt=corrupt[:12]), self.assertRaises(ValueError):
+                decode_items(corrupt)
+        with self.assertRaises(ValueError):
+            encode_items(self.items, "brotli")
+
+
+if __name__ == "__main__":
+    unittest.main()
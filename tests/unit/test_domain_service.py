@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import math
+import unittest
+from itertools import count
+from unittest.mock import patch
+
+from template.core.domain.entities.model import (
+    EMPTY_NAME_ERROR,
+    NON_FINITE_ERROR,
+    NON_NUMERIC_ERROR,
+    Item,
+)
+from template.core.domain.exceptions.exception import ItemValidationError
+from template.core.domain.services import service
+from template.core.domain.services.ids import UuidV7Generator
+from template.core.domain.services.service import ItemDomainService
+
+
+class ItemDomainServiceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        ids = count()
+        self.service = ItemDomainService(lambda: f"id-{next(ids)}")
+
+    def test_create_many_builds_valid_batches(self) -> None:
+        batch = self.service.create_many(["a", "b"], [1, 2.5])
+
+        self.assertEqual(batch.items, [Item("a", 1.0, "id-0"), Item("b", 2.5, "id-1")])
+        self.assertEqual(batch.errors, {})
+
+    def test_create_many_reports_every_bad_row_with_the_validate_message(self) -> None:
+        names = ["ok", " ", "nan", "inf", "text", "", "late", "huge"]
+        values = [1.0, 2.0, math.nan, -math.inf, "bad", math.inf, "3.5", 10**400]
+
+        for numpy in (service.np, None):
+            with self.subTest(numpy=numpy is not None), patch.object(service, "np", numpy):
+                batch = self.service.create_many(names, values)
+
+                self.assertEqual(
+                    batch.errors,
+                    {
+                        1: EMPTY_NAME_ERROR,
+                        2: NON_FINITE_ERROR,
+                        3: NON_FINITE_ERROR,
+                        4: NON_NUMERIC_ERROR,
+                        5: EMPTY_NAME_ERROR,
+                        7: NON_NUMERIC_ERROR,
+                    },
+                )
+                self.assertEqual(
+                    [(item.name, item.value) for item in batch.items], [("ok", 1.0), ("late", 3.5)]
+                )
+
+    def test_create_many_matches_create_for_each_row(self) -> None:
+        rows = [("a", 1), (" ", 2.0), ("b", math.inf), ("c", "x"), ("d", "4")]
+        batch = self.service.create_many([name for name, _ in rows], [value for _, value in rows])
+
+        for row, (name, value) in enumerate(rows):
+            with self.subTest(row=row):
+                try:
+                    self.service.create(name, value)  # type: ignore[arg-type]
+                except (ItemValidationError, ValueError) as exc:
+                    expected = NON_NUMERIC_ERROR if isinstance(exc, ValueError) else str(exc)
+                    self.assertEqual(batch.errors[row], expected)
+                else:
+                    self.assertNotIn(row, batch.errors)
+
+    def test_create_many_issues_ids_only_for_valid_rows(self) -> None:
+        generate = UuidV7Generator()
+
+        with patch.object(generate, "many", wraps=generate.many) as many:
+            batch = ItemDomainService(generate).create_many(["a", "", "b"], [1.0, 2.0, 3.0])
+
+        many.assert_called_once_with(2)
+        self.assertLess(batch.items[0].id, batch.items[1].id)
+
+    def test_create_many_rejects_mismatched_columns(self) -> None:
+        with self.assertRaises(ValueError):
+            self.service.create_many(["a"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
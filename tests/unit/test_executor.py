@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+
+from template.infrastructure.executor import BoundedExecutor
+
+
+class BoundedExecutorTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.executor = BoundedExecutor(1, queue_size=1)
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    async def asyncTearDown(self) -> None:
+        self.release.set()
+        self.executor.shutdown()
+
+    def _block(self) -> str:
+        self.started.set()
+        self.release.wait(5)
+        return "done"
+
+    async def test_stats_track_running_queued_and_waiting_calls(self) -> None:
+        running = asyncio.create_task(self.executor.run(self._block))
+        await asyncio.to_thread(self.started.wait, 5)
+        queued = asyncio.create_task(self.executor.run(str, 1))
+        waiting = asyncio.create_task(self.executor.run(str, 2))
+        await asyncio.sleep(0.01)
+
+        busy = self.executor.stats()
+        self.release.set()
+        results = await asyncio.gather(running, queued, waiting)
+        idle = self.executor.stats()
+
+        self.assertEqual((busy.running, busy.queued, busy.waiting), (1, 1, 1))
+        self.assertEqual(results, ["done", "1", "2"])
+        self.assertEqual((idle.running, idle.queued, idle.waiting), (0, 0, 0))
+        self.assertEqual((idle.peak_queued, idle.completed), (1, 3))
+
+    async def test_cancelled_calls_leave_the_queue(self) -> None:
+        running = asyncio.create_task(self.executor.run(self._block))
+        await asyncio.to_thread(self.started.wait, 5)
+        queued = asyncio.create_task(self.executor.run(str, 1))
+        await asyncio.sleep(0.01)
+
+        queued.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await queued
+        self.release.set()
+        await running
+
+        self.assertEqual(self.executor.stats().queued, 0)
+        self.assertEqual(self.executor.stats().completed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
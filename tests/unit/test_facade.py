@@ -4,7 +4,7 @@ import unittest
 from unittest.mock import Mock
 
 from template.app.facade import AppFacade
-from template.core.application.dtos.dto import CreateItemDTO, ItemResponseDTO
+from template.core.application.dtos.dto import CreateItemDTO, ItemResponseDTO, ItemStatsQuery
 
 
 class FacadeTestCase(unittest.TestCase):
@@ -25,3 +25,27 @@ class FacadeTestCase(unittest.TestCase):
         service.create_item.assert_called_once_with(CreateItemDTO(name="demo", value=10.0))
         service.get_item.assert_called_once_with("item-1")
         service.list_items.assert_called_once_with()
+
+    def test_facade_batch_methods_delegate_to_service(self) -> None:
+        service = Mock()
+        service.create_items.return_value = [ItemResponseDTO(id="item-1", name="demo", value=1.0)]
+        service.get_items.return_value = [ItemResponseDTO(id="item-1", name="demo", value=1.0)]
+        facade = AppFacade(service)
+
+        created = facade.create_items([("demo", 1.0)])
+        fetched = facade.get_items(["item-1"])
+
+        self.assertEqual(created[0].id, "item-1")
+        self.assertEqual(fetched[0].name, "demo")
+        service.create_items.assert_called_once_with([CreateItemDTO(name="demo", value=1.0)])
+        service.get_items.assert_called_once_with(["item-1"])
+
+    def test_facade_item_stats_builds_query(self) -> None:
+        service = Mock()
+        facade = AppFacade(service)
+
+        facade.item_stats([25, 75], group_prefix=3)
+
+        service.item_stats.assert_called_once_with(
+            ItemStatsQuery(percentiles=(25, 75), bins=10, group_prefix=3)
+        )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from template.core.domain.services.ids import (
+    UuidV7Generator,
+    canonical_uuid_bytes,
+    create_id_strategy,
+    uuid4_id,
+    uuid7_bound,
+    uuid7_timestamp_ms,
+)
+from template.core.domain.services.service import ItemDomainService
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class FakeClock:
+    def __init__(self, ms: int) -> None:
+        self.ms = ms
+
+    def __call__(self) -> int:
+        return self.ms * 1_000_000
+
+
+class UuidV7GeneratorTestCase(unittest.TestCase):
+    def test_ids_are_canonical_version_7_uuids_carrying_the_timestamp(self) -> None:
+        item_id = UuidV7Generator(clock=FakeClock(1_700_000_000_123))()
+
+        parsed = UUID(item_id)
+        self.assertEqual(str(parsed), item_id)
+        self.assertEqual((parsed.version, parsed.variant), (7, "specified in RFC 4122"))
+        self.assertEqual(uuid7_timestamp_ms(item_id), 1_700_000_000_123)
+        self.assertIsNone(uuid7_timestamp_ms(uuid4_id()))
+
+    def test_ids_increase_within_a_millisecond_and_when_the_clock_steps_back(self) -> None:
+        clock = FakeClock(5_000)
+        generate = UuidV7Generator(clock=clock)
+
+        ids = [generate() for _ in range(5000)]
+        clock.ms = 4_000
+        ids.append(generate())
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+        # 5000 ids do not fit one 12-bit counter, so the timestamp field moved ahead.
+        self.assertGreater(uuid7_timestamp_ms(ids[-1]), 5_000)  # type: ignore[arg-type]
+
+    def test_concurrent_callers_get_unique_ids(self) -> None:
+        generate = UuidV7Generator()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            batches = list(pool.map(lambda _: [generate() for _ in range(2000)], range(8)))
+
+        ids = [item_id for batch in batches for item_id in batch]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(batch == sorted(batch) for batch in batches))
+
+    def test_bound_separates_ids_by_creation_time(self) -> None:
+        clock = FakeClock(10_000)
+        generate = UuidV7Generator(clock=clock)
+        before = generate()
+        clock.ms = 10_001
+        after = generate()
+
+        self.assertLess(before, uuid7_bound(10_001))
+        self.assertLessEqual(uuid7_bound(10_001), after)
+
+
+class CanonicalUuidBytesTestCase(unittest.TestCase):
+    def test_only_canonical_lowercase_uuids_are_packed(self) -> None:
+        item_id = uuid4_id()
+
+        self.assertEqual(canonical_uuid_bytes(item_id), UUID(item_id).bytes)
+        for other in (
+            item_id.upper(),
+            item_id.replace("-", ""),
+            "{" + item_id + "}",
+            item_id[:35] + "g",
+            item_id[:34] + " a",
+            "fixed-id",
+        ):
+            with self.subTest(item_id=other):
+                self.assertIsNone(canonical_uuid_bytes(other))
+
+
+class IdStrategyTestCase(unittest.TestCase):
+    def test_unknown_strategy_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            create_id_strategy("serial")
+
+    def test_domain_service_uses_the_injected_strategy(self) -> None:
+        item = ItemDomainService(lambda: "fixed-id").create("demo", 1)
+
+        self.assertEqual(item.id, "fixed-id")
+
+    def test_container_creates_uuid7_ids_by_default(self) -> None:
+        facade = ContainerFactory(Settings(repository_type="memory")).create_facade()
+
+        first = facade.create_item("first", 1.0)
+        second = facade.create_items([("second", 2.0)])[0]
+
+        self.assertEqual(UUID(first.id).version, 7)
+        self.assertLess(first.id, second.id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from template.app.adapters.input.rest.ingest import BatchIngest, ingest_body
+from template.core.domain.entities.model import NON_NUMERIC_ERROR
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+
+
+class _CountingFacade:
+    def __init__(self) -> None:
+        self.facade = ContainerFactory(Settings(repository_type="memory")).create_facade()
+        self.calls: list[int] = []
+
+    def ingest_items(self, items: list[tuple[str, float]]) -> object:
+        self.calls.append(len(items))
+        return self.facade.ingest_items(items)
+
+
+class BatchIngestTestCase(unittest.TestCase):
+    def test_rows_are_saved_one_chunk_at_a_time(self) -> None:
+        facade = _CountingFacade()
+        body = json.dumps([{"name": f"item-{index}", "value": index} for index in range(5)])
+
+        ingest = ingest_body(facade, body.encode(), chunk_rows=2)  # type: ignore[arg-type]
+        status, payload, media_type = ingest.response()
+
+        self.assertEqual((status, media_type), (201, "application/json"))
+        self.assertEqual(facade.calls, [2, 2, 1])
+        self.assertEqual([row["row"] for row in json.loads(payload)], [0, 1, 2, 3, 4])
+        self.assertEqual(
+            [item.name for item in facade.facade.list_items()],
+            [f"item-{index}" for index in range(5)],
+        )
+
+    def test_rejected_rows_keep_their_place_among_created_ones(self) -> None:
+        facade = _CountingFacade()
+        ingest = BatchIngest(chunk_rows=2)
+        chunks = ingest.feed(b'{"name": "a", "value": 1}\n[1]\n{"name": "c"}\n')
+        chunks += ingest.feed(b'{"name": "d", "value": "nan"}\n{"name": 4, "value": 4}\n')
+        chunks += ingest.feed(b'{"name": "f", "value": 5}\n')
+        for chunk in chunks + ingest.close():
+            ingest.record(chunk, facade.ingest_items(chunk.items))
+
+        status, payload, media_type = ingest.response()
+        results = [json.loads(line) for line in payload.splitlines()]
+
+        self.assertEqual((status, media_type, ingest.rejected), (207, "application/x-ndjson", 4))
+        self.assertEqual(
+            [result.get("name", result.get("detail")) for result in results],
+            [
+                "a",
+                "Row must be a JSON object.",
+                "Missing field: value",
+                "Item value must be finite.",
+                "Field 'name' must be a string.",
+                "f",
+            ],
+        )
+        self.assertEqual(facade.calls, [2, 1])
+
+    def test_an_integer_too_large_for_a_float_rejects_only_its_row(self) -> None:
+        facade = _CountingFacade()
+        body = b'[{"name": "a", "value": 1}, {"name": "b", "value": 1' + b"0" * 400 + b"}]"
+
+        status, payload, _ = ingest_body(facade, body).response()  # type: ignore[arg-type]
+
+        self.assertEqual(status, 207)
+        self.assertEqual(json.loads(payload)[1], {"row": 1, "detail": NON_NUMERIC_ERROR})
+        self.assertEqual([item.name for item in facade.facade.list_items()], ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
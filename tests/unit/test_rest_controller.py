@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from collections.abc import AsyncIterator
+
+from template.app.adapters.input.rest.controller import (
+    PERCENTILES_ERROR,
+    HTTPException,
+    RestController,
+)
+from template.app.facade import AppFacade
+from template.core.application.dtos.dto import ItemResponseDTO
+from template.core.domain.exceptions.exception import ItemNotFoundError
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+
+
+class _AsyncFacade:
+    async def get_item(self, item_id: str) -> ItemResponseDTO:
+        if item_id != "known":
+            raise ItemNotFoundError(item_id)
+        return ItemResponseDTO(id=item_id, name=threading.current_thread().name, value=1.0)
+
+
+class _Request:
+    def __init__(self, *pieces: bytes) -> None:
+        self.pieces = pieces
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        for piece in self.pieces:
+            yield piece
+
+
+class RestControllerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.executor = BoundedExecutor(2, thread_name_prefix="rest-test")
+        self.facade: AppFacade = ContainerFactory(
+            Settings(repository_type="memory")
+        ).create_facade()
+        self.controller = RestController(self.facade, executor=self.executor)
+
+    async def asyncTearDown(self) -> None:
+        self.executor.shutdown()
+
+    async def test_sync_facade_calls_run_on_the_executor(self) -> None:
+        created = await self.controller.create_items(_Request(b'[{"name": "a", "value": 1}]'))
+        fetched = await self.controller.get_item(json.loads(created.body)[0]["id"])
+        stats = json.loads((await self.controller.executor_stats()).body)
+
+        self.assertEqual(json.loads(fetched.body)["name"], "a")
+        self.assertEqual((stats["completed"], stats["queued"], stats["max_workers"]), (2, 0, 2))
+
+    async def test_ndjson_is_streamed_from_the_executor(self) -> None:
+        self.facade.create_items([("a", 1.0), ("b", 2.0)])
+
+        response = await self.controller.list_items(format="ndjson")
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+        self.assertEqual([json.loads(line)["name"] for line in body.splitlines()], ["a", "b"])
+
+    async def test_async_facade_is_awaited_on_the_event_loop(self) -> None:
+        controller = RestController(_AsyncFacade(), executor=self.executor)  # type: ignore[arg-type]
+
+        fetched = json.loads((await controller.get_item("known")).body)
+        with self.assertRaises(HTTPException) as missing:
+            await controller.get_item("unknown")
+
+        self.assertEqual(fetched["name"], threading.current_thread().name)
+        self.assertEqual(missing.exception.status_code, 404)
+        self.assertEqual(self.executor.stats().completed, 0)
+
+    async def test_async_facade_streams_ndjson_without_the_executor(self) -> None:
+        facade = ContainerFactory(Settings(repository_type="memory")).create_async_facade()
+        controller = RestController(facade, executor=self.executor)
+        await facade.create_items([("a", 1.0), ("b", 2.0)])
+
+        response = await controller.list_items(format="ndjson")
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+        self.assertEqual([json.loads(line)["name"] for line in body.splitlines()], ["a", "b"])
+        self.assertEqual(self.executor.stats().completed, 0)
+
+    async def test_batch_body_is_ingested_as_it_arrives(self) -> None:
+        facade = ContainerFactory(Settings(repository_type="memory")).create_async_facade()
+        controller = RestController(facade, executor=self.executor)
+
+        response = await controller.create_items(
+            _Request(b'[{"name": "a", "val', b'ue": 1}, {"name": "b", "value": "x"}', b"]")
+        )
+        results = json.loads(response.body)
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([item.name for item in await facade.list_items()], ["a"])
+        self.assertEqual(results[0]["name"], "a")
+        self.assertEqual(results[1], {"row": 1, "detail": "Item value must be numeric."})
+        self.assertEqual(self.executor.stats().completed, 0)
+
+    async def test_malformed_items_are_answered_with_400(self) -> None:
+        for payload, detail in (
+            ({"name": "a"}, "Missing field: value"),
+            ({"name": "a", "value": "x"}, "Field 'value' must be a number."),
+            ({"name": "a", "value": None}, "Field 'value' must be a number."),
+        ):
+            with self.subTest(payload=payload), self.assertRaises(HTTPException) as raised:
+                await self.controller.create_item(payload)
+            self.assertEqual((raised.exception.status_code, raised.exception.detail), (400, detail))
+
+    async def test_malformed_percentiles_are_answered_with_400(self) -> None:
+        with self.assertRaises(HTTPException) as raised:
+            await self.controller.item_stats(percentiles="50,abc")
+
+        self.assertEqual(
+            (raised.exception.status_code, raised.exception.detail), (400, PERCENTILES_ERROR)
+        )
+        self.assertEqual(self.executor.stats().completed, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import unittest
+from dataclasses import asdict, dataclass
+from unittest.mock import Mock, patch
+
+from template.app.adapters.input.rest.controller import NEXT_CURSOR_HEADER, RestController
+from template.app.facade import AppFacade
+from template.core.application.dtos.dto import HistogramBinDTO, ItemResponseDTO, ItemStatsDTO
+from template.core.domain.entities.model import Item
+from template.infrastructure import serialization
+from template.infrastructure.config.settings import Settings
+from template.infrastructure.container import ContainerFactory
+from template.infrastructure.executor import BoundedExecutor
+from template.infrastructure.serialization import (
+    JSON_BACKENDS,
+    JsonRowParser,
+    MalformedRow,
+    dumps,
+    encoder_for,
+    iter_json_array,
+    iter_ndjson,
+)
+
+
+class SerializationTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.items = [
+            ItemResponseDTO(id=f"item-{index}", name="demo", value=float(index))
+            for index in range(5)
+        ]
+
+    def test_json_array_stream_matches_json_dumps(self) -> None:
+        for chunk_items in (1, 2, 100):
+            with (
+                self.subTest(chunk_items=chunk_items),
+                patch.object(serialization, "JSON_BACKEND", "stdlib"),
+            ):
+                streamed = b"".join(iter_json_array(self.items, chunk_items=chunk_items))
+                expected = json.dumps([asdict(item) for item in self.items], ensure_ascii=True)
+                self.assertEqual(streamed.decode(), expected)
+
+    def test_json_array_stream_matches_dumps_for_every_backend(self) -> None:
+        for backend in JSON_BACKENDS:
+            with (
+                self.subTest(backend=backend),
+                patch.object(serialization, "JSON_BACKEND", backend),
+            ):
+                streamed = b"".join(iter_json_array(self.items, chunk_items=2))
+                self.assertEqual(streamed, dumps(self.items))
+
+    def test_json_array_stream_of_nothing_is_empty_array(self) -> None:
+        self.assertEqual(b"".join(iter_json_array([])), b"[]")
+
+    def test_ndjson_stream_yields_bounded_chunks(self) -> None:
+        chunks = list(iter_ndjson(self.items, chunk_items=2))
+
+        self.assertEqual(len(chunks), 3)
+        lines = b"".join(chunks).splitlines()
+        self.assertEqual(
+            [json.loads(line)["id"] for line in lines], [item.id for item in self.items]
+        )
+
+
+def _parse(body: bytes, piece_bytes: int) -> tuple[list[object], str | None]:
+    parser = JsonRowParser()
+    rows: list[object] = []
+    for offset in range(0, len(body), piece_bytes):
+        rows += parser.feed(body[offset : offset + piece_bytes])
+    return rows + parser.close(), parser.framing
+
+
+class JsonRowParserTestCase(unittest.TestCase):
+    def test_rows_are_the_same_however_the_body_is_split(self) -> None:
+        array = json.dumps([{"name": "caf\u00e9", "value": 1.5}, 12, [], {"value": -3}]).encode()
+        ndjson = b'{"name": "a", "value": 1}\r\n\n  7\n{"name": "b"}'
+        for piece_bytes in (1, 2, 7, 1024):
+            with self.subTest(piece_bytes=piece_bytes):
+                self.assertEqual(
+                    _parse(b" \n" + array, piece_bytes),
+                    ([{"name": "caf\u00e9", "value": 1.5}, 12, [], {"value": -3}], "array"),
+                )
+                self.assertEqual(
+                    _parse(ndjson, piece_bytes),
+                    ([{"name": "a", "value": 1}, 7, {"name": "b"}], "ndjson"),
+                )
+
+    def test_bad_ndjson_lines_are_reported_and_skipped(self) -> None:
+        rows, _ = _parse(b'{"value": 1}\n{"value":\n{"value": 2}\n', 5)
+
+        self.assertEqual(rows, [{"value": 1}, MalformedRow("Row is not valid JSON."), {"value": 2}])
+
+    def test_a_broken_json_array_ends_with_one_malformed_row(self) -> None:
+        broken = MalformedRow("Request body is not a valid JSON array.")
+        for body, expected in (
+            (b'[{"value": 1} {"value": 2}]', [{"value": 1}, broken]),
+            (b'[{"value": 1},', [{"value": 1}, broken]),
+            (b"[1, 2] 3", [1, 2, MalformedRow("Unexpected data after the JSON array.")]),
+            (b"[\xff]", [MalformedRow("Request body is not valid UTF-8.")]),
+        ):
+            with self.subTest(body=body):
+                self.assertEqual(_parse(body, 3)[0], expected)
+
+    def test_a_cut_off_row_is_not_decoded_again_for_every_piece(self) -> None:
+        parser = JsonRowParser()
+        parser._decoder = Mock(wraps=json.JSONDecoder())
+        body = b'[{"value": 1}, {"name": "' + b"x" * 10_000 + b'"}]'
+
+        rows: list[object] = []
+        for offset in range(len(body)):
+            rows += parser.feed(body[offset : offset + 1])
+
+        self.assertEqual(rows + parser.close(), [{"value": 1}, {"name": "x" * 10_000}])
+        self.assertLess(parser._decoder.raw_decode.call_count, 40)
+
+    def test_a_row_over_the_size_limit_ends_the_json_array(self) -> None:
+        parser = JsonRowParser(max_row_chars=100)
+
+        rows = parser.feed(b'[{"value": 1}, {"name": "' + b"x" * 50)
+        rows += parser.feed(b"x" * 100)
+
+        self.assertEqual(
+            rows + parser.feed(b'"}]') + parser.close(),
+            [{"value": 1}, MalformedRow("Row is not valid JSON or longer than 100 characters.")],
+        )
+
+    def test_an_ndjson_line_over_the_size_limit_is_reported_and_skipped(self) -> None:
+        body = b'{"value": 1}\n{"name": "' + b"x" * 50 + b'"}\n{"value": 2}'
+        for piece_bytes in (1, 7, 1024):
+            parser = JsonRowParser(max_row_chars=20)
+            rows: list[object] = []
+            for offset in range(0, len(body), piece_bytes):
+                rows += parser.feed(body[offset : offset + piece_bytes])
+            with self.subTest(piece_bytes=piece_bytes):
+                self.assertEqual(
+                    rows + parser.close(),
+                    [{"value": 1}, MalformedRow("Row is longer than 20 bytes."), {"value": 2}],
+                )
+
+    def test_an_empty_body_has_no_rows(self) -> None:
+        self.assertEqual(_parse(b" \r\n", 1), ([], None))
+
+
+class DumpsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        group = ItemStatsDTO(1, 2.0, 2.0, 2, 2, {"p50": 2.0}, [])
+        self.payloads: list[object] = [
+            Item(name='café "quoted"\n', value=1e16, id="id-1"),
+            ItemResponseDTO(id="id-2", name="int value", value=3),  # type: ignore[arg-type]
+            [Item(name="a", value=-0.5, id="id-3"), {"detail": "missing"}],
+            ItemStatsDTO(
+                count=3,
+                sum=6.0,
+                mean=None,
+                min=1.0,
+                max=3.0,
+                percentiles={"p50": 2.0},
+                histogram=[HistogramBinDTO(1.0, 3.0, 3)],
+                groups={"ab": group},
+            ),
+            {"items": 1, "flag": True, "none": None, 7: "int key"},
+        ]
+
+    def test_stdlib_backend_matches_json_dumps_over_asdict(self) -> None:
+        with patch.object(serialization, "JSON_BACKEND", "stdlib"):
+            for payload in self.payloads:
+                with self.subTest(payload=payload):
+                    expected = json.dumps(payload, default=asdict, ensure_ascii=True)
+                    self.assertEqual(dumps(payload), expected.encode())
+
+    def test_every_backend_decodes_to_the_same_document(self) -> None:
+        for backend in JSON_BACKENDS:
+            for payload in self.payloads[:4]:
+                with (
+                    self.subTest(backend=backend, payload=payload),
+                    patch.object(serialization, "JSON_BACKEND", backend),
+                ):
+                    expected = json.loads(json.dumps(payload, default=asdict))
+                    self.assertEqual(json.loads(dumps(payload)), expected)
+
+    def test_stdlib_backend_keeps_non_finite_floats_as_json_dumps_does(self) -> None:
+        item = Item(name="odd", value=math.nan, id="id-4")
+
+        with patch.object(serialization, "JSON_BACKEND", "stdlib"):
+            self.assertEqual(dumps(item), json.dumps(asdict(item)).encode())
+
+    def test_encoders_are_generated_once_per_class(self) -> None:
+        self.assertIs(encoder_for(Item), encoder_for(Item))
+        self.assertIsNot(encoder_for(Item), encoder_for(ItemResponseDTO))
+
+    def test_encoders_handle_classes_with_one_field_or_none(self) -> None:
+        @dataclass
+        class Empty:
+            pass
+
+        @dataclass
+        class Single:
+            label: str
+
+        for payload in (Empty(), Single("x"), Single(2)):  # type: ignore[arg-type]
+            with self.subTest(payload=payload):
+                self.assertEqual(encoder_for(type(payload))(payload), json.dumps(asdict(payload)))
+
+
+class RestControllerEncodingTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.facade: AppFacade = ContainerFactory(
+            Settings(repository_type="memory")
+        ).create_facade()
+        self.controller = RestController(self.facade, executor=BoundedExecutor(1))
+        self.addCleanup(self.controller.executor.shutdown)
+
+    def test_responses_carry_pre_encoded_bodies(self) -> None:
+        created = self.facade.create_items([("a", 1.0), ("b", 2.0)])
+
+        first = asyncio.run(self.controller.list_items(limit=1))
+        fetched = asyncio.run(self.controller.get_item(created[0].id))
+
+        self.assertEqual(first.body, dumps(created[:1]))  # type: ignore[union-attr]
+        self.assertEqual(first.headers[NEXT_CURSOR_HEADER], created[0].id)  # type: ignore[union-attr]
+        self.assertEqual(json.loads(fetched.body), asdict(created[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
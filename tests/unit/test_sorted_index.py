@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from template.app.adapters.output.db import index
+from template.app.adapters.output.db.index import SortedIndex
+
+
+class SortedIndexTestCase(unittest.TestCase):
+    def test_ranges_match_a_sorted_list_across_chunk_splits(self) -> None:
+        generator = random.Random(3)
+        keys = generator.sample(range(10 * index._CHUNK_SIZE), 5 * index._CHUNK_SIZE)
+        sorted_index = SortedIndex()
+        for key in keys:
+            sorted_index.add(key)
+        for key in keys[::3]:
+            sorted_index.remove(key)
+        remaining = sorted(set(keys) - set(keys[::3]))
+
+        self.assertEqual(len(sorted_index), len(remaining))
+        self.assertEqual(list(sorted_index.irange()), remaining)
+        for low, high in ((None, 100), (1_000, 1_500), (4_000, None), (7, 7)):
+            with self.subTest(low=low, high=high):
+                expected = [
+                    key
+                    for key in remaining
+                    if (low is None or key >= low) and (high is None or key <= high)
+                ]
+                self.assertEqual(list(sorted_index.irange(low, high)), expected)
+                self.assertEqual(list(sorted_index.irange(low, high, reverse=True)), expected[::-1])
+
+    def test_remove_of_missing_key_raises(self) -> None:
+        sorted_index = SortedIndex()
+        sorted_index.add(1)
+
+        with self.assertRaises(KeyError):
+            sorted_index.remove(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
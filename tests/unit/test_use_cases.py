@@ -1,17 +1,35 @@
 from __future__ import annotations
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from template.core.application.dtos.dto import CreateItemDTO
+from template.app.adapters.output.db.columnar import ColumnarItemRepository
+from template.core.application.dtos.dto import (
+    CompactionReportDTO,
+    CreateItemDTO,
+    ItemQuery,
+    ItemStatsQuery,
+)
 from template.core.application.ports.output.repository_port import ItemRepositoryPort
 from template.core.application.use_cases.use_case import (
+    MAX_PAGE_SIZE,
+    AggregateItemsUseCase,
+    CompactStorageUseCase,
+    CreateItemsUseCase,
     CreateItemUseCase,
+    GetItemsUseCase,
     GetItemUseCase,
+    IngestItemsUseCase,
+    ListItemsPageUseCase,
     ListItemsUseCase,
+    QueryItemsUseCase,
 )
 from template.core.domain.entities.model import Item
-from template.core.domain.exceptions.exception import ItemNotFoundError
+from template.core.domain.exceptions.exception import (
+    InvalidQueryError,
+    ItemNotFoundError,
+    ItemValidationError,
+)
 
 
 class UseCaseTestCase(unittest.TestCase):
@@ -53,3 +71,149 @@ class UseCaseTestCase(unittest.TestCase):
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0].id, "item-1")
         repository.list.assert_called_once_with()
+
+    def test_create_items_use_case_saves_one_batch(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.save_many.side_effect = lambda items: list(items)
+        use_case = CreateItemsUseCase(repository)
+
+        items = use_case.execute(
+            [CreateItemDTO(name="a", value=1.0), CreateItemDTO(name="b", value=2)]
+        )
+
+        self.assertEqual([item.name for item in items], ["a", "b"])
+        repository.save_many.assert_called_once()
+        repository.save.assert_not_called()
+
+    def test_create_items_use_case_validates_before_saving(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        use_case = CreateItemsUseCase(repository)
+
+        with self.assertRaises(ItemValidationError):
+            use_case.execute(
+                [CreateItemDTO(name="a", value=1.0), CreateItemDTO(name=" ", value=2.0)]
+            )
+
+        repository.save_many.assert_not_called()
+
+    def test_ingest_items_use_case_saves_valid_rows_and_reports_the_rest(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.save_many.side_effect = lambda items: list(items)
+        use_case = IngestItemsUseCase(repository)
+
+        batch = use_case.execute(
+            [
+                CreateItemDTO(name="a", value=1.0),
+                CreateItemDTO(name=" ", value=2.0),
+                CreateItemDTO(name="c", value="3"),  # type: ignore[arg-type]
+            ]
+        )
+
+        self.assertEqual(
+            [(item.name, item.value) for item in batch.items], [("a", 1.0), ("c", 3.0)]
+        )
+        self.assertEqual(batch.errors, {1: "Item name must not be empty."})
+        repository.save_many.assert_called_once()
+
+    def test_get_items_use_case(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.get_many.return_value = [Item(name="demo", value=5.5, id="item-1")]
+        use_case = GetItemsUseCase(repository)
+
+        items = use_case.execute(["item-1"])
+
+        self.assertEqual(items[0].id, "item-1")
+        repository.get_many.assert_called_once_with(["item-1"])
+
+    def test_get_items_use_case_raises_for_first_missing_id(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.get_many.return_value = [Item(name="demo", value=5.5, id="item-1")]
+        use_case = GetItemsUseCase(repository)
+
+        with self.assertRaisesRegex(ItemNotFoundError, "missing"):
+            use_case.execute(["item-1", "missing"])
+
+    def test_list_items_page_use_case_returns_cursor_when_more_items_exist(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.list_page.return_value = [
+            Item(name="demo", value=1.0, id=f"item-{index}") for index in range(3)
+        ]
+        use_case = ListItemsPageUseCase(repository)
+
+        items, next_cursor = use_case.execute(limit=2, cursor="item-0")
+
+        self.assertEqual([item.id for item in items], ["item-0", "item-1"])
+        self.assertEqual(next_cursor, "item-1")
+        repository.list_page.assert_called_once_with(3, "item-0")
+
+    def test_list_items_page_use_case_clamps_limit(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.list_page.return_value = []
+        use_case = ListItemsPageUseCase(repository)
+
+        items, next_cursor = use_case.execute(limit=10**9)
+
+        self.assertEqual(items, [])
+        self.assertIsNone(next_cursor)
+        repository.list_page.assert_called_once_with(MAX_PAGE_SIZE + 1, None)
+
+    def test_aggregate_items_use_case_streams_backends_without_native_aggregates(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.iter_items.return_value = iter(
+            [Item(name="a", value=1.0), Item(name="b", value=3.0)]
+        )
+        use_case = AggregateItemsUseCase(repository)
+
+        stats = use_case.execute(ItemStatsQuery(percentiles=(50.0,), bins=1))
+
+        self.assertEqual((stats.count, stats.mean, stats.percentiles), (2, 2.0, {"p50": 2.0}))
+        repository.iter_items.assert_called_once_with()
+
+    def test_aggregate_items_use_case_prefers_native_aggregates(self) -> None:
+        repository = ColumnarItemRepository()
+        repository.save_many([Item(name="a", value=1.0), Item(name="b", value=3.0)])
+
+        with patch.object(repository, "iter_items") as iter_items:
+            stats = AggregateItemsUseCase(repository).execute(ItemStatsQuery())
+
+        self.assertEqual(stats.sum, 4.0)
+        iter_items.assert_not_called()
+
+    def test_aggregate_items_use_case_rejects_invalid_queries(self) -> None:
+        use_case = AggregateItemsUseCase(MagicMock(spec=ItemRepositoryPort))
+
+        for query in (
+            ItemStatsQuery(bins=0),
+            ItemStatsQuery(percentiles=(101.0,)),
+            ItemStatsQuery(group_prefix=0),
+        ):
+            with self.subTest(query=query), self.assertRaises(InvalidQueryError):
+                use_case.execute(query)
+
+    def test_compact_storage_use_case_delegates_to_compacting_backends(self) -> None:
+        report = CompactionReportDTO(items=1, bytes_before=20, bytes_after=10, seconds=0.1)
+        repository = MagicMock(spec=[*dir(ItemRepositoryPort), "compact"])
+        repository.compact.return_value = report
+
+        self.assertIs(CompactStorageUseCase(repository).execute(), report)
+        self.assertIsNone(CompactStorageUseCase(MagicMock(spec=ItemRepositoryPort)).execute())
+
+    def test_query_items_use_case_fetches_one_extra_row_for_the_cursor(self) -> None:
+        repository = MagicMock(spec=ItemRepositoryPort)
+        repository.query.return_value = [
+            Item(name="demo", value=float(index), id=f"item-{index}") for index in range(3)
+        ]
+        use_case = QueryItemsUseCase(repository)
+
+        items, next_cursor = use_case.execute(ItemQuery(name="demo", sort="value", limit=2))
+
+        self.assertEqual([item.id for item in items], ["item-0", "item-1"])
+        self.assertEqual(next_cursor, "item-1")
+        repository.query.assert_called_once_with(ItemQuery(name="demo", sort="value", limit=3))
+
+    def test_query_items_use_case_rejects_invalid_queries(self) -> None:
+        use_case = QueryItemsUseCase(MagicMock(spec=ItemRepositoryPort))
+
+        for query in (ItemQuery(sort="id"), ItemQuery(min_value=2.0, max_value=1.0)):
+            with self.subTest(query=query), self.assertRaises(InvalidQueryError):
+                use_case.execute(query)